@@ -1,15 +1,14 @@
 import os
 import re
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
 from typing import Any, Dict, Optional, Tuple, List, TypedDict
 from config.name_map import ELEMENT_NAME_MAP, ACTIVE_SKILL_STATUS_EFFECT_MAP
-from utils.english_text_utils import EnglishText, clean_english_text
-from utils.json_datatable_utils import extract_datatable_rows
+from utils.english_text_utils import EnglishText, clean_english_text, get_english_text
+from utils.datastore_utils import get_datastore
 
 #Paths
 waza_input_file = os.path.join(constants.INPUT_DIRECTORY, "Waza", "DT_WazaDataTable.json")
@@ -20,7 +19,6 @@ en_description_file = constants.EN_SKILL_DESC_FILE
 
 _CHARACTERNAME_TAG_RE = re.compile(r"<characterName\s+id=\|([^|]+)\|/?>", re.IGNORECASE)
 
-_CACHED_WAZA_ROWS: Optional[Dict[str, Dict[str, Any]]] = None
 _CACHED_SKILL_IDS_WITH_SKILLCARDS: Optional[set[str]] = None
 
 class ActiveSkillInfoboxModel(TypedDict, total=False):
@@ -48,11 +46,6 @@ def _replace_charactername_tags(text: str, english: EnglishText) -> str:
     return _CHARACTERNAME_TAG_RE.sub(repl, s)
 
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def _trim(v: Any) -> str:
     return str(v or "").strip()
 
@@ -87,15 +80,11 @@ def _load_skill_ids_with_skillcards() -> set[str]:
     if _CACHED_SKILL_IDS_WITH_SKILLCARDS is not None:
         return _CACHED_SKILL_IDS_WITH_SKILLCARDS
 
-    data = _load_json(item_input_file)
-    rows = extract_datatable_rows(data, source=os.path.basename(item_input_file)) or {}
+    rows = get_datastore().get_records(item_input_file, ("bLegalInGame", "WazaID"))
 
     skill_ids: set[str] = set()
 
     for row_name, row in rows.items():
-        if not isinstance(row, dict):
-            continue
-
         if not str(row_name).startswith("SkillCard_"):
             continue
 
@@ -157,8 +146,7 @@ def _normalize_english_key(s: str) -> str:
 
 
 def _build_english_name_to_id_map(english: EnglishText) -> Dict[str, str]:
-    raw = _load_json(en_name_file)
-    rows = extract_datatable_rows(raw, source=os.path.basename(en_name_file)) or {}
+    rows = get_datastore().get_rows(en_name_file)
 
     mapping: Dict[str, str] = {}
     prefixes = ["ACTION_SKILL_", "COOP_", "ACTIVE_"]
@@ -184,13 +172,7 @@ def _build_english_name_to_id_map(english: EnglishText) -> Dict[str, str]:
 
 
 def _load_waza_rows() -> Dict[str, Dict[str, Any]]:
-    global _CACHED_WAZA_ROWS
-    if _CACHED_WAZA_ROWS is not None:
-        return _CACHED_WAZA_ROWS
-
-    data = _load_json(waza_input_file)
-    _CACHED_WAZA_ROWS = extract_datatable_rows(data, source=os.path.basename(waza_input_file)) or {}
-    return _CACHED_WAZA_ROWS
+    return get_datastore().get_rows(waza_input_file)
 
 
 def _find_waza_row_for_skill_id(waza_rows: Dict[str, Dict[str, Any]], skill_id: str) -> Optional[Dict[str, Any]]:
@@ -210,7 +192,7 @@ def _find_waza_row_for_skill_id(waza_rows: Dict[str, Dict[str, Any]], skill_id:
 
 
 def resolve_active_skill_id_from_name(english_skill_name: str, english: Optional[EnglishText] = None) -> str:
-    english = english or EnglishText()
+    english = english or get_english_text()
     name_to_id = _build_english_name_to_id_map(english)
     key = _normalize_english_key(english_skill_name)
     return name_to_id.get(key, "")
@@ -273,14 +255,14 @@ def _build_active_skill_infobox_model_from_skill_id(
 
 def build_active_skill_infobox_model_by_id(skill_id: str) -> ActiveSkillInfoboxModel:
     """Builder entry-point: Given an internal skill_id, return the canonical infobox model."""
-    english = EnglishText()
+    english = get_english_text()
     waza_rows = _load_waza_rows()
     fruit_ids = _load_skill_ids_with_skillcards()
     return _build_active_skill_infobox_model_from_skill_id(skill_id, english=english, waza_rows=waza_rows, fruit_ids=fruit_ids)
 
 
 def build_active_skill_infobox_model_from_name(english_skill_name: str) -> ActiveSkillInfoboxModel:
-    english = EnglishText()
+    english = get_english_text()
     skill_id = resolve_active_skill_id_from_name(english_skill_name, english=english)
     if not skill_id:
         return {}
@@ -297,7 +279,7 @@ def build_active_skill_infobox_model_from_name(english_skill_name: str) -> Activ
 
 
 def build_all_active_skill_infobox_models() -> List[Tuple[str, ActiveSkillInfoboxModel]]:
-    english = EnglishText()
+    english = get_english_text()
     waza_rows = _load_waza_rows()
     fruit_ids = _load_skill_ids_with_skillcards()
 
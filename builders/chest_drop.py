@@ -1,15 +1,14 @@
 import os
 import re
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, DefaultDict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, TypedDict, DefaultDict
 from collections import defaultdict
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
 
 #Paths
 item_lottery_input_file = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemLotteryDataTable.json")
@@ -41,6 +40,7 @@ _ENEMY_CAMP_NAME_RE = re.compile(
     r"(?P<tier>01|02)?"
     r"(?P<hi>_02)?$"
 )
+_OILRIG_NAME_RE = re.compile(r"^Oilrig_(?P<size>[A-Za-z]+)")
 
 class ItemLotteryRow(TypedDict, total=False):
     FieldName: str
@@ -71,10 +71,6 @@ class ChestDropGroup(TypedDict, total=False):
     location: str
     entries: List[ChestDropEntry]
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def _trim(v: Any) -> str:
     return str(v or "").strip()
 
@@ -131,6 +127,29 @@ def build_enemy_base_location(field_name: str, grade_number: str) -> str:
     prefix = "High Level " if is_level_60_plus else ""
     return f"{prefix}{faction} Enemy Base ({chest_kind}: Grade {grade_number})"
 
+def build_dungeon_location(chest_name: str, grade_number: str) -> str:
+    # chest_name as built by build_dungeon_chest_drop_groups: "<ItemFieldLotteryName>:<Type>"
+    field_name, _, chest_type = (chest_name or "").partition(":")
+    if not field_name.startswith("Dungeon_") or not chest_type:
+        return ""
+    return f"Dungeon ({chest_type} Chest: Grade {grade_number})"
+
+def build_oilrig_location(field_name: str, grade_number: str) -> str:
+    m = _OILRIG_NAME_RE.match(field_name or "")
+    if not m:
+        return ""
+    return f"Oil Rig ({m.group('size')} Chest: Grade {grade_number})"
+
+def build_chest_location(chest_name: str, grade_number: str) -> str:
+    """
+    Readable location for a chest as named by the chest drop builders, or "" if it has none.
+    """
+    return (
+        build_enemy_base_location(chest_name, grade_number)
+        or build_dungeon_location(chest_name, grade_number)
+        or build_oilrig_location(chest_name, grade_number)
+    )
+
 def _get_item_display_name(en: EnglishText, static_item_id: Any) -> str:
     internal = _trim(static_item_id)
     if not internal:
@@ -142,23 +161,16 @@ def _get_item_display_name(en: EnglishText, static_item_id: Any) -> str:
     name = en.get_item_name(internal)
     return name or internal
 
-def _load_item_lottery_rows(*, input_path: str) -> Dict[str, ItemLotteryRow]:
-    raw = _load_json(input_path)
-    rows = extract_datatable_rows(raw, source=os.path.basename(input_path)) or {}
-    out: Dict[str, ItemLotteryRow] = {}
-    for row_id, row in rows.items():
+def _iter_item_lottery_rows(*, input_path: str) -> Iterator[ItemLotteryRow]:
+    # The lottery table is large; stream it and let callers keep only the rows they group.
+    for _, row in get_datastore().iter_rows(input_path):
         if isinstance(row, dict):
-            out[str(row_id)] = row  # type: ignore[assignment]
-    return out
+            yield row  # type: ignore[misc]
 
-def _load_dungeon_item_lottery_rows(*, input_path: str) -> Dict[str, DungeonItemLotteryRow]:
-    raw = _load_json(input_path)
-    rows = extract_datatable_rows(raw, source=os.path.basename(input_path)) or {}
-    out: Dict[str, DungeonItemLotteryRow] = {}
-    for row_id, row in rows.items():
+def _iter_dungeon_item_lottery_rows(*, input_path: str) -> Iterator[DungeonItemLotteryRow]:
+    for _, row in get_datastore().iter_rows(input_path):
         if isinstance(row, dict):
-            out[str(row_id)] = row  # type: ignore[assignment]
-    return out
+            yield row  # type: ignore[misc]
 
 def _build_group(
     *,
@@ -211,12 +223,10 @@ def build_enemy_base_chest_drop_groups(
     *,
     input_path: str = item_lottery_input_file,
 ) -> List[ChestDropGroup]:
-    en = EnglishText()
-    rows_by_id = _load_item_lottery_rows(input_path=input_path)
-
+    en = get_english_text()
     grouped: DefaultDict[Tuple[str, str], List[ItemLotteryRow]] = defaultdict(list)
 
-    for _, row in rows_by_id.items():
+    for row in _iter_item_lottery_rows(input_path=input_path):
         field_name = _trim(row.get("FieldName"))
         if not field_name.startswith("EnemyCamp_"):
             continue
@@ -251,12 +261,10 @@ def build_oilrig_chest_drop_groups(
     *,
     input_path: str = item_lottery_input_file,
 ) -> List[ChestDropGroup]:
-    en = EnglishText()
-    rows_by_id = _load_item_lottery_rows(input_path=input_path)
-
+    en = get_english_text()
     grouped: DefaultDict[Tuple[str, str], List[ItemLotteryRow]] = defaultdict(list)
 
-    for _, row in rows_by_id.items():
+    for row in _iter_item_lottery_rows(input_path=input_path):
         field_name = _trim(row.get("FieldName"))
         if not field_name.startswith("Oilrig_"):
             continue
@@ -290,19 +298,10 @@ def build_dungeon_chest_drop_groups(
     dungeon_input_path: str = dungeon_item_lottery_input_file,
     item_lottery_path: str = item_lottery_input_file,
 ) -> List[ChestDropGroup]:
-    en = EnglishText()
-
-    dungeon_rows_by_id = _load_dungeon_item_lottery_rows(input_path=dungeon_input_path)
-    item_rows_by_id = _load_item_lottery_rows(input_path=item_lottery_path)
-
-    item_rows_by_field: DefaultDict[str, List[ItemLotteryRow]] = defaultdict(list)
-    for _, r in item_rows_by_id.items():
-        field_name = _trim(r.get("FieldName"))
-        if field_name:
-            item_rows_by_field[field_name].append(r)
+    en = get_english_text()
 
     chest_to_item_field: Dict[str, str] = {}
-    for _, dr in dungeon_rows_by_id.items():
+    for dr in _iter_dungeon_item_lottery_rows(input_path=dungeon_input_path):
         spawn_area = _trim(dr.get("SpawnAreaId"))
         if spawn_area.startswith("TestDebug"):
             continue
@@ -318,6 +317,14 @@ def build_dungeon_chest_drop_groups(
         chest_name = f"{item_field}:{type_leaf}"
         chest_to_item_field[chest_name] = item_field
 
+    # Only the lottery fields referenced by a dungeon chest are kept from the streamed item table.
+    wanted_fields: Set[str] = set(chest_to_item_field.values())
+    item_rows_by_field: DefaultDict[str, List[ItemLotteryRow]] = defaultdict(list)
+    for r in _iter_item_lottery_rows(input_path=item_lottery_path):
+        field_name = _trim(r.get("FieldName"))
+        if field_name in wanted_fields:
+            item_rows_by_field[field_name].append(r)
+
     grouped: DefaultDict[Tuple[str, str], List[ItemLotteryRow]] = defaultdict(list)
 
     for chest_name, item_field in chest_to_item_field.items():
@@ -0,0 +1,179 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from typing import Dict, List, Optional, Tuple, TypedDict
+from builders.chest_drop import ChestDropEntry, ChestDropGroup, build_all_chest_drop_export_models
+from builders.chest_slot_chance import build_chest_slot_chance_models
+
+
+class ChestLootRate(TypedDict, total=False):
+    item_name: str
+    probability: float          # chance the chest contains at least one, 0..1
+    expected_quantity: float    # mean amount per chest opened
+    min_quantity: int           # smallest non-zero amount a single chest can give
+    max_quantity: int           # largest amount a single chest can give
+
+class ChestLootRateGroup(TypedDict, total=False):
+    chest_name: str
+    grade_number: str
+    location: str
+    items: List[ChestLootRate]
+
+
+def field_name_for_chest(chest_name: str) -> str:
+    # Dungeon chests are named "<ItemFieldLotteryName>:<Type>"; slot chances are keyed by the field.
+    return (chest_name or "").split(":", 1)[0]
+
+def _convolve(a: List[float], b: List[float]) -> List[float]:
+    out = [0.0] * (len(a) + len(b) - 1)
+    for i, pa in enumerate(a):
+        if pa == 0.0:
+            continue
+        for j, pb in enumerate(b):
+            out[i + j] += pa * pb
+    return out
+
+class ChestLootTable:
+    """
+    Loot math for one chest grade: slot probability x in-slot weight share x quantity range.
+
+    Each slot rolls independently with its ItemSlotN_ProbabilityPercent; a rolled slot picks one row
+    with probability WeightInSlot / (sum of weights in that slot) and gives a uniform integer amount in
+    [MinNum, MaxNum]. Per item that makes each slot a small distribution over amounts, and the
+    chest-level distribution is their convolution across slots, so the probability and expected
+    quantity are exact (no sampling).
+    """
+
+    def __init__(self, group: ChestDropGroup, slot_chances: Dict[str, float]) -> None:
+        self.group = group
+
+        by_slot: Dict[int, List[ChestDropEntry]] = {}
+        for e in group.get("entries") or []:
+            by_slot.setdefault(int(e.get("slot_number") or 0), []).append(e)
+
+        # slot -> (roll probability 0..1, total weight, entries)
+        self.slots: List[Tuple[float, float, List[ChestDropEntry]]] = []
+        for slot in sorted(by_slot):
+            p_slot = max(0.0, min(100.0, float(slot_chances.get(str(slot), 0.0)))) / 100.0
+            total = sum(max(0.0, float(e.get("weight") or 0.0)) for e in by_slot[slot])
+            if p_slot > 0.0 and total > 0.0:
+                self.slots.append((p_slot, total, by_slot[slot]))
+
+        self._item_names: List[str] = []
+        seen = set()
+        for _, _, entries in self.slots:
+            for e in entries:
+                name = str(e.get("item_name") or "")
+                if name and name not in seen:
+                    seen.add(name)
+                    self._item_names.append(name)
+
+    def item_names(self) -> List[str]:
+        return list(self._item_names)
+
+    def quantity_distribution(self, item_name: str) -> List[float]:
+        """
+        P(amount == k) for k = 0..max across one chest opening, as a list indexed by k.
+        """
+        dist = [1.0]
+        for p_slot, total, entries in self.slots:
+            slot_dist = [1.0]
+            for e in entries:
+                if str(e.get("item_name") or "") != item_name:
+                    continue
+                p_row = p_slot * max(0.0, float(e.get("weight") or 0.0)) / total
+                if p_row <= 0.0:
+                    continue
+
+                lo = max(0, int(e.get("min_num") or 0))
+                hi = max(lo, int(e.get("max_num") or 0))
+                if len(slot_dist) <= hi:
+                    slot_dist.extend([0.0] * (hi + 1 - len(slot_dist)))
+
+                slot_dist[0] -= p_row
+                share = p_row / (hi - lo + 1)
+                for k in range(lo, hi + 1):
+                    slot_dist[k] += share
+
+            if len(slot_dist) > 1:
+                dist = _convolve(dist, slot_dist)
+
+        return dist
+
+    def rate_for(self, item_name: str) -> Optional[ChestLootRate]:
+        dist = self.quantity_distribution(item_name)
+        nonzero = [k for k, p in enumerate(dist) if k > 0 and p > 0.0]
+        if not nonzero:
+            return None
+
+        return {
+            "item_name": item_name,
+            "probability": max(0.0, 1.0 - dist[0]),
+            "expected_quantity": sum(k * p for k, p in enumerate(dist)),
+            "min_quantity": nonzero[0],
+            "max_quantity": nonzero[-1],
+        }
+
+    def rates(self) -> List[ChestLootRate]:
+        out: List[ChestLootRate] = []
+        for name in self._item_names:
+            rate = self.rate_for(name)
+            if rate:
+                out.append(rate)
+        out.sort(key=lambda r: (-r.get("probability", 0.0), r.get("item_name", "").casefold()))
+        return out
+
+
+def build_chest_loot_rate_group(group: ChestDropGroup, slot_chances: Dict[str, float]) -> ChestLootRateGroup:
+    return {
+        "chest_name": str(group.get("chest_name") or ""),
+        "grade_number": str(group.get("grade_number") or ""),
+        "location": str(group.get("location") or ""),
+        "items": ChestLootTable(group, slot_chances).rates(),
+    }
+
+def build_chest_loot_rate_groups(
+    groups: List[ChestDropGroup],
+    *,
+    slot_chances_by_field: Dict[str, Dict[str, float]],
+) -> List[ChestLootRateGroup]:
+    """
+    Joins chest drop groups with their FieldName's slot chances. Groups whose field has no row in
+    DT_FieldLotteryNameDataTable are skipped, since their slot probabilities are unknown.
+    """
+    out: List[ChestLootRateGroup] = []
+    for group in groups:
+        slot_chances = slot_chances_by_field.get(field_name_for_chest(str(group.get("chest_name") or "")))
+        if not slot_chances:
+            continue
+        out.append(build_chest_loot_rate_group(group, slot_chances))
+    return out
+
+def build_all_chest_loot_tables() -> Dict[Tuple[str, str], ChestLootTable]:
+    """
+    ChestLootTable per (chest_name, grade_number) for every chest group that has slot chances.
+    """
+    slot_chances_by_field = build_chest_slot_chance_models(chest_only=False)
+
+    out: Dict[Tuple[str, str], ChestLootTable] = {}
+    for groups in build_all_chest_drop_export_models().values():
+        for group in groups:
+            chest_name = str(group.get("chest_name") or "")
+            slot_chances = slot_chances_by_field.get(field_name_for_chest(chest_name))
+            if slot_chances:
+                out[(chest_name, str(group.get("grade_number") or ""))] = ChestLootTable(group, slot_chances)
+    return out
+
+def build_all_chest_loot_rate_export_models() -> Dict[str, List[ChestLootRateGroup]]:
+    """
+    Same files as build_all_chest_drop_export_models, with "_rates" added before the extension.
+    """
+    slot_chances_by_field = build_chest_slot_chance_models(chest_only=False)
+
+    out: Dict[str, List[ChestLootRateGroup]] = {}
+    for filename, groups in build_all_chest_drop_export_models().items():
+        stem, ext = os.path.splitext(filename)
+        out[f"{stem}_rates{ext}"] = build_chest_loot_rate_groups(groups, slot_chances_by_field=slot_chances_by_field)
+    return out
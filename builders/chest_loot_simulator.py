@@ -0,0 +1,173 @@
+import os
+import sys
+import math
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from typing import Dict, List, Optional, Sequence, Tuple, TypedDict
+from builders.chest_loot_rates import ChestLootTable, build_all_chest_loot_tables
+from utils.weighted_lottery_utils import AliasTable
+
+DEFAULT_SEED = 828
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class SimulatedLootRate(TypedDict, total=False):
+    item_name: str
+    analytic_probability: float
+    empirical_probability: float
+    analytic_expected_quantity: float
+    empirical_expected_quantity: float
+
+class ChestsToObtain(TypedDict, total=False):
+    item_name: str
+    quantity: int
+    trials: int
+    mean: float
+    quantiles: Dict[float, int]     # q -> chests opened by which a fraction q of runs had `quantity`
+    analytic_median: Optional[int]  # geometric median, only for quantity == 1
+
+
+class _SlotSampler:
+    """
+    One slot as a single categorical: index 0 is "slot did not roll", index i > 0 is row i - 1.
+    Folding the slot roll into the row pick lets a whole batch be drawn from one alias table.
+    """
+
+    def __init__(self, p_slot: float, total: float, entries: List[dict]) -> None:
+        self.names: List[str] = [str(e.get("item_name") or "") for e in entries]
+        self.ranges: List[Tuple[int, int]] = []
+        weights = [1.0 - p_slot]
+        for e in entries:
+            lo = max(0, int(e.get("min_num") or 0))
+            hi = max(lo, int(e.get("max_num") or 0))
+            self.ranges.append((lo, hi))
+            weights.append(p_slot * max(0.0, float(e.get("weight") or 0.0)) / total)
+
+        self.lottery = AliasTable(weights)
+
+    def sample(self, rng: random.Random, n: int) -> List[int]:
+        return self.lottery.sample_many(rng, n)
+
+
+class ChestLootSimulator:
+    """
+    Seeded Monte Carlo over a ChestLootTable, for checking the analytic rates and for
+    "how many chests to farm X" answers.
+
+    Chest opens are drawn in batches: each slot samples the whole batch at once, then per-item
+    totals are accumulated. The same seed always gives the same results.
+    """
+
+    def __init__(self, table: ChestLootTable, *, seed: int = DEFAULT_SEED) -> None:
+        self.table = table
+        self.seed = seed
+        self.slots = [_SlotSampler(p, total, entries) for p, total, entries in table.slots]
+
+    def simulate_rates(self, opens: int, *, batch_size: int = 100_000) -> List[SimulatedLootRate]:
+        """
+        Open `opens` chests and compare each item's empirical chance / mean amount with the analytic ones.
+        """
+        rng = random.Random(self.seed)
+        names = self.table.item_names()
+        hits: Dict[str, int] = {name: 0 for name in names}
+        amounts: Dict[str, int] = {name: 0 for name in names}
+
+        done = 0
+        while done < opens:
+            n = min(batch_size, opens - done)
+            per_chest: List[Dict[str, int]] = [{} for _ in range(n)]
+
+            for slot in self.slots:
+                randint = rng.randint
+                for chest, pick in zip(per_chest, slot.sample(rng, n)):
+                    if pick:
+                        lo, hi = slot.ranges[pick - 1]
+                        qty = randint(lo, hi) if hi > lo else lo
+                        if qty:
+                            name = slot.names[pick - 1]
+                            chest[name] = chest.get(name, 0) + qty
+
+            for chest in per_chest:
+                for name, qty in chest.items():
+                    hits[name] += 1
+                    amounts[name] += qty
+
+            done += n
+
+        out: List[SimulatedLootRate] = []
+        for rate in self.table.rates():
+            name = rate.get("item_name", "")
+            out.append({
+                "item_name": name,
+                "analytic_probability": rate.get("probability", 0.0),
+                "empirical_probability": hits.get(name, 0) / opens if opens else 0.0,
+                "analytic_expected_quantity": rate.get("expected_quantity", 0.0),
+                "empirical_expected_quantity": amounts.get(name, 0) / opens if opens else 0.0,
+            })
+        return out
+
+    def chests_to_obtain(
+        self,
+        item_name: str,
+        quantity: int = 1,
+        *,
+        trials: int = 10_000,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        max_chests: int = 100_000,
+    ) -> Optional[ChestsToObtain]:
+        """
+        How many chests must be opened to collect `quantity` of an item, over `trials` independent runs.
+
+        Only the item's own per-chest amount distribution matters here, so each chest is one draw from
+        ChestLootTable.quantity_distribution instead of a full slot simulation. Runs that have not
+        finished after max_chests count as max_chests. Returns None if the item never drops.
+        """
+        dist = self.table.quantity_distribution(item_name)
+        if len(dist) < 2 or dist[0] >= 1.0:
+            return None
+
+        rng = random.Random(self.seed)
+        lottery = AliasTable(dist)
+
+        counts: List[int] = []
+        for _ in range(trials):
+            got = 0
+            opened = 0
+            while got < quantity and opened < max_chests:
+                # Draw chests in batches; the unused tail of the last batch is discarded.
+                for amount in lottery.sample_many(rng, 64):
+                    opened += 1
+                    got += amount
+                    if got >= quantity or opened >= max_chests:
+                        break
+            counts.append(opened)
+
+        counts.sort()
+        p_any = 1.0 - dist[0]
+        analytic_median: Optional[int] = None
+        if quantity == 1:
+            analytic_median = 1 if p_any >= 1.0 else math.ceil(math.log(0.5) / math.log(1.0 - p_any))
+
+        return {
+            "item_name": item_name,
+            "quantity": quantity,
+            "trials": trials,
+            "mean": sum(counts) / len(counts),
+            "quantiles": {q: _quantile(counts, q) for q in quantiles},
+            "analytic_median": analytic_median,
+        }
+
+
+def build_chest_loot_simulators(*, seed: int = DEFAULT_SEED) -> Dict[Tuple[str, str], ChestLootSimulator]:
+    """
+    One simulator per (chest_name, grade_number) across the enemy base, dungeon and oilrig chests.
+    """
+    return {key: ChestLootSimulator(table, seed=seed) for key, table in build_all_chest_loot_tables().items()}
+
+def _quantile(sorted_values: List[int], q: float) -> int:
+    if not sorted_values:
+        return 0
+    i = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[i]
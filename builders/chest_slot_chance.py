@@ -1,12 +1,11 @@
 import os
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
 from typing import Any, Dict
-from utils.json_datatable_utils import extract_datatable_rows
+from utils.datastore_utils import get_datastore
 
 #Paths
 field_lottery_input_file = os.path.join(constants.INPUT_DIRECTORY, "Common", "DT_FieldLotteryNameDataTable.json")
@@ -15,10 +14,6 @@ dungeon_item_lottery_input_file = os.path.join(constants.INPUT_DIRECTORY, "Dunge
 
 
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def _to_float(v: Any) -> float:
     try:
         return float(v)
@@ -26,8 +21,7 @@ def _to_float(v: Any) -> float:
         return 0.0
 
 def _load_rows(path: str) -> Dict[str, Any]:
-    raw = _load_json(path)
-    return extract_datatable_rows(raw, source=os.path.basename(path)) or {}
+    return get_datastore().get_rows(path)
 
 def build_chest_related_field_names() -> set[str]:
     allowed: set[str] = set()
@@ -58,8 +52,7 @@ def build_chest_slot_chance_models(
     input_path: str = field_lottery_input_file,
     chest_only: bool = True,
 ) -> Dict[str, Dict[str, float]]:
-    raw = _load_json(input_path)
-    rows = extract_datatable_rows(raw, source=os.path.basename(input_path)) or {}
+    rows = get_datastore().get_rows(input_path)
 
     allowed = build_chest_related_field_names() if chest_only else None
 
@@ -1,15 +1,15 @@
 import os
 import sys
-import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import get_english_text
 from utils.location_utils import (convert_location_to_datamap_xy,  convert_location_to_wiki_coords,  dedupe_strings)
+from utils.spatial_index_utils import SpatialGrid, build_point_index
 
 #Paths
 BOSS_SPAWNER_PATH = os.path.join(constants.INPUT_DIRECTORY, "UI", "DT_BossSpawnerLoactionData.json")
@@ -20,33 +20,16 @@ _BOSS_PREFIX_RE = re.compile(r"^(?:boss_|BOSS_)", re.IGNORECASE)
 
 SpawnPointModel = Dict[str, Any]
 
-def _load_datatable_rows(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+_CACHED_SPAWN_POINT_INDEX: Optional[Tuple[Tuple[Tuple[str, int], ...], SpatialGrid[SpawnPointModel]]] = None
 
-    rows = extract_datatable_rows(raw)
-    if isinstance(rows, dict):
-        return rows
-
-    return {}
+def _iter_datatable_rows(path: str) -> Iterator[Tuple[str, Any]]:
+    return get_datastore().iter_rows(path)
 
 def _load_rows_raw_rows_key(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    if isinstance(raw, list) and raw:
-        first = raw[0]
-        if isinstance(first, dict):
-            rows = first.get("Rows")
-            if isinstance(rows, dict):
-                return rows
-
-    if isinstance(raw, dict):
-        rows = raw.get("Rows")
-        if isinstance(rows, dict):
-            return rows
-
-    return {}
+    try:
+        return get_datastore().get_rows(path)
+    except ValueError:
+        return {}
 
 def _normalize_boss_character_id(character_id: str) -> str:
     s = (character_id or "").strip()
@@ -86,13 +69,12 @@ def _level_to_int(v: Any) -> Optional[int]:
         return None
 
 def build_all_spawn_point_models() -> List[SpawnPointModel]:
-    en = EnglishText()
+    en = get_english_text()
     human_name_map = _load_human_production_name_map()
 
     out: List[SpawnPointModel] = []
 
-    boss_rows = _load_datatable_rows(BOSS_SPAWNER_PATH)
-    for _, row in boss_rows.items():
+    for _, row in _iter_datatable_rows(BOSS_SPAWNER_PATH):
         if not isinstance(row, dict):
             continue
 
@@ -152,8 +134,7 @@ def build_all_spawn_point_models() -> List[SpawnPointModel]:
             }
         )
 
-    paldex_rows = _load_datatable_rows(PALDEX_DISTRIBUTION_PATH)
-    for pal_id, row in paldex_rows.items():
+    for pal_id, row in _iter_datatable_rows(PALDEX_DISTRIBUTION_PATH):
         pal_id_str = str(pal_id or "").strip()
         if pal_id_str == "":
             continue
@@ -225,3 +206,76 @@ def build_all_spawn_point_models() -> List[SpawnPointModel]:
             )
 
     return out
+
+def build_spawn_point_index(models: Optional[List[SpawnPointModel]] = None) -> SpatialGrid[SpawnPointModel]:
+    """
+    Spatial grid over spawn point models by datamap_x / datamap_y.
+    """
+    if models is None:
+        models = build_all_spawn_point_models()
+    return build_point_index(models, x_key="datamap_x", y_key="datamap_y")
+
+def _index_sources() -> List[str]:
+    paths = [
+        BOSS_SPAWNER_PATH,
+        PALDEX_DISTRIBUTION_PATH,
+        constants.EN_HUMAN_NAME_FILE,
+    ]
+    return [p for p in paths if os.path.exists(p)]
+
+def _source_key(paths: List[str]) -> Tuple[Tuple[str, int], ...]:
+    return tuple((p, os.stat(p).st_mtime_ns) for p in paths)
+
+def get_spawn_point_index() -> SpatialGrid[SpawnPointModel]:
+    """
+    Shared spawn point index; rebuilt only when a spawn input file changes on disk.
+    """
+    global _CACHED_SPAWN_POINT_INDEX
+    key = _source_key(_index_sources())
+
+    cached = _CACHED_SPAWN_POINT_INDEX
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    index = build_spawn_point_index()
+    _CACHED_SPAWN_POINT_INDEX = (key, index)
+    return index
+
+def nearest_spawn_point(
+    x: float,
+    y: float,
+    *,
+    variant: Optional[str] = None,
+    name: Optional[str] = None,
+    max_distance: Optional[float] = None,
+    index: Optional[SpatialGrid[SpawnPointModel]] = None,
+) -> Optional[SpawnPointModel]:
+    """
+    Closest spawn point to a datamap coordinate, e.g. the closest "Alpha" (variant) or a given pal (name).
+    """
+    index = index if index is not None else get_spawn_point_index()
+
+    def matches(model: SpawnPointModel) -> bool:
+        if variant is not None and model.get("variant") != variant:
+            return False
+        if name is not None and model.get("name") != name:
+            return False
+        return True
+
+    hit = index.nearest(x, y, where=matches, max_distance=max_distance)
+    return hit[3] if hit else None
+
+def spawn_points_within(
+    x: float,
+    y: float,
+    radius: float,
+    *,
+    index: Optional[SpatialGrid[SpawnPointModel]] = None,
+) -> List[SpawnPointModel]:
+    """
+    Spawn points within radius datamap units of (x, y), closest first.
+    """
+    index = index if index is not None else get_spawn_point_index()
+    hits = index.query_radius(x, y, radius)
+    hits.sort(key=lambda h: (h[0] - x) ** 2 + (h[1] - y) ** 2)
+    return [model for _, _, model in hits]
@@ -1,13 +1,12 @@
 import os
 import sys
-import json
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
 from utils.location_utils import convert_location_to_datamap_xy, dedupe_xy_points
 
 #Paths
@@ -16,21 +15,15 @@ PALDEX_DISTRIBUTION_PATH = os.path.join(constants.INPUT_DIRECTORY, "UI", "DT_Pal
 
 PaldexDistributionMapModel = Dict[str, Any]
 
-def _load_datatable_rows(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    rows = extract_datatable_rows(raw)
-    if isinstance(rows, dict):
-        return rows
-
-    return {}
+def _iter_datatable_rows(path: str) -> Iterator[Tuple[str, Any]]:
+    return get_datastore().iter_rows(path)
 
 def build_paldex_distribution_map_model(
     pal_id: str,
     row: Dict[str, Any],
     *,
     en: EnglishText,
+    dedupe_tolerance: float = 0.0,
 ) -> Optional[PaldexDistributionMapModel]:
     pal_id_l = (pal_id or "").strip().lower()
     if pal_id_l.startswith("boss_") or pal_id_l.startswith("predator_"):
@@ -62,8 +55,8 @@ def build_paldex_distribution_map_model(
         if pt:
             night_pts.append(pt)
 
-    day_pts = dedupe_xy_points(day_pts)
-    night_pts = dedupe_xy_points(night_pts)
+    day_pts = dedupe_xy_points(day_pts, tolerance=dedupe_tolerance)
+    night_pts = dedupe_xy_points(night_pts, tolerance=dedupe_tolerance)
 
     if not day_pts and not night_pts:
         return None
@@ -80,15 +73,18 @@ def build_paldex_distribution_map_model(
         "markers": markers,
     }
 
-def build_all_paldex_distribution_map_models() -> List[Tuple[str, PaldexDistributionMapModel]]:
-    rows = _load_datatable_rows(PALDEX_DISTRIBUTION_PATH)
-    en = EnglishText()
+def build_all_paldex_distribution_map_models(*, dedupe_tolerance: float = 0.0) -> List[Tuple[str, PaldexDistributionMapModel]]:
+    """
+    dedupe_tolerance > 0 also merges markers of the same pal/time that are within that many datamap
+    units of each other (exact duplicates are always merged).
+    """
+    en = get_english_text()
 
     out: List[Tuple[str, PaldexDistributionMapModel]] = []
-    for pal_id, row in rows.items():
+    for pal_id, row in _iter_datatable_rows(PALDEX_DISTRIBUTION_PATH):
         if not isinstance(row, dict):
             continue
-        model = build_paldex_distribution_map_model(str(pal_id), row, en=en)
+        model = build_paldex_distribution_map_model(str(pal_id), row, en=en, dedupe_tolerance=dedupe_tolerance)
         if model:
             out.append((str(pal_id), model))
 
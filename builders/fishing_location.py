@@ -1,14 +1,13 @@
 import os
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
 from typing import Any, Dict, List, Tuple, Optional
 from collections import defaultdict
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
 
 #Paths
 FISHING_INPUT_DIR = os.path.join(constants.INPUT_DIRECTORY, "Fishing")
@@ -19,9 +18,7 @@ FISH_POND_LOTTERY_PATH = os.path.join(FISHING_INPUT_DIR, "DT_PalFishPondLotteryD
 
 
 def load_rows(path: str, *, source: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return extract_datatable_rows(data, source=source)
+    return get_datastore().get_rows(path, source=source)
 
 
 def _safe_float(v: Any) -> float:
@@ -256,7 +253,7 @@ class FishingLocationsModel(dict):
 
 
 def build_all_fishing_location_models() -> Dict[str, Any]:
-    en = EnglishText()
+    en = get_english_text()
 
     fishing_spot_rows = load_rows(
         FISHING_SPOT_LOTTERY_PATH,
@@ -1,15 +1,15 @@
 import os
 import re
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from typing import Any, Dict, Optional, List, Tuple, TypedDict
+from dataclasses import dataclass, field
 from config import constants
 from functools import lru_cache
-from utils.english_text_utils import EnglishText, clean_english_text
-from utils.json_datatable_utils import extract_datatable_rows
+from utils.english_text_utils import EnglishText, clean_english_text, get_english_text
+from utils.datastore_utils import get_datastore
 from utils.console_utils import force_utf8_stdout
 force_utf8_stdout()
 
@@ -20,8 +20,8 @@ en_description_file = constants.EN_ITEM_DESC_FILE
 en_skill_name_file = constants.EN_SKILL_NAME_FILE
 
 
-_CACHED_ITEM_ROWS: Optional[Dict[str, Dict[str, Any]]] = None
 _CACHED_ENGLISH_NAME_TO_ITEM_ID: Optional[Dict[str, str]] = None
+_CACHED_VARIANT_INDEX: Optional[Tuple[Dict[str, Dict[str, Any]], "ItemVariantIndex"]] = None
 
 _BARE_ITEM_ID_RE = re.compile(r"\b([A-Za-z][A-Za-z0-9]*_[0-9]+)\b")
 _TOKEN_RE = re.compile(r"<\s*(\w+)\s+id=\|\s*([^|]+)\s*\|/>([ \t\r\n]*)", re.IGNORECASE)
@@ -38,16 +38,11 @@ def _load_common_text_map() -> Dict[str, str]:
     Also normalizes DataTable keys by stripping a trailing "_TextData".
     """
     out: Dict[str, str] = {}
-
-    try:
-        with open(constants.EN_COMMON_TEXT_FILE, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except Exception:
-        return out
+    store = get_datastore()
 
     # Prefer DataTable extraction first
     try:
-        rows = extract_datatable_rows(raw, source=os.path.basename(constants.EN_COMMON_TEXT_FILE)) or {}
+        rows = store.get_rows(constants.EN_COMMON_TEXT_FILE)
         if isinstance(rows, dict) and rows:
             for key, entry in rows.items():
                 if not isinstance(key, str) or not key:
@@ -73,6 +68,11 @@ def _load_common_text_map() -> Dict[str, str]:
     except Exception:
         pass
 
+    try:
+        raw = store.get_json(constants.EN_COMMON_TEXT_FILE)
+    except Exception:
+        return out
+
     # Fallback shapes (if not DataTable)
     items: List[Tuple[str, Any]] = []
 
@@ -372,11 +372,6 @@ def item_infobox_model_to_params(model: ItemInfoboxModel) -> Dict[str, str]:
     return out
 
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def _trim(v: Any) -> str:
     return str(v or "").strip()
 
@@ -619,13 +614,7 @@ def _build_quality_line(english: EnglishText, quality_name: str, row: Dict[str,
 
 
 def _load_item_rows() -> Dict[str, Dict[str, Any]]:
-    global _CACHED_ITEM_ROWS
-    if _CACHED_ITEM_ROWS is not None:
-        return _CACHED_ITEM_ROWS
-
-    data = _load_json(item_input_file)
-    _CACHED_ITEM_ROWS = extract_datatable_rows(data, source=os.path.basename(item_input_file)) or {}
-    return _CACHED_ITEM_ROWS
+    return get_datastore().get_rows(item_input_file)
 
 
 def _alt_item_name_ids(item_id: str) -> List[str]:
@@ -649,6 +638,71 @@ def _normalize_english_key(s: str) -> str:
     return s.casefold()
 
 
+def _display_name_for_id(english: EnglishText, item_id: str) -> str:
+    for candidate_id in _alt_item_name_ids(item_id):
+        name = english.get_item_name(candidate_id)
+        if name:
+            return name
+    return item_id
+
+
+@dataclass
+class ItemVariantIndex:
+    """
+    Variant groups over the legal rows of DT_ItemDataTable, in table order.
+
+    by_actor:   (ItemActorClass, normalized TypeA, TypeB) -> item ids, rows with a real actor only
+    by_name:    (normalized English name, normalized TypeA, TypeB) -> item ids
+    raw_groups: (ItemActorClass or item id, raw TypeA, TypeB) -> item ids, the export grouping
+    """
+    by_actor: Dict[Tuple[str, str, str], List[str]] = field(default_factory=dict)
+    by_name: Dict[Tuple[str, str, str], List[str]] = field(default_factory=dict)
+    raw_groups: Dict[Tuple[str, str, str], List[str]] = field(default_factory=dict)
+
+
+def _build_item_variant_index(item_rows: Dict[str, Dict[str, Any]], english: EnglishText) -> ItemVariantIndex:
+    index = ItemVariantIndex()
+
+    for item_id, row in item_rows.items():
+        if not isinstance(row, dict):
+            continue
+        if row.get("bLegalInGame") is False:
+            continue
+
+        raw_type_a = _leaf_enum(row.get("TypeA"))
+        type_b = _leaf_enum(row.get("TypeB"))
+        actor = _trim(row.get("ItemActorClass"))
+        has_actor = bool(actor) and actor.lower() != "none"
+
+        index.raw_groups.setdefault((actor if has_actor else item_id, raw_type_a, type_b), []).append(item_id)
+
+        name = _display_name_for_id(english, item_id)
+        type_a = _normalize_item_type_by_id(item_id, _normalize_item_type(raw_type_a), name)
+
+        if has_actor:
+            index.by_actor.setdefault((actor, type_a, type_b), []).append(item_id)
+
+        name_key = _normalize_english_key(name)
+        if name_key:
+            index.by_name.setdefault((name_key, type_a, type_b), []).append(item_id)
+
+    return index
+
+
+def get_item_variant_index() -> ItemVariantIndex:
+    """
+    Variant index for the currently loaded item rows; rebuilt only when the DataStore reloads them.
+    """
+    global _CACHED_VARIANT_INDEX
+    item_rows = _load_item_rows()
+    if _CACHED_VARIANT_INDEX is not None and _CACHED_VARIANT_INDEX[0] is item_rows:
+        return _CACHED_VARIANT_INDEX[1]
+
+    index = _build_item_variant_index(item_rows, get_english_text())
+    _CACHED_VARIANT_INDEX = (item_rows, index)
+    return index
+
+
 def _build_english_name_to_item_id_map(english: EnglishText) -> Dict[str, str]:
     """
     Invert DT_ItemNameText_Common entries so we can accept English item names as inputs.
@@ -657,8 +711,7 @@ def _build_english_name_to_item_id_map(english: EnglishText) -> Dict[str, str]:
       ITEM_<id>
     If collisions happen, ITEM_NAME_ wins.
     """
-    raw = _load_json(en_name_file)
-    rows = extract_datatable_rows(raw, source=os.path.basename(en_name_file)) or {}
+    rows = get_datastore().get_rows(en_name_file)
 
     mapping: Dict[str, str] = {}
 
@@ -689,7 +742,7 @@ def _build_english_name_to_item_id_map(english: EnglishText) -> Dict[str, str]:
 
 def resolve_item_id_from_english_name(english_item_name: str, english: Optional[EnglishText] = None) -> str:
     global _CACHED_ENGLISH_NAME_TO_ITEM_ID
-    english = english or EnglishText()
+    english = english or get_english_text()
 
     if _CACHED_ENGLISH_NAME_TO_ITEM_ID is None:
         _CACHED_ENGLISH_NAME_TO_ITEM_ID = _build_english_name_to_item_id_map(english)
@@ -729,20 +782,14 @@ def build_item_infobox_model_for_page(item_id: str) -> ItemInfoboxModel:
     if not item_id:
         return {}
 
-    english = EnglishText()
+    english = get_english_text()
     item_rows = _load_item_rows()
 
     row = item_rows.get(item_id)
     if not isinstance(row, dict):
         return {}
     
-    display_name = ""
-    for candidate_id in _alt_item_name_ids(item_id):
-        display_name = english.get_item_name(candidate_id)
-        if display_name:
-            break
-    if not display_name:
-        display_name = item_id
+    display_name = _display_name_for_id(english, item_id)
 
     raw_type_a = _leaf_enum(row.get("TypeA"))
     type_a = _normalize_item_type(raw_type_a)
@@ -757,55 +804,15 @@ def build_item_infobox_model_for_page(item_id: str) -> ItemInfoboxModel:
     # Collect all item ids in the same variant group.
     # Preferred key: ItemActorClass + TypeA + TypeB.
     # Fallback: shared English display name + TypeA + TypeB (some base rows omit ItemActorClass).
+    variant_index = get_item_variant_index()
     group_ids: List[str] = []
 
-    def _display_name_for_id(iid: str) -> str:
-        name = ""
-        for candidate_id in _alt_item_name_ids(iid):
-            name = english.get_item_name(candidate_id)
-            if name:
-                break
-        return name or iid
-
     if actor and actor.lower() != "none":
-        for iid, r in item_rows.items():
-            if not isinstance(r, dict):
-                continue
-            if r.get("bLegalInGame") is False:
-                continue
-
-            r_actor = _trim(r.get("ItemActorClass"))
-            if not r_actor or r_actor.lower() == "none":
-                continue
-            if r_actor != actor:
-                continue
-
-            r_type_a = _normalize_item_type(_leaf_enum(r.get("TypeA")))
-            r_name = _display_name_for_id(iid)
-            r_type_a = _normalize_item_type_by_id(iid, r_type_a, r_name)
-            r_type_b = _leaf_enum(r.get("TypeB"))
-
-            if r_type_a == type_a and r_type_b == type_b:
-                group_ids.append(iid)
+        group_ids = variant_index.by_actor.get((actor, type_a, type_b), [])
     else:
         base_name_key = _normalize_english_key(display_name)
         if base_name_key:
-            for iid, r in item_rows.items():
-                if not isinstance(r, dict):
-                    continue
-                if r.get("bLegalInGame") is False:
-                    continue
-
-                r_type_a = _normalize_item_type(_leaf_enum(r.get("TypeA")))
-                r_name = _display_name_for_id(iid)
-                r_type_a = _normalize_item_type_by_id(iid, r_type_a, r_name)
-                r_type_b = _leaf_enum(r.get("TypeB"))
-
-                if r_type_a != type_a or r_type_b != type_b:
-                    continue
-
-                if _normalize_english_key(r_name) == base_name_key:
-                    group_ids.append(iid)
+            group_ids = variant_index.by_name.get((base_name_key, type_a, type_b), [])
 
     # If only one item in the group, don’t use qualities format
     if len(group_ids) <= 1:
@@ -879,7 +886,7 @@ def build_item_infobox_model_for_page(item_id: str) -> ItemInfoboxModel:
 
 
 def build_item_infobox_model_by_id(item_id: str) -> ItemInfoboxModel:
-    english = EnglishText()
+    english = get_english_text()
     item_rows = _load_item_rows()
     row = item_rows.get(item_id)
     if not isinstance(row, dict):
@@ -970,7 +977,7 @@ def build_item_infobox_model(english_item_name: str) -> ItemInfoboxModel:
     Builder entry-point:
     Given an English item name, return canonical infobox fields (model).
     """
-    english = EnglishText()
+    english = get_english_text()
     item_id = resolve_item_id_from_english_name(english_item_name, english=english)
     if not item_id:
         return {}
@@ -1000,26 +1007,9 @@ def build_all_item_infobox_models() -> List[Tuple[str, str, ItemInfoboxModel]]:
     - Non-Armor/Weapon items are emitted individually
     - Armor/Weapon variants are merged into a single model using the Common (rarity 0) row when present
     """
-    english = EnglishText()
+    english = get_english_text()
     item_rows = _load_item_rows()
-
-    groups: Dict[Tuple[str, str, str], List[str]] = {}
-    for item_id, row in item_rows.items():
-        if not isinstance(row, dict):
-            continue
-        if row.get("bLegalInGame") is False:
-            continue
-
-        type_a = _leaf_enum(row.get("TypeA"))
-        type_b = _leaf_enum(row.get("TypeB"))
-        actor = _trim(row.get("ItemActorClass"))
-
-        if actor and actor.lower() != "none":
-            key = (actor, type_a, type_b)
-        else:
-            key = (item_id, type_a, type_b)
-
-        groups.setdefault(key, []).append(item_id)
+    groups = get_item_variant_index().raw_groups
 
     out: List[Tuple[str, str, ItemInfoboxModel]] = []
 
@@ -1,12 +1,15 @@
 import os
 from dataclasses import dataclass
 from typing import Dict, Optional, List, Tuple
-from utils.english_text_utils import EnglishText
+from utils.english_text_utils import EnglishText, get_english_text
 from builders.item_page_summary import get_item_page_blurb
 from builders.item_infobox import (build_item_infobox_model_for_page, resolve_item_id_from_english_name,)
 from builders.item_recipe import build_item_recipe_model_by_product_id
+from builders.item_usage_index import ItemUsage, get_item_usage
+from builders.chest_drop import build_chest_location
 from exports.export_item_infoboxes import render_item_infobox
 from exports.export_item_recipes import render_crafting_recipe
+from exports.export_merchant_shops import MERCHANT_NAME_OVERRIDES
 
 
 
@@ -15,6 +18,9 @@ class ItemPageOptions:
     include_history_section: bool = True
     include_navbox: bool = True
     include_placeholders: bool = True
+    # List merchants, pal drops, chests and "used in" recipes from the item usage index
+    # instead of the {{Shops}}/{{Drops}}/{{Used In Crafting}} templates.
+    include_usage_lists: bool = False
 
 def _normalize_title(s: str) -> str:
     s = str(s or "").strip()
@@ -43,6 +49,31 @@ def _navbox_for_item(*, item_type: str, subtype: str) -> str:
 
     return ""
 
+def _item_link(en: EnglishText, item_id: str) -> str:
+    return f"[[{en.get_item_name(item_id) or item_id}]]"
+
+def _pal_link(en: EnglishText, character_id: str) -> str:
+    base_id = character_id[len("BOSS_"):] if character_id.startswith("BOSS_") else character_id
+    name = en.get_pal_name(base_id) or base_id
+    return f"[[{name}]] (Alpha)" if base_id != character_id else f"[[{name}]]"
+
+def _usage_lines(usage: ItemUsage, en: EnglishText) -> Dict[str, List[str]]:
+    # Only merchants and chests with a display name are listed; raw shop keys and FieldNames are skipped.
+    merchant_names = {MERCHANT_NAME_OVERRIDES.get(merchant_key, "") for merchant_key, _ in usage.get("sold_in", [])}
+    merchants = sorted((f"* [[{name}]]" for name in merchant_names if name), key=str.casefold)
+
+    drops = sorted((f"* {_pal_link(en, cid)}" for cid in usage.get("dropped_by", [])), key=str.casefold)
+
+    chest_names = {build_chest_location(chest, grade) for chest, grade in usage.get("found_in_chests", [])}
+    chests = sorted((f"* {name}" for name in chest_names if name), key=str.casefold)
+
+    used_in = sorted(
+        (f"* {_item_link(en, pid)}" for pid in usage.get("used_in_recipes", [])),
+        key=str.casefold,
+    )
+
+    return {"merchants": merchants, "drops": drops, "chests": chests, "used_in": used_in}
+
 def build_item_page_sections(
     item_id: str,
     *,
@@ -85,17 +116,21 @@ def build_item_page_sections(
 
     sections["summary"] = "\n".join(summary_lines).rstrip()
 
-    # Acquisition section (templates only for now)
-    sections["acquisition"] = "\n".join(
-        [
-            "==Acquisition==",
-            "===Merchants===",
-            "{{Shops}}",
-            "",
-            "===Pal Drops===",
-            "{{Drops}}",
-        ]
-    )
+    usage_lines: Dict[str, List[str]] = {}
+    if options.include_usage_lists:
+        usage_lines = _usage_lines(get_item_usage(item_id), en)
+
+    # Acquisition section (templates unless usage lists are requested)
+    acquisition_lines: List[str] = ["==Acquisition==", "===Merchants==="]
+    acquisition_lines.extend(usage_lines.get("merchants") or ["{{Shops}}"])
+    acquisition_lines.extend(["", "===Pal Drops==="])
+    acquisition_lines.extend(usage_lines.get("drops") or ["{{Drops}}"])
+
+    if usage_lines.get("chests"):
+        acquisition_lines.extend(["", "===Chests==="])
+        acquisition_lines.extend(usage_lines["chests"])
+
+    sections["acquisition"] = "\n".join(acquisition_lines)
 
     # Crafting section
     recipe_model = build_item_recipe_model_by_product_id(item_id)
@@ -116,13 +151,8 @@ def build_item_page_sections(
         crafted_from_lines.append("|workload = ")
         crafted_from_lines.append("}}")
 
-    crafted_from_lines.extend(
-        [
-            "",
-            "===Used In===",
-            "{{Used In Crafting}}",
-        ]
-    )
+    crafted_from_lines.extend(["", "===Used In==="])
+    crafted_from_lines.extend(usage_lines.get("used_in") or ["{{Used In Crafting}}"])
 
     sections["crafting"] = "\n".join(crafted_from_lines).rstrip()
 
@@ -212,7 +242,7 @@ def resolve_item_id_and_title(user_title: str, *, en: Optional[EnglishText] = No
     - If user_title matches an English item name: keep it as the title.
     - If user_title is an internal item id: title becomes the English display name.
     """
-    en = en or EnglishText()
+    en = en or get_english_text()
 
     raw_title = _normalize_title(user_title)
     if not raw_title:
@@ -240,7 +270,7 @@ def build_item_page_from_name_or_id(
     Convenience wrapper:
     pass English name or internal id, get (title, page_text).
     """
-    en = EnglishText()
+    en = get_english_text()
 
     item_id, title = resolve_item_id_and_title(name_or_id, en=en)
     if not item_id:
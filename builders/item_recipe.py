@@ -1,13 +1,15 @@
 import os
 import re
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
-from utils.english_text_utils import EnglishText
-from utils.json_datatable_utils import extract_datatable_rows
+from collections import deque
+from fractions import Fraction
+from utils.english_text_utils import EnglishText, get_english_text
+from utils.datastore_utils import get_datastore
+from utils.json_datatable_utils import DATATABLE_ROW_TYPES, DataTableRecord
 from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 #Paths
@@ -18,6 +20,9 @@ item_input_file = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemDataTa
 _VARIANT_SUFFIX_RE = re.compile(r"^(?P<base>.+)_(?P<num>[2-5])$")
 _SCHEMATIC_SUFFIX_RE = re.compile(r"\s+\d+$")
 
+_CACHED_RECIPE_INDEX: Optional["RecipeIndex"] = None
+_CACHED_CRAFTING_GRAPH: Optional["CraftingGraph"] = None
+
 
 class RecipeRow(TypedDict, total=False):
     Product_Id: str
@@ -41,6 +46,7 @@ class RecipeRow(TypedDict, total=False):
 class CraftingRecipeVariant(TypedDict, total=False):
     workload: str
     ingredients: str
+    raw_materials: str
 
 class CraftingRecipeModel(TypedDict, total=False):
     product: str
@@ -49,6 +55,7 @@ class CraftingRecipeModel(TypedDict, total=False):
     workload: str
     ingredients: str
     schematic: str
+    raw_materials: str  # only when built with include_raw_materials=True
     variants: Dict[int, CraftingRecipeVariant]  # {2: {"workload": "...", "ingredients": "..."}, ...}
 
 class CraftingRecipeEntry(TypedDict, total=False):
@@ -56,6 +63,12 @@ class CraftingRecipeEntry(TypedDict, total=False):
     display_name: str
     model: CraftingRecipeModel
 
+class RawMaterialTotals(TypedDict, total=False):
+    product_id: str
+    yield_count: Fraction
+    raw_materials: Dict[str, Fraction]  # raw material id -> amount for one craft (Product_Count units)
+    total_work_amount: Fraction  # WorkAmount of the recipe plus every intermediate craft it needs
+
 def _normalize_schematic_name(name: str) -> str:
     name = (name or "").strip()
     return _SCHEMATIC_SUFFIX_RE.sub("", name)
@@ -74,10 +87,6 @@ def _is_schematic_product(*, product_id: str, product_name: str) -> bool:
 
     return False
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def _trim(v: Any) -> str:
     return str(v or "").strip()
 
@@ -115,53 +124,45 @@ def _english_item_name(en: EnglishText, item_id: str) -> str:
         return ""
     return en.get_item_name(item_id) or item_id
 
-def _load_item_rows(*, input_path: str = item_input_file) -> Dict[str, Dict[str, Any]]:
-    raw = _load_json(input_path)
-    return extract_datatable_rows(raw, source=os.path.basename(input_path)) or {}
+def _load_item_rows(*, input_path: str = item_input_file) -> Dict[str, DataTableRecord]:
+    # Variant detection only needs these two columns of the (large) item table.
+    return get_datastore().get_records(input_path, ("OverrideName", "ItemActorClass"))
 
-def _find_variant_item_ids_for_base(
-    *,
-    base_id: str,
-    items_by_id: Dict[str, Dict[str, Any]],
-) -> List[str]:
+def _index_variant_item_ids_by_base(items_by_id: Dict[str, DataTableRecord]) -> Dict[str, List[str]]:
     """
     Variant rule:
     - Base item has OverrideName == "None"
     - Variants share ItemActorClass with base
     - Variant.OverrideName == "ITEM_NAME_<base_id>"
-    """
-    base_id = _trim(base_id)
-    if not base_id:
-        return []
-
-    base_item = items_by_id.get(base_id)
-    if not isinstance(base_item, dict):
-        return []
-
-    base_override = _trim(base_item.get("OverrideName"))
-    if not _is_none_text(base_override):
-        return []
-
-    base_actor = _trim(base_item.get("ItemActorClass"))
-    if _is_none_text(base_actor):
-        return []
 
-    base_name_key = f"ITEM_NAME_{base_id}"
-
-    out: List[str] = []
+    Returns { base_id: [variant item ids in table order] } for every base that has variants.
+    """
+    by_actor_override: Dict[Tuple[str, str], List[str]] = {}
     for item_id, row in items_by_id.items():
-        if not isinstance(row, dict):
+        if not isinstance(row, DATATABLE_ROW_TYPES):
             continue
 
-        actor = _trim(row.get("ItemActorClass"))
         override = _trim(row.get("OverrideName"))
+        if not override.startswith("ITEM_NAME_"):
+            continue
+
+        actor = _trim(row.get("ItemActorClass"))
+        by_actor_override.setdefault((actor, override), []).append(item_id)
 
-        if actor != base_actor:
+    out: Dict[str, List[str]] = {}
+    for (actor, override), ids in by_actor_override.items():
+        base_id = override[len("ITEM_NAME_"):]
+        base_item = items_by_id.get(base_id)
+        if not isinstance(base_item, DATATABLE_ROW_TYPES):
+            continue
+        if not _is_none_text(base_item.get("OverrideName")):
             continue
-        if override != base_name_key:
+
+        base_actor = _trim(base_item.get("ItemActorClass"))
+        if _is_none_text(base_actor) or base_actor != actor:
             continue
 
-        out.append(item_id)
+        out[base_id] = ids
 
     return out
 
@@ -205,40 +206,6 @@ def _list_from_any(v: Any) -> List[str]:
         return out
     return []
 
-def _true_variant_info_from_product_id(
-    product_id: str,
-    *,
-    items_by_id: Dict[str, Dict[str, Any]],
-) -> Tuple[str, Optional[int]]:
-    """
-    Returns (base_id, variant_num) ONLY if the product_id is a TRUE variant,
-    according to ItemActorClass + OverrideName rules.
-
-    If product_id looks like a suffix variant (e.g., Spear_2) but is NOT a true variant,
-    returns (product_id, None) so it is treated as a standalone item.
-    """
-    product_id = _trim(product_id)
-
-    m = _VARIANT_SUFFIX_RE.match(product_id)
-    if not m:
-        return product_id, None
-
-    base_id = _trim(m.group("base"))
-    variant_num = int(m.group("num"))
-
-    if not base_id:
-        return product_id, None
-
-    variant_item_ids = _find_variant_item_ids_for_base(
-        base_id=base_id,
-        items_by_id=items_by_id,
-    )
-
-    if product_id in set(variant_item_ids):
-        return base_id, variant_num
-
-    return product_id, None
-
 def _index_rows_by_product_id(rows: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     DT export row name is not guaranteed to equal Product_Id,
@@ -256,14 +223,236 @@ def _index_rows_by_product_id(rows: Dict[str, Dict[str, Any]]) -> Dict[str, Dict
     return by_pid
 
 def _load_recipe_rows(*, input_path: str = recipe_input_file) -> Dict[str, Dict[str, Any]]:
-    raw = _load_json(input_path)
-    return extract_datatable_rows(raw, source=os.path.basename(input_path)) or {}
+    return get_datastore().get_rows(input_path)
+
+def _index_rows_by_unlock_item(by_pid: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    by_unlock: Dict[str, List[str]] = {}
+    for pid, row in by_pid.items():
+        unlock_id = _trim(row.get("UnlockItemID"))
+        if unlock_id and not _is_none_text(unlock_id):
+            by_unlock.setdefault(unlock_id, []).append(pid)
+    return by_unlock
+
+class RecipeIndex:
+    """
+    Lookups over DT_ItemRecipeDataTable + DT_ItemDataTable, built once per data load.
+
+    by_product:      Product_Id -> recipe row (first row wins)
+    by_variant_base: base item id -> true variant item ids (ItemActorClass + OverrideName rule)
+    by_unlock_item:  UnlockItemID (schematic) -> Product_Ids it unlocks
+    """
+
+    def __init__(self, recipe_rows: Dict[str, Dict[str, Any]], items_by_id: Dict[str, DataTableRecord]) -> None:
+        self.recipe_rows = recipe_rows
+        self.items_by_id = items_by_id
+        self.by_product = _index_rows_by_product_id(recipe_rows)
+        self.by_variant_base = _index_variant_item_ids_by_base(items_by_id)
+        self.by_unlock_item = _index_rows_by_unlock_item(self.by_product)
+
+    def variant_item_ids_for_base(self, base_id: str) -> List[str]:
+        return self.by_variant_base.get(_trim(base_id), [])
+
+    def true_variant_info(self, product_id: str) -> Tuple[str, Optional[int]]:
+        """
+        Returns (base_id, variant_num) ONLY if the product_id is a TRUE variant,
+        according to ItemActorClass + OverrideName rules.
+
+        If product_id looks like a suffix variant (e.g., Spear_2) but is NOT a true variant,
+        returns (product_id, None) so it is treated as a standalone item.
+        """
+        product_id = _trim(product_id)
+
+        m = _VARIANT_SUFFIX_RE.match(product_id)
+        if not m:
+            return product_id, None
+
+        base_id = _trim(m.group("base"))
+        if not base_id:
+            return product_id, None
+
+        if product_id in self.variant_item_ids_for_base(base_id):
+            return base_id, int(m.group("num"))
+
+        return product_id, None
+
+def get_recipe_index(
+    *,
+    recipe_path: str = recipe_input_file,
+    item_path: str = item_input_file,
+) -> RecipeIndex:
+    """
+    Shared RecipeIndex; rebuilt only when the DataStore hands back different rows.
+    """
+    global _CACHED_RECIPE_INDEX
+    recipe_rows = _load_recipe_rows(input_path=recipe_path)
+    items_by_id = _load_item_rows(input_path=item_path)
+
+    cached = _CACHED_RECIPE_INDEX
+    if cached is not None and cached.recipe_rows is recipe_rows and cached.items_by_id is items_by_id:
+        return cached
+
+    _CACHED_RECIPE_INDEX = RecipeIndex(recipe_rows, items_by_id)
+    return _CACHED_RECIPE_INDEX
+
+def _to_fraction(v: Any) -> Fraction:
+    try:
+        return Fraction(str(v))
+    except (TypeError, ValueError, ZeroDivisionError):
+        return Fraction(0)
+
+def _recipe_materials(row: Dict[str, Any]) -> List[Tuple[str, Fraction]]:
+    out: List[Tuple[str, Fraction]] = []
+    for idx in (1, 2, 3, 4, 5):
+        mat_id = _trim(row.get(f"Material{idx}_Id"))
+        if _is_none_text(mat_id):
+            continue
+        count = _to_fraction(row.get(f"Material{idx}_Count"))
+        if count <= 0:
+            continue
+        out.append((mat_id, count))
+    return out
+
+class CraftingGraph:
+    """
+    Product -> material graph over the recipes in a RecipeIndex (one recipe per Product_Id).
+
+    A material with its own recipe is an intermediate and gets expanded; anything else is raw.
+    Products are resolved once, in topological order (Kahn's algorithm), so each product's per-unit
+    totals come from its materials' finished totals in one linear pass. Products on a crafting cycle,
+    and everything that depends on one, are left unexpanded and listed in cyclic_products.
+    Amounts are exact Fractions, since yields like 2 Nails per craft give fractional intermediates.
+    """
+
+    def __init__(self, index: RecipeIndex) -> None:
+        self.index = index
+        self.materials: Dict[str, List[Tuple[str, Fraction]]] = {}
+        self.yields: Dict[str, Fraction] = {}
+        self.work_amounts: Dict[str, Fraction] = {}
+
+        for product_id, row in index.by_product.items():
+            self.materials[product_id] = _recipe_materials(row)
+            product_count = _to_fraction(row.get("Product_Count"))
+            self.yields[product_id] = product_count if product_count > 0 else Fraction(1)
+            self.work_amounts[product_id] = _to_fraction(row.get("WorkAmount"))
+
+        self.order: List[str] = self._topological_order()
+
+        # product id -> (raw materials per unit, work amount per unit)
+        self._per_unit: Dict[str, Tuple[Dict[str, Fraction], Fraction]] = {}
+        for product_id in self.order:
+            self._per_unit[product_id] = self._expand(product_id)
+
+        self.cyclic_products: List[str] = [p for p in self.materials if p not in self._per_unit]
+
+    def _topological_order(self) -> List[str]:
+        pending: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+        for product_id, mats in self.materials.items():
+            intermediates = {m for m, _ in mats if m in self.materials}
+            pending[product_id] = len(intermediates)
+            for m in intermediates:
+                dependents.setdefault(m, []).append(product_id)
+
+        queue = deque(p for p, n in pending.items() if n == 0)
+        order: List[str] = []
+        while queue:
+            product_id = queue.popleft()
+            order.append(product_id)
+            for dep in dependents.get(product_id, []):
+                pending[dep] -= 1
+                if pending[dep] == 0:
+                    queue.append(dep)
+        return order
+
+    def _expand(self, product_id: str) -> Tuple[Dict[str, Fraction], Fraction]:
+        per_craft = 1 / self.yields[product_id]
+        raw: Dict[str, Fraction] = {}
+        work = self.work_amounts[product_id] * per_craft
+
+        for mat_id, count in self.materials[product_id]:
+            need = count * per_craft
+            sub = self._per_unit.get(mat_id)
+            if sub is None:
+                raw[mat_id] = raw.get(mat_id, Fraction(0)) + need
+                continue
+
+            sub_raw, sub_work = sub
+            for raw_id, amount in sub_raw.items():
+                raw[raw_id] = raw.get(raw_id, Fraction(0)) + amount * need
+            work += sub_work * need
+
+        return raw, work
+
+    def totals_for(self, product_id: str) -> Optional[RawMaterialTotals]:
+        """
+        Raw materials and total workload for one craft of product_id, or None if it has no recipe or
+        sits on (or depends on) a crafting cycle.
+        """
+        product_id = _trim(product_id)
+        per_unit = self._per_unit.get(product_id)
+        if per_unit is None:
+            return None
+
+        raw, work = per_unit
+        y = self.yields[product_id]
+        return {
+            "product_id": product_id,
+            "yield_count": y,
+            "raw_materials": {raw_id: amount * y for raw_id, amount in raw.items()},
+            "total_work_amount": work * y,
+        }
+
+    def all_totals(self) -> List[RawMaterialTotals]:
+        """Totals for every expandable recipe, in topological order."""
+        out: List[RawMaterialTotals] = []
+        for product_id in self.order:
+            totals = self.totals_for(product_id)
+            if totals:
+                out.append(totals)
+        return out
+
+def get_crafting_graph(
+    *,
+    recipe_path: str = recipe_input_file,
+    item_path: str = item_input_file,
+    index: Optional[RecipeIndex] = None,
+) -> CraftingGraph:
+    """
+    Shared CraftingGraph; rebuilt only when it is asked for a different RecipeIndex.
+    """
+    global _CACHED_CRAFTING_GRAPH
+    index = index or get_recipe_index(recipe_path=recipe_path, item_path=item_path)
+
+    cached = _CACHED_CRAFTING_GRAPH
+    if cached is not None and cached.index is index:
+        return cached
+
+    _CACHED_CRAFTING_GRAPH = CraftingGraph(index)
+    return _CACHED_CRAFTING_GRAPH
+
+def format_raw_materials(en: EnglishText, raw_materials: Dict[str, Fraction]) -> str:
+    """Same "Name*count; ..." style as ingredients, largest amounts first."""
+    parts: List[str] = []
+    for raw_id, amount in sorted(raw_materials.items(), key=lambda kv: (-kv[1], kv[0])):
+        mat_name = _english_item_name(en, raw_id)
+        parts.append(f"{mat_name}*{_format_number(round(float(amount), 2))}")
+    return "; ".join(parts)
+
+def format_total_workload(totals: RawMaterialTotals) -> str:
+    return _format_workload(float(totals.get("total_work_amount", 0)))
+
+def _raw_materials_text(en: EnglishText, graph: CraftingGraph, product_id: str) -> str:
+    totals = graph.totals_for(product_id)
+    if not totals:
+        return ""
+    return format_raw_materials(en, totals.get("raw_materials") or {})
 
 def _build_model_for_base_and_variants(
     *,
     base_row: Dict[str, Any],
     variant_rows_by_num: Dict[int, Dict[str, Any]],
     en: EnglishText,
+    graph: Optional[CraftingGraph] = None,
 ) -> CraftingRecipeModel:
     product_id = _trim(base_row.get("Product_Id"))
     product_name = _english_item_name(en, product_id)
@@ -276,6 +465,9 @@ def _build_model_for_base_and_variants(
         "ingredients": _build_ingredients(en, base_row),
     }
 
+    if graph is not None:
+        model["raw_materials"] = _raw_materials_text(en, graph, product_id)
+
     if _is_schematic_product(product_id=product_id, product_name=product_name):
         model["workbench"] = "Drafting Table"
 
@@ -300,6 +492,8 @@ def _build_model_for_base_and_variants(
                 "workload": _format_workload(vrow.get("WorkAmount")),
                 "ingredients": _build_ingredients(en, vrow),
             }
+            if graph is not None:
+                model["variants"][n]["raw_materials"] = _raw_materials_text(en, graph, _trim(vrow.get("Product_Id")))
 
     return model
 
@@ -308,22 +502,23 @@ def build_item_recipe_model_by_product_id(
     *,
     recipe_path: str = recipe_input_file,
     item_path: str = item_input_file,
+    index: Optional[RecipeIndex] = None,
+    include_raw_materials: bool = False,
 ) -> Optional[CraftingRecipeModel]:
     """
     Mapping builder:
     Pass a Product_Id (internal) and get a canonical recipe model.
+    include_raw_materials adds the fully expanded raw material totals (see CraftingGraph).
     """
     product_id = _trim(product_id)
     if not product_id:
         return None
 
-    en = EnglishText()
-    rows = _load_recipe_rows(input_path=recipe_path)
-    by_pid = _index_rows_by_product_id(rows)
-
-    items_by_id = _load_item_rows(input_path=item_path)
+    en = get_english_text()
+    index = index or get_recipe_index(recipe_path=recipe_path, item_path=item_path)
+    by_pid = index.by_product
 
-    base_id, variant_num = _true_variant_info_from_product_id(product_id, items_by_id=items_by_id)
+    base_id, variant_num = index.true_variant_info(product_id)
     if variant_num is not None:
         product_id = base_id
 
@@ -340,16 +535,13 @@ def build_item_recipe_model_by_product_id(
             if not isinstance(vrow, dict):
                 continue
 
-            _, n = _true_variant_info_from_product_id(_trim(vrow.get("Product_Id")), items_by_id=items_by_id)
+            _, n = index.true_variant_info(_trim(vrow.get("Product_Id")))
             if n is None:
                 continue
             if 2 <= n <= 5:
                 variant_rows_by_num[n] = vrow
     else:
-        variant_item_ids = _find_variant_item_ids_for_base(
-            base_id=product_id,
-            items_by_id=items_by_id,
-        )
+        variant_item_ids = index.variant_item_ids_for_base(product_id)
 
         for vid in variant_item_ids:
             vrow = by_pid.get(vid)
@@ -362,25 +554,29 @@ def build_item_recipe_model_by_product_id(
             if 2 <= n <= 5:
                 variant_rows_by_num[n] = vrow
 
+    graph = get_crafting_graph(index=index) if include_raw_materials else None
+
     return _build_model_for_base_and_variants(
         base_row=base_row,
         variant_rows_by_num=variant_rows_by_num,
         en=en,
+        graph=graph,
     )
 
-def build_all_item_recipe_models(*, input_path: str = recipe_input_file) -> List[CraftingRecipeEntry]:
+def build_all_item_recipe_models(
+    *,
+    input_path: str = recipe_input_file,
+    include_raw_materials: bool = False,
+) -> List[CraftingRecipeEntry]:
     """Build all crafting recipe models (no wikitext)."""
-    en = EnglishText()
-    rows = _load_recipe_rows(input_path=input_path)
-    by_pid = _index_rows_by_product_id(rows)
-
-    items_by_id = _load_item_rows(input_path=item_input_file)
+    en = get_english_text()
+    index = get_recipe_index(recipe_path=input_path, item_path=item_input_file)
 
     base_ids: List[str] = []
     seen_base: set[str] = set()
 
-    for pid in by_pid.keys():
-        base_id, variant_num = _true_variant_info_from_product_id(pid, items_by_id=items_by_id)
+    for pid in index.by_product.keys():
+        base_id, variant_num = index.true_variant_info(pid)
         if variant_num is not None:
             continue
         if base_id in seen_base:
@@ -392,7 +588,7 @@ def build_all_item_recipe_models(*, input_path: str = recipe_input_file) -> List
 
     out: List[CraftingRecipeEntry] = []
     for base_id in base_ids:
-        model = build_item_recipe_model_by_product_id(base_id, recipe_path=input_path, item_path=item_input_file)
+        model = build_item_recipe_model_by_product_id(base_id, index=index, include_raw_materials=include_raw_materials)
         if not model:
             continue
 
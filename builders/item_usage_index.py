@@ -0,0 +1,292 @@
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import constants
+from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
+from utils.datastore_utils import get_datastore
+from utils.datatable_cache_utils import cached_build
+
+#Paths
+recipe_input_file = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemRecipeDataTable.json")
+drop_input_file = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalDropItem.json")
+item_lottery_input_file = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemLotteryDataTable.json")
+dungeon_item_lottery_input_file = os.path.join(constants.INPUT_DIRECTORY, "Dungeon", "DT_DungeonItemLotteryDataTable.json")
+
+itemshop_lottery_input_file = os.path.join(constants.INPUT_DIRECTORY, "ItemShop", "DT_ItemShopLotteryData.json")
+itemshop_lottery_common_input_file = os.path.join(constants.INPUT_DIRECTORY, "ItemShop", "DT_ItemShopLotteryData_Common.json")
+itemshop_create_input_file = os.path.join(constants.INPUT_DIRECTORY, "ItemShop", "DT_ItemShopCreateData.json")
+itemshop_create_common_input_file = os.path.join(constants.INPUT_DIRECTORY, "ItemShop", "DT_ItemShopCreateData_Common.json")
+
+ITEM_USAGE_INDEX_CACHE_NAME = "item_usage_index_v2"
+
+_GRADE_NUM_RE = re.compile(r"::\s*Grade\s*(\d+)\s*$", re.IGNORECASE)
+_ENUM_LEAF_RE = re.compile(r"::\s*([A-Za-z0-9_]+)\s*$")
+
+_CACHED_ITEM_USAGE_INDEX: Optional[Tuple[Tuple[Tuple[str, int], ...], "ItemUsageIndex"]] = None
+
+
+class ItemUsage(TypedDict, total=False):
+    used_in_recipes: List[str]          # Product_Ids whose recipe takes this item as a material
+    crafted_from: List[str]             # material ids of this item's own recipe
+    sold_in: List[Tuple[str, str]]      # (merchantKey, shopGroup)
+    dropped_by: List[str]               # CharacterIDs (BOSS_ prefix kept for alpha drops), any drop level
+    found_in_chests: List[Tuple[str, str]]  # (chest name, grade number); chest name as in chest_drop:
+                                            # FieldName, or "<ItemFieldLotteryName>:<Type>" for dungeon chests
+
+
+def _trim(v: Any) -> str:
+    return str(v or "").strip()
+
+def _is_none_text(v: Any) -> bool:
+    return _trim(v).lower() in {"", "none"}
+
+def _to_float(v: Any, default: float = 0.0) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return default
+
+def _parse_grade_number(treasure_box_grade: Any) -> str:
+    s = _trim(treasure_box_grade)
+    if not s:
+        return ""
+
+    m = _GRADE_NUM_RE.search(s)
+    if m:
+        return m.group(1)
+
+    digits = re.findall(r"(\d+)", s)
+    return digits[-1] if digits else ""
+
+def _parse_enum_leaf(v: Any) -> str:
+    s = _trim(v)
+    if not s:
+        return ""
+    m = _ENUM_LEAF_RE.search(s)
+    if m:
+        return m.group(1)
+    return s
+
+def _merge_rows(*paths: str) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        for k, v in get_datastore().get_rows(path).items():
+            if isinstance(k, str) and isinstance(v, dict):
+                out[k] = v
+    return out
+
+
+class _IndexBuilder:
+    """
+    Accumulates references per item as sets, so each dataset is scanned exactly once and
+    duplicate rows (multiple slots, repeated shop entries) collapse.
+    """
+
+    _FIELDS = ("used_in_recipes", "crafted_from", "sold_in", "dropped_by", "found_in_chests")
+
+    def __init__(self) -> None:
+        self.by_item: Dict[str, Dict[str, Set[Any]]] = {}
+
+    def add(self, item_id: str, field: str, ref: Any) -> None:
+        entry = self.by_item.get(item_id)
+        if entry is None:
+            entry = self.by_item[item_id] = {}
+        entry.setdefault(field, set()).add(ref)
+
+    def freeze(self) -> Dict[str, ItemUsage]:
+        out: Dict[str, ItemUsage] = {}
+        for item_id in sorted(self.by_item):
+            entry = self.by_item[item_id]
+            usage: ItemUsage = {}
+            for field in self._FIELDS:
+                refs = entry.get(field)
+                if refs:
+                    usage[field] = sorted(refs)  # type: ignore[literal-required]
+            out[item_id] = usage
+        return out
+
+
+def _index_recipes(builder: _IndexBuilder, recipe_path: str) -> None:
+    seen_products: Set[str] = set()
+    for _, row in get_datastore().iter_rows(recipe_path, source="DT_ItemRecipeDataTable"):
+        if not isinstance(row, dict):
+            continue
+        product_id = _trim(row.get("Product_Id"))
+        # Same "first row wins" rule as the recipe builder.
+        if _is_none_text(product_id) or product_id in seen_products:
+            continue
+        seen_products.add(product_id)
+
+        for i in range(1, 6):
+            material_id = _trim(row.get(f"Material{i}_Id"))
+            if _is_none_text(material_id) or _to_float(row.get(f"Material{i}_Count")) <= 0:
+                continue
+            builder.add(material_id, "used_in_recipes", product_id)
+            builder.add(product_id, "crafted_from", material_id)
+
+def _index_shops(builder: _IndexBuilder, lottery_paths: Tuple[str, ...], create_paths: Tuple[str, ...]) -> None:
+    create_rows = _merge_rows(*create_paths)
+
+    for merchant_key, lottery_row in _merge_rows(*lottery_paths).items():
+        lottery_array = lottery_row.get("lotteryDataArray")
+        if not isinstance(lottery_array, list):
+            continue
+
+        for entry in lottery_array:
+            if not isinstance(entry, dict):
+                continue
+            shop_group = _trim(entry.get("ShopGroupName"))
+            create = create_rows.get(shop_group) if shop_group else None
+            if not isinstance(create, dict):
+                continue
+
+            product_array = create.get("productDataArray")
+            if not isinstance(product_array, list):
+                continue
+
+            for prod in product_array:
+                if isinstance(prod, dict):
+                    item_id = _trim(prod.get("StaticItemId"))
+                    if item_id:
+                        builder.add(item_id, "sold_in", (merchant_key, shop_group))
+
+def _index_pal_drops(builder: _IndexBuilder, drop_path: str) -> None:
+    for _, row in get_datastore().iter_rows(drop_path, source="DT_PalDropItem"):
+        if not isinstance(row, dict):
+            continue
+        # Level-gated rows are real drops too; the set keeps one entry per CharacterID.
+        character_id = _trim(row.get("CharacterID"))
+        if not character_id:
+            continue
+
+        for i in range(1, 11):
+            item_id = _trim(row.get(f"ItemId{i}"))
+            if _is_none_text(item_id) or _to_float(row.get(f"Rate{i}")) <= 0:
+                continue
+            builder.add(item_id, "dropped_by", character_id)
+
+def _dungeon_chests_by_field(dungeon_lottery_path: str) -> Dict[str, List[str]]:
+    # Same chest naming and TestDebug filter as chest_drop.build_dungeon_chest_drop_groups.
+    out: Dict[str, List[str]] = {}
+    if not os.path.exists(dungeon_lottery_path):
+        return out
+
+    for _, row in get_datastore().iter_rows(dungeon_lottery_path, source="DT_DungeonItemLotteryDataTable"):
+        if not isinstance(row, dict):
+            continue
+        if _trim(row.get("SpawnAreaId")).startswith("TestDebug"):
+            continue
+        item_field = _trim(row.get("ItemFieldLotteryName"))
+        type_leaf = _parse_enum_leaf(row.get("Type"))
+        if not item_field or not type_leaf:
+            continue
+        chests = out.setdefault(item_field, [])
+        chest_name = f"{item_field}:{type_leaf}"
+        if chest_name not in chests:
+            chests.append(chest_name)
+    return out
+
+def _index_chests(builder: _IndexBuilder, lottery_path: str, dungeon_lottery_path: str) -> None:
+    """
+    Every chest grade whose lottery can give the item: enemy base, oil rig and other field chests by
+    FieldName, and dungeon chests (whose loot is a DT_ItemLotteryDataTable field) by their chest name.
+    """
+    dungeon_chests = _dungeon_chests_by_field(dungeon_lottery_path)
+
+    for _, row in get_datastore().iter_rows(lottery_path, source="DT_ItemLotteryDataTable"):
+        if not isinstance(row, dict):
+            continue
+        item_id = _trim(row.get("StaticItemId"))
+        field_name = _trim(row.get("FieldName"))
+        grade_number = _parse_grade_number(row.get("TreasureBoxGrade"))
+        if _is_none_text(item_id) or not field_name or not grade_number:
+            continue
+
+        for chest_name in dungeon_chests.get(field_name) or [field_name]:
+            builder.add(item_id, "found_in_chests", (chest_name, grade_number))
+
+
+class ItemUsageIndex:
+    """
+    Inverted index item_id -> every recipe, shop group, pal drop and chest grade that references it.
+
+    Built in one pass over DT_ItemRecipeDataTable, the ItemShop lottery/create tables, DT_PalDropItem,
+    DT_ItemLotteryDataTable and DT_DungeonItemLotteryDataTable; the result is plain dicts/lists/tuples so it can be pickled into the
+    datatable cache and reloaded without touching the source tables.
+    """
+
+    def __init__(self, by_item: Dict[str, ItemUsage]) -> None:
+        self.by_item = by_item
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        recipe_path: str = recipe_input_file,
+        drop_path: str = drop_input_file,
+        item_lottery_path: str = item_lottery_input_file,
+        dungeon_lottery_path: str = dungeon_item_lottery_input_file,
+        shop_lottery_paths: Tuple[str, ...] = (itemshop_lottery_common_input_file, itemshop_lottery_input_file),
+        shop_create_paths: Tuple[str, ...] = (itemshop_create_common_input_file, itemshop_create_input_file),
+    ) -> "ItemUsageIndex":
+        builder = _IndexBuilder()
+        if os.path.exists(recipe_path):
+            _index_recipes(builder, recipe_path)
+        _index_shops(builder, shop_lottery_paths, shop_create_paths)
+        if os.path.exists(drop_path):
+            _index_pal_drops(builder, drop_path)
+        if os.path.exists(item_lottery_path):
+            _index_chests(builder, item_lottery_path, dungeon_lottery_path)
+        return cls(builder.freeze())
+
+    def usage_for(self, item_id: str) -> ItemUsage:
+        return self.by_item.get(_trim(item_id)) or {}
+
+    def __contains__(self, item_id: object) -> bool:
+        return isinstance(item_id, str) and item_id.strip() in self.by_item
+
+    def __len__(self) -> int:
+        return len(self.by_item)
+
+
+def _index_sources() -> List[str]:
+    paths = [
+        recipe_input_file,
+        drop_input_file,
+        item_lottery_input_file,
+        dungeon_item_lottery_input_file,
+        itemshop_lottery_common_input_file,
+        itemshop_lottery_input_file,
+        itemshop_create_common_input_file,
+        itemshop_create_input_file,
+    ]
+    return [p for p in paths if os.path.exists(p)]
+
+def _source_key(paths: List[str]) -> Tuple[Tuple[str, int], ...]:
+    return tuple((p, os.stat(p).st_mtime_ns) for p in paths)
+
+def get_item_usage_index() -> ItemUsageIndex:
+    """
+    Shared ItemUsageIndex. Loaded from the datatable cache when it was built from the current input
+    files, otherwise built and saved; reloaded in-process only when an input file changes on disk.
+    """
+    global _CACHED_ITEM_USAGE_INDEX
+    sources = _index_sources()
+    key = _source_key(sources)
+
+    cached = _CACHED_ITEM_USAGE_INDEX
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    by_item = cached_build(ITEM_USAGE_INDEX_CACHE_NAME, sources, lambda: ItemUsageIndex.build().by_item)
+    index = ItemUsageIndex(by_item)
+    _CACHED_ITEM_USAGE_INDEX = (key, index)
+    return index
+
+def get_item_usage(item_id: str) -> ItemUsage:
+    return get_item_usage_index().usage_for(item_id)
@@ -1,13 +1,12 @@
 import os
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
 from typing import Any, Dict, List, Optional, TypedDict
-from utils.english_text_utils import EnglishText
-from utils.json_datatable_utils import extract_datatable_rows
+from utils.english_text_utils import EnglishText, get_english_text
+from utils.datastore_utils import get_datastore
 
 #Paths
 item_input_file = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemDataTable.json")
@@ -47,13 +46,8 @@ class MerchantShopModel(TypedDict, total=False):
     merchantName: str
     shopGroups: List[MerchantShopGroupModel]
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def _load_rows(path: str) -> Dict[str, Dict[str, Any]]:
-    raw = _load_json(path)
-    return extract_datatable_rows(raw, source=os.path.basename(path)) or {}
+    return get_datastore().get_rows(path)
 
 def _to_int(v: Any, default: int = 0) -> int:
     try:
@@ -94,13 +88,10 @@ def _load_item_price_map() -> Dict[str, int]:
     if not os.path.exists(item_input_file):
         return {}
 
-    rows = _load_rows(item_input_file)
+    rows = get_datastore().get_records(item_input_file, ("Price",))
     out: Dict[str, int] = {}
 
     for item_id, row in rows.items():
-        if not isinstance(item_id, str) or not isinstance(row, dict):
-            continue
-
         # Price appears to be numeric; accept float/int/string
         price = _to_int(row.get("Price"), default=0)
         if price == 0:
@@ -144,7 +135,7 @@ def build_all_merchant_shop_models(
     """
     merchant_name_overrides = merchant_name_overrides or {}
 
-    en = EnglishText()
+    en = get_english_text()
     item_price_map = _load_item_price_map()
 
     lottery_rows = _merge_rows(
@@ -1,18 +1,30 @@
 import os
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
-from typing import Any, List, Tuple, TypedDict
+from typing import Any, List, Optional, Tuple, TypedDict
 from config.name_map import ELEMENT_NAME_MAP
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from builders.pal_breeding_combi import BreedingCombiTable, UniqueCombo, get_breeding_combi_table
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
+from utils.json_datatable_utils import DATATABLE_ROW_TYPES
 
 #Paths
 param_input_file = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json")
 
+# Columns of DT_PalMonsterParameter read by this builder.
+PAL_BREEDING_FIELDS = (
+    "ZukanIndex",
+    "ZukanIndexSuffix",
+    "CombiRank",
+    "MaleProbability",
+    "CombiDuplicatePriority",
+    "Rarity",
+    "ElementType1",
+)
+
 #Mapping
 EGG_SIZE_BY_RARITY = [
     (1, 4, "Regular"),
@@ -87,7 +99,7 @@ def after_double_colon(v: Any) -> str:
     return s
 
 def build_breeding_egg(row: dict) -> str:
-    if not isinstance(row, dict):
+    if not isinstance(row, DATATABLE_ROW_TYPES):
         return ""
 
     rarity = row.get("Rarity")
@@ -140,7 +152,7 @@ def build_pal_order(param_rows: dict) -> List[str]:
 
         base_id = key.replace("BOSS_", "")
         normal = param_rows.get(base_id)
-        if not isinstance(normal, dict):
+        if not isinstance(normal, DATATABLE_ROW_TYPES):
             continue
 
         pal_no = zukan_no(normal.get("ZukanIndex"), normal.get("ZukanIndexSuffix"))
@@ -152,20 +164,36 @@ def build_pal_order(param_rows: dict) -> List[str]:
     pal_order.sort(key=lambda x: (int(x[0][:3]), x[0][3:]))
     return [base_id for _, base_id in pal_order]
 
+def _combo_parent_label(pal_id: str, gender: str, en: EnglishText) -> str:
+    name = en.get_pal_name(pal_id) or pal_id
+    return f"{name} ({gender})" if gender else name
+
+def format_unique_combos(combos: List[UniqueCombo], en: EnglishText) -> str:
+    parts: List[str] = []
+    for combo in combos:
+        a = _combo_parent_label(combo.get("parent_a", ""), combo.get("gender_a", ""), en)
+        b = _combo_parent_label(combo.get("parent_b", ""), combo.get("gender_b", ""), en)
+        parts.append(f"{a} + {b}")
+    return "; ".join(parts)
+
 def build_pal_breeding_model_by_id(
     base_id: str,
     *,
     rows: dict,
     en: EnglishText,
+    combi: Optional[BreedingCombiTable] = None,
 ) -> PalBreedingModel:
     normal = rows.get(base_id)
     boss = rows.get(f"BOSS_{base_id}")
 
-    if not isinstance(normal, dict) or not isinstance(boss, dict):
+    if not isinstance(normal, DATATABLE_ROW_TYPES) or not isinstance(boss, DATATABLE_ROW_TYPES):
         return {}
 
     display_name = en.get_pal_name(base_id) or base_id
 
+    if combi is None:
+        combi = get_breeding_combi_table()
+
     model: PalBreedingModel = {
         "base_id": base_id,
         "display_name": display_name,
@@ -173,23 +201,21 @@ def build_pal_breeding_model_by_id(
         "male_probability": fmt(normal.get("MaleProbability")),
         "combi_duplicate_priority": fmt(normal.get("CombiDuplicatePriority")),
         "egg": build_breeding_egg(normal),
-        "unique_combos": "",
+        "unique_combos": format_unique_combos(combi.unique_combos_for(base_id), en),
     }
 
     return model
 
 def build_all_pal_breeding_models() -> List[Tuple[str, PalBreedingModel]]:
-    with open(param_input_file, "r", encoding="utf-8") as f:
-        param_data = json.load(f)
-
-    rows = extract_datatable_rows(param_data, source="DT_PalMonsterParameter")
-    en = EnglishText()
+    rows = get_datastore().get_records(param_input_file, PAL_BREEDING_FIELDS, source="DT_PalMonsterParameter")
+    en = get_english_text()
+    combi = get_breeding_combi_table()
 
     base_ids = build_pal_order(rows)
 
     out: List[Tuple[str, PalBreedingModel]] = []
     for base_id in base_ids:
-        model = build_pal_breeding_model_by_id(base_id, rows=rows, en=en)
+        model = build_pal_breeding_model_by_id(base_id, rows=rows, en=en, combi=combi)
         if model:
             out.append((model.get("display_name", base_id), model))
 
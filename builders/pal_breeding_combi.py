@@ -0,0 +1,420 @@
+import os
+import sys
+import json
+import mmap
+import bisect
+import struct
+import itertools
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import constants
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+from utils.datastore_utils import get_datastore
+from utils.datatable_cache_utils import cached_file_path, save_cached_file
+from utils.json_datatable_utils import DataTableRecord
+
+#Paths
+param_input_file = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json")
+combi_unique_input_file = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalCombiUnique.json")
+
+# Columns of DT_PalMonsterParameter read by the breeding engine.
+PAL_COMBI_FIELDS = (
+    "Tribe",
+    "ZukanIndex",
+    "ZukanIndexSuffix",
+    "CombiRank",
+    "CombiDuplicatePriority",
+    "IgnoreCombi",
+)
+
+# Marks an empty cell in the child matrix (the roster is far smaller than this).
+NO_CHILD = 0xFFFF
+
+# Binary table file: magic, layout version, metadata length, roster size, parent pair entries.
+BREEDING_TABLE_CACHE_NAME = "breeding_table"
+_TABLE_MAGIC = b"PWBT"
+_TABLE_VERSION = 1
+_TABLE_HEADER = struct.Struct("<4sIIII")
+
+
+class UniqueCombo(TypedDict, total=False):
+    parent_a: str
+    gender_a: str
+    parent_b: str
+    gender_b: str
+    child: str
+
+
+def _after_double_colon(v: Any) -> str:
+    s = str(v or "").strip()
+    if "::" in s:
+        return s.split("::", 1)[1].strip()
+    return s
+
+def _to_int(v: Any) -> Optional[int]:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+def _gender_leaf(v: Any) -> str:
+    g = _after_double_colon(v)
+    return "" if g.lower() == "none" else g
+
+def _load_unique_combo_rows(path: str) -> Dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    return get_datastore().get_rows(path, source="DT_PalCombiUnique")
+
+def _build_tribe_map(rows: Dict[str, DataTableRecord]) -> Dict[str, str]:
+    """
+    Tribe leaf -> character id. The row named after the tribe wins; otherwise the first non-boss row.
+    """
+    out: Dict[str, str] = {}
+    for key, row in rows.items():
+        if key.startswith("BOSS_"):
+            continue
+        tribe = _after_double_colon(row.get("Tribe"))
+        if not tribe:
+            continue
+        if key == tribe or tribe not in out:
+            out[tribe] = key
+    return out
+
+def _parse_unique_combos(unique_rows: Dict[str, dict], tribe_map: Dict[str, str]) -> List[UniqueCombo]:
+    out: List[UniqueCombo] = []
+    for _, row in (unique_rows or {}).items():
+        if not isinstance(row, dict):
+            continue
+
+        tribe_a = _after_double_colon(row.get("ParentTribeA"))
+        tribe_b = _after_double_colon(row.get("ParentTribeB"))
+        child = str(row.get("ChildCharacterID") or "").strip()
+        if not tribe_a or not tribe_b or not child:
+            continue
+
+        out.append(
+            {
+                "parent_a": tribe_map.get(tribe_a, tribe_a),
+                "gender_a": _gender_leaf(row.get("ParentGenderA")),
+                "parent_b": tribe_map.get(tribe_b, tribe_b),
+                "gender_b": _gender_leaf(row.get("ParentGenderB")),
+                "child": child,
+            }
+        )
+    return out
+
+def _build_roster(rows: Dict[str, DataTableRecord]) -> List[str]:
+    """
+    Pals that take part in breeding, in Paldex order (as build_pal_order): a normal row with a BOSS_
+    twin, a Paldex number, a positive CombiRank and IgnoreCombi not set.
+    """
+    roster: List[Tuple[int, str, str]] = []
+    for key, row in rows.items():
+        if key.startswith("BOSS_") or f"BOSS_{key}" not in rows:
+            continue
+        if row.get("IgnoreCombi") is True:
+            continue
+
+        zukan = _to_int(row.get("ZukanIndex"))
+        rank = _to_int(row.get("CombiRank"))
+        if zukan is None or zukan <= 0 or rank is None or rank <= 0:
+            continue
+
+        suffix = "" if row.get("ZukanIndexSuffix") is None else str(row.get("ZukanIndexSuffix")).strip()
+        roster.append((zukan, suffix, key))
+
+    roster.sort(key=lambda x: (x[0], x[1]))
+    return [key for _, _, key in roster]
+
+
+class BreedingCombiTable:
+    """
+    Child for every parent pair of the breeding roster, plus the reverse "parents of X" lookup.
+
+    Rules:
+    - Same species always breeds true.
+    - A unique combo (DT_PalCombiUnique) wins over the rank rule. Gender-specific combos only apply for
+      that gender assignment, so they are kept beside the matrix rather than in it.
+    - Otherwise the child rank is floor((rank_a + rank_b + 1) / 2) and the child is the pal with the
+      nearest CombiRank; ties go to the lower CombiDuplicatePriority, then Paldex order. Pals that are
+      the child of a unique combo are never produced by the rank rule.
+
+    pal_ids is the roster in Paldex order and every index below is an ordinal into it.
+    matrix is a flat N x N uint16 sequence of child ordinals (NO_CHILD where empty); the reverse index
+    is CSR-style: parents of child c are the (a, b) pairs parent_pairs[2*offsets[c]:2*offsets[c+1]].
+    A table is either computed (build) or mapped from its binary cache file (from_buffer).
+    """
+
+    def __init__(
+        self,
+        *,
+        pal_ids: List[str],
+        matrix: Sequence[int],
+        unique_combos: List[UniqueCombo],
+        gendered: Dict[Tuple[int, int], List[Tuple[str, str, int]]],
+        offsets: Sequence[int],
+        parent_pairs: Sequence[int],
+    ) -> None:
+        self.pal_ids = pal_ids
+        self.index: Dict[str, int] = {pal_id: i for i, pal_id in enumerate(pal_ids)}
+        self.size = len(pal_ids)
+        self.matrix = matrix
+        self.unique_combos = unique_combos
+        # (i, j) -> [(gender_i, gender_j, child ordinal)] for gender-specific unique combos
+        self.gendered = gendered
+        self.offsets = offsets
+        self.parent_pairs = parent_pairs
+
+    @classmethod
+    def build(cls, rows: Dict[str, DataTableRecord], unique_rows: Dict[str, dict]) -> "BreedingCombiTable":
+        """
+        Compute the table from parameter records (PAL_COMBI_FIELDS) and DT_PalCombiUnique rows.
+
+        The rank rule is resolved once per distinct child rank via bisect over the sorted candidate
+        ranks, so filling the matrix is one dict lookup per pair.
+        """
+        pal_ids = _build_roster(rows)
+        index = {pal_id: i for i, pal_id in enumerate(pal_ids)}
+        n = len(pal_ids)
+        ranks = [_to_int(rows[p].get("CombiRank")) or 0 for p in pal_ids]
+
+        unique_combos = _parse_unique_combos(unique_rows, _build_tribe_map(rows))
+        unique_children = {c["child"] for c in unique_combos}
+
+        # (rank, priority, ordinal) of every pal the rank rule may produce.
+        candidates: List[Tuple[int, int, int]] = []
+        for i, pal_id in enumerate(pal_ids):
+            if pal_id in unique_children:
+                continue
+            priority = _to_int(rows[pal_id].get("CombiDuplicatePriority"))
+            candidates.append((ranks[i], priority if priority is not None else 0, i))
+        candidates.sort()
+        candidate_ranks = [c[0] for c in candidates]
+        child_by_rank: Dict[int, int] = {}
+
+        def child_for_rank(target: int) -> int:
+            cached = child_by_rank.get(target)
+            if cached is not None:
+                return cached
+
+            best: Optional[Tuple[int, int, int]] = None
+            hi = bisect.bisect_left(candidate_ranks, target)
+            if hi < len(candidate_ranks):
+                # first entry of the nearest group at or above target (already the best priority)
+                c = candidates[hi]
+                best = (c[0] - target, c[1], c[2])
+            if hi > 0:
+                c = candidates[bisect.bisect_left(candidate_ranks, candidate_ranks[hi - 1])]
+                key = (target - c[0], c[1], c[2])
+                if best is None or key < best:
+                    best = key
+
+            child = best[2] if best is not None else NO_CHILD
+            child_by_rank[target] = child
+            return child
+
+        matrix = array("H", [NO_CHILD]) * (n * n)
+        for i in range(n):
+            rank_i = ranks[i]
+            matrix[i * n + i] = i
+            for j in range(i + 1, n):
+                child = child_for_rank((rank_i + ranks[j] + 1) // 2)
+                matrix[i * n + j] = child
+                matrix[j * n + i] = child
+
+        gendered: Dict[Tuple[int, int], List[Tuple[str, str, int]]] = {}
+        for combo in unique_combos:
+            i = index.get(combo["parent_a"])
+            j = index.get(combo["parent_b"])
+            c = index.get(combo["child"])
+            if i is None or j is None or c is None:
+                continue
+
+            if combo["gender_a"] or combo["gender_b"]:
+                gendered.setdefault((i, j), []).append((combo["gender_a"], combo["gender_b"], c))
+                gendered.setdefault((j, i), []).append((combo["gender_b"], combo["gender_a"], c))
+            else:
+                matrix[i * n + j] = c
+                matrix[j * n + i] = c
+
+        # Reverse index over the upper triangle (unordered pairs), bucketed by child.
+        counts = [0] * (n + 1)
+        for i in range(n):
+            for k in matrix[i * n + i:(i + 1) * n]:
+                if k != NO_CHILD:
+                    counts[k + 1] += 1
+        offsets = array("I", itertools.accumulate(counts))
+        fill = list(offsets[:n])
+        parent_pairs = array("H", bytes(2 * 2 * offsets[n]))
+        for i in range(n):
+            row_start = i * n
+            for j in range(i, n):
+                k = matrix[row_start + j]
+                if k != NO_CHILD:
+                    pos = 2 * fill[k]
+                    parent_pairs[pos] = i
+                    parent_pairs[pos + 1] = j
+                    fill[k] += 1
+
+        return cls(
+            pal_ids=pal_ids,
+            matrix=matrix,
+            unique_combos=unique_combos,
+            gendered=gendered,
+            offsets=offsets,
+            parent_pairs=parent_pairs,
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Binary layout: header, JSON metadata, then the uint16 matrix, uint32 offsets and uint16
+        parent pairs, each 4-byte aligned and in native byte order (recorded in the metadata).
+        """
+        meta = {
+            "byteorder": sys.byteorder,
+            "pal_ids": self.pal_ids,
+            "unique_combos": self.unique_combos,
+            "gendered": [[i, j, ga, gb, c] for (i, j), entries in self.gendered.items() for ga, gb, c in entries],
+        }
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        meta_bytes += b" " * (-len(meta_bytes) % 4)
+
+        matrix = array("H", self.matrix).tobytes()
+        matrix += b"\0" * (-len(matrix) % 4)
+        offsets = array("I", self.offsets).tobytes()
+        pairs = array("H", self.parent_pairs).tobytes()
+
+        header = _TABLE_HEADER.pack(_TABLE_MAGIC, _TABLE_VERSION, len(meta_bytes), len(self.offsets) - 1, len(self.parent_pairs))
+        return header + meta_bytes + matrix + offsets + pairs
+
+    @classmethod
+    def from_buffer(cls, buf: Any) -> Optional["BreedingCombiTable"]:
+        """
+        Map a table written by to_bytes without copying (buf may be an mmap). None if buf is not a
+        table this version can read.
+        """
+        view = memoryview(buf)
+        if len(view) < _TABLE_HEADER.size:
+            return None
+
+        magic, version, meta_len, n, pair_len = _TABLE_HEADER.unpack_from(view, 0)
+        if magic != _TABLE_MAGIC or version != _TABLE_VERSION:
+            return None
+
+        pos = _TABLE_HEADER.size
+        try:
+            meta = json.loads(bytes(view[pos:pos + meta_len]).decode("utf-8"))
+        except ValueError:
+            return None
+        if meta.get("byteorder") != sys.byteorder or len(meta.get("pal_ids") or []) != n:
+            return None
+        pos += meta_len
+
+        matrix_len = 2 * n * n
+        offsets_at = pos + matrix_len + (-matrix_len % 4)
+        pairs_at = offsets_at + 4 * (n + 1)
+        if len(view) != pairs_at + 2 * pair_len:
+            return None
+
+        gendered: Dict[Tuple[int, int], List[Tuple[str, str, int]]] = {}
+        for i, j, ga, gb, c in meta.get("gendered") or []:
+            gendered.setdefault((i, j), []).append((ga, gb, c))
+
+        return cls(
+            pal_ids=list(meta["pal_ids"]),
+            matrix=view[pos:pos + matrix_len].cast("H"),
+            unique_combos=list(meta.get("unique_combos") or []),
+            gendered=gendered,
+            offsets=view[offsets_at:pairs_at].cast("I"),
+            parent_pairs=view[pairs_at:].cast("H"),
+        )
+
+    def child_of(self, parent_a: str, parent_b: str, *, gender_a: str = "", gender_b: str = "") -> str:
+        """
+        Child id for two parents ("" if either parent cannot breed). Genders only matter for
+        gender-specific unique combos.
+        """
+        i = self.index.get(parent_a)
+        j = self.index.get(parent_b)
+        if i is None or j is None:
+            return ""
+
+        for ga, gb, c in self.gendered.get((i, j), []):
+            if (not ga or ga == gender_a) and (not gb or gb == gender_b):
+                return self.pal_ids[c]
+
+        c = self.matrix[i * self.size + j]
+        return "" if c == NO_CHILD else self.pal_ids[c]
+
+    def parent_pairs_of(self, child: str) -> List[Tuple[str, str]]:
+        """
+        Every unordered parent pair (in Paldex order) whose gender-independent result is child.
+        """
+        c = self.index.get(child)
+        if c is None:
+            return []
+
+        pairs = self.parent_pairs[2 * self.offsets[c]:2 * self.offsets[c + 1]]
+        return [(self.pal_ids[pairs[k]], self.pal_ids[pairs[k + 1]]) for k in range(0, len(pairs), 2)]
+
+    def unique_combos_for(self, child: str) -> List[UniqueCombo]:
+        return [combo for combo in self.unique_combos if combo["child"] == child]
+
+
+def _map_table_file(path: str) -> Optional[BreedingCombiTable]:
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    return BreedingCombiTable.from_buffer(mm)
+
+def load_breeding_combi_table(
+    *,
+    param_path: str = param_input_file,
+    unique_path: str = combi_unique_input_file,
+) -> BreedingCombiTable:
+    """
+    Map the precomputed table file if it was built from the current input files (same PATCH_VERSION,
+    unchanged parameter and unique-combo tables); otherwise compute the table and rewrite the file.
+    """
+    sources = [param_path] + ([unique_path] if os.path.exists(unique_path) else [])
+
+    path = cached_file_path(BREEDING_TABLE_CACHE_NAME, sources)
+    if path is not None:
+        table = _map_table_file(path)
+        if table is not None:
+            return table
+
+    rows = get_datastore().get_records(param_path, PAL_COMBI_FIELDS, source="DT_PalMonsterParameter")
+    table = BreedingCombiTable.build(rows, _load_unique_combo_rows(unique_path))
+    save_cached_file(BREEDING_TABLE_CACHE_NAME, sources, table.to_bytes())
+    return table
+
+
+_CACHED_BREEDING_COMBI_TABLE: Optional[Tuple[Tuple[Tuple[str, int], ...], BreedingCombiTable]] = None
+
+def _source_key(*paths: str) -> Tuple[Tuple[str, int], ...]:
+    return tuple((p, os.stat(p).st_mtime_ns if os.path.exists(p) else -1) for p in paths)
+
+def get_breeding_combi_table(
+    *,
+    param_path: str = param_input_file,
+    unique_path: str = combi_unique_input_file,
+) -> BreedingCombiTable:
+    """
+    Shared BreedingCombiTable for this process; reloaded only when an input file changes on disk.
+    """
+    global _CACHED_BREEDING_COMBI_TABLE
+    key = _source_key(param_path, unique_path)
+
+    cached = _CACHED_BREEDING_COMBI_TABLE
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    table = load_breeding_combi_table(param_path=param_path, unique_path=unique_path)
+    _CACHED_BREEDING_COMBI_TABLE = (key, table)
+    return table
@@ -0,0 +1,177 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
+from builders.pal_breeding_combi import NO_CHILD, BreedingCombiTable, get_breeding_combi_table
+
+
+class BreedingStep(TypedDict, total=False):
+    generation: int
+    parent_a: str
+    parent_b: str
+    child: str
+
+
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+def _iter_bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BreedingPathFinder:
+    """
+    Shortest breeding chains over a BreedingCombiTable.
+
+    Pal sets are int bitsets over roster ordinals. For every parent a, children[a] maps each child c
+    that a can produce to the bitset of partners b with a x b -> c (gender-specific unique combos
+    included, assuming either gender is available). A search expands the owned set one generation at a
+    time, only trying pairs where one parent was gained in the previous generation, so a full search
+    touches each (parent, child) entry about once. The expansion for an owned set is kept, so asking
+    for several targets from the same pals costs one search.
+    """
+
+    _MAX_CACHED_SEARCHES = 64
+
+    def __init__(self, table: BreedingCombiTable) -> None:
+        self.table = table
+        n = table.size
+
+        children: List[Dict[int, int]] = [{} for _ in range(n)]
+        matrix = table.matrix
+        for a in range(n):
+            row_start = a * n
+            by_child = children[a]
+            for b in range(n):
+                c = matrix[row_start + b]
+                if c != NO_CHILD and c != a and c != b:
+                    by_child[c] = by_child.get(c, 0) | (1 << b)
+
+        for (a, b), entries in table.gendered.items():
+            for _, _, c in entries:
+                if c != a and c != b:
+                    children[a][c] = children[a].get(c, 0) | (1 << b)
+
+        self.children = children
+        # owned bitset -> {child ordinal: (generation, parent a, parent b)}
+        self._searches: Dict[int, Dict[int, Tuple[int, int, int]]] = {}
+
+    def _mask(self, pal_ids: Iterable[str]) -> int:
+        mask = 0
+        for pal_id in pal_ids:
+            i = self.table.index.get(pal_id)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def _search(self, owned: int) -> Dict[int, Tuple[int, int, int]]:
+        cached = self._searches.get(owned)
+        if cached is not None:
+            return cached
+
+        via: Dict[int, Tuple[int, int, int]] = {}
+        reach = owned
+        frontier = owned
+        generation = 0
+
+        while frontier:
+            generation += 1
+            gained = 0
+
+            # The table is symmetric, so pairs (old, new) are found from the new parent's side.
+            for a in _iter_bits(frontier):
+                for c, partner_mask in self.children[a].items():
+                    if (reach | gained) >> c & 1:
+                        continue
+                    usable = partner_mask & reach
+                    if usable:
+                        via[c] = (generation, a, _lowest_bit(usable))
+                        gained |= 1 << c
+
+            reach |= gained
+            frontier = gained
+
+        if len(self._searches) >= self._MAX_CACHED_SEARCHES:
+            self._searches.clear()
+        self._searches[owned] = via
+        return via
+
+    def reachable(self, owned: Iterable[str]) -> List[str]:
+        """
+        Every pal that can eventually be bred from owned (owned pals excluded), in Paldex order.
+        """
+        via = self._search(self._mask(owned))
+        return [self.table.pal_ids[c] for c in sorted(via)]
+
+    def find_path(
+        self,
+        target: str,
+        owned: Iterable[str],
+        *,
+        max_generations: Optional[int] = None,
+    ) -> Optional[List[BreedingStep]]:
+        """
+        Fewest-generation chain of breeding steps that produces target from owned pals.
+
+        Returns the steps in breeding order ([] if target is already owned), or None if target cannot
+        be reached (within max_generations, if given). Each bred pal is produced once and reused by
+        later steps.
+        """
+        table = self.table
+        goal = table.index.get(target)
+        if goal is None:
+            return None
+
+        owned_mask = self._mask(owned)
+        if owned_mask >> goal & 1:
+            return []
+
+        via = self._search(owned_mask)
+        if goal not in via:
+            return None
+        if max_generations is not None and via[goal][0] > max_generations:
+            return None
+
+        steps: List[Tuple[int, int, int, int]] = []
+        seen: set = set()
+        stack = [goal]
+        while stack:
+            c = stack.pop()
+            if c in seen or c not in via:
+                continue
+            seen.add(c)
+            gen, a, b = via[c]
+            steps.append((gen, c, a, b))
+            stack.extend((a, b))
+
+        steps.sort()
+        pal_ids = table.pal_ids
+        return [
+            {"generation": gen, "parent_a": pal_ids[a], "parent_b": pal_ids[b], "child": pal_ids[c]}
+            for gen, c, a, b in steps
+        ]
+
+
+_CACHED_BREEDING_PATH_FINDER: Optional[BreedingPathFinder] = None
+
+def get_breeding_path_finder() -> BreedingPathFinder:
+    """
+    Shared BreedingPathFinder; rebuilt only when the breeding table is reloaded.
+    """
+    global _CACHED_BREEDING_PATH_FINDER
+    table = get_breeding_combi_table()
+
+    cached = _CACHED_BREEDING_PATH_FINDER
+    if cached is not None and cached.table is table:
+        return cached
+
+    _CACHED_BREEDING_PATH_FINDER = BreedingPathFinder(table)
+    return _CACHED_BREEDING_PATH_FINDER
+
+def find_breeding_path(target: str, owned: Iterable[str], *, max_generations: Optional[int] = None) -> Optional[List[BreedingStep]]:
+    return get_breeding_path_finder().find_path(target, owned, max_generations=max_generations)
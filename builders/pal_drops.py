@@ -1,13 +1,13 @@
 import os
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from array import array
 from config import constants
-from typing import Any, List, Tuple, TypedDict
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypedDict
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
 
 #Paths
 param_input_file = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json")
@@ -21,9 +21,34 @@ class PalDropsModel(TypedDict, total=False):
     normal_drops: str
     alpha_drops: str
 
+class PalDropYield(TypedDict, total=False):
+    item_id: str
+    chance: float               # 0..1 per kill
+    min_qty: int
+    max_qty: int
+    expected_per_kill: float
+
+class PalDropYieldModel(TypedDict, total=False):
+    base_id: str
+    pal_name: str
+    normal: List[PalDropYield]
+    alpha: List[PalDropYield]
+    normal_expected_per_kill: float
+    alpha_expected_per_kill: float
+
+class PalItemYieldRank(TypedDict, total=False):
+    character_id: str
+    base_id: str
+    pal_name: str
+    is_alpha: bool
+    expected_per_kill: float
+    items_per_hour: float
+
+#Settings
+DEFAULT_KILLS_PER_HOUR = 60.0
+
 def load_json(path: str):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_datastore().get_json(path)
 
 def zukan_no(zukan_index: Any, zukan_suffix: Any) -> str:
     if zukan_index is None:
@@ -126,6 +151,186 @@ def index_drop_rows_by_character_id(drop_rows: dict) -> dict:
 
     return by_id
 
+def index_drop_rows_by_character_level(drop_rows: dict) -> Dict[str, List[Tuple[int, dict]]]:
+    """
+    CharacterID -> [(Level, row)] sorted by Level. A row applies from its Level upward, until the next one.
+    """
+    by_id: Dict[str, List[Tuple[int, dict]]] = {}
+    for _, row in (drop_rows or {}).items():
+        if not isinstance(row, dict):
+            continue
+
+        character_id = row.get("CharacterID")
+        if not character_id:
+            continue
+
+        try:
+            level_int = int(row.get("Level", 0))
+        except Exception:
+            level_int = 0
+
+        by_id.setdefault(str(character_id).strip(), []).append((level_int, row))
+
+    for rows in by_id.values():
+        rows.sort(key=lambda x: x[0])
+    return by_id
+
+def drop_row_for_level(rows_by_level: List[Tuple[int, dict]], level: int) -> Optional[dict]:
+    chosen = None
+    for row_level, row in rows_by_level:
+        if row_level > level:
+            break
+        chosen = row
+    return chosen
+
+def _iter_drop_slots(drop_row: dict) -> Iterator[Tuple[str, float, int, int]]:
+    """
+    (item_id, chance 0..1, min, max) for every usable ItemIdN slot, with the same filters as extract_drop_list.
+    """
+    for i in range(1, 11):
+        item_id = drop_row.get(f"ItemId{i}")
+        if not item_id or str(item_id).lower() == "none":
+            continue
+
+        try:
+            rate_f = float(drop_row.get(f"Rate{i}"))
+        except Exception:
+            rate_f = 0.0
+        if rate_f <= 0:
+            continue
+
+        try:
+            min_int = int(drop_row.get(f"min{i}"))
+            max_int = int(drop_row.get(f"Max{i}"))
+        except Exception:
+            continue
+        if min_int <= 0 and max_int <= 0:
+            continue
+
+        yield str(item_id).strip(), min(rate_f, 100.0) / 100.0, min_int, max(min_int, max_int)
+
+def drop_yields_from_row(drop_row: Optional[dict]) -> List[PalDropYield]:
+    if not isinstance(drop_row, dict):
+        return []
+
+    out: List[PalDropYield] = []
+    for item_id, chance, min_int, max_int in _iter_drop_slots(drop_row):
+        out.append({
+            "item_id": item_id,
+            "chance": chance,
+            "min_qty": min_int,
+            "max_qty": max_int,
+            "expected_per_kill": chance * (min_int + max_int) / 2.0,
+        })
+    return out
+
+def build_pal_drop_yield_model_by_id(
+    base_id: str,
+    *,
+    drops_by_character_id: dict,
+    en: EnglishText,
+) -> PalDropYieldModel:
+    """
+    Numeric counterpart of build_pal_drops_model_by_id: expected items per kill, normal vs alpha.
+    Amounts are assumed uniform over min..max.
+    """
+    normal = drop_yields_from_row(drops_by_character_id.get(base_id))
+    alpha = drop_yields_from_row(drops_by_character_id.get(f"BOSS_{base_id}"))
+
+    return {
+        "base_id": base_id,
+        "pal_name": get_pal_display_name(en, base_id),
+        "normal": normal,
+        "alpha": alpha,
+        "normal_expected_per_kill": sum(y.get("expected_per_kill", 0.0) for y in normal),
+        "alpha_expected_per_kill": sum(y.get("expected_per_kill", 0.0) for y in alpha),
+    }
+
+class DropYieldTable:
+    """
+    Every (character, item) drop slot of DT_PalDropItem as parallel columns, for one kill level.
+
+    Built in a single pass over the drop rows; item_positions maps an item id to its slot positions so
+    ranking all pals for one item only touches the rows that can drop it.
+    """
+
+    def __init__(self, drop_rows: dict, *, level: int = 0) -> None:
+        self.drop_rows = drop_rows
+        self.level = level
+
+        self.character_ids: List[str] = []
+        self.item_ids: List[str] = []
+        self.expected_per_kill = array("d")
+        self.item_positions: Dict[str, List[int]] = {}
+
+        for character_id, rows_by_level in index_drop_rows_by_character_level(drop_rows).items():
+            row = drop_row_for_level(rows_by_level, level)
+            if row is None:
+                continue
+            for item_id, chance, min_int, max_int in _iter_drop_slots(row):
+                self.item_positions.setdefault(item_id, []).append(len(self.item_ids))
+                self.character_ids.append(character_id)
+                self.item_ids.append(item_id)
+                self.expected_per_kill.append(chance * (min_int + max_int) / 2.0)
+
+    def expected_by_character(self, item_id: str) -> Dict[str, float]:
+        out: Dict[str, float] = {}
+        for pos in self.item_positions.get(str(item_id).strip(), []):
+            cid = self.character_ids[pos]
+            out[cid] = out.get(cid, 0.0) + self.expected_per_kill[pos]
+        return out
+
+_CACHED_DROP_YIELD_TABLES: Dict[int, DropYieldTable] = {}
+
+def get_drop_yield_table(drop_rows: dict, *, level: int = 0) -> DropYieldTable:
+    cached = _CACHED_DROP_YIELD_TABLES.get(level)
+    if cached is not None and cached.drop_rows is drop_rows:
+        return cached
+
+    table = DropYieldTable(drop_rows, level=level)
+    _CACHED_DROP_YIELD_TABLES[level] = table
+    return table
+
+def rank_pals_by_item_yield(
+    item_id: str,
+    *,
+    level: int = 0,
+    include_alpha: bool = True,
+    kills_per_hour: float = DEFAULT_KILLS_PER_HOUR,
+    kills_per_hour_by_character: Optional[Dict[str, float]] = None,
+    en: Optional[EnglishText] = None,
+) -> List[PalItemYieldRank]:
+    """
+    Pals ranked by expected item_id per hour, best first.
+
+    kills_per_hour is a flat farming rate; kills_per_hour_by_character overrides it per CharacterID
+    (e.g. slower alphas). Drop rows are chosen for the given kill level.
+    """
+    en = en or get_english_text()
+    drop_rows = get_datastore().get_rows(drop_input_file, source="DT_PalDropItem")
+    table = get_drop_yield_table(drop_rows, level=level)
+    overrides = kills_per_hour_by_character or {}
+
+    out: List[PalItemYieldRank] = []
+    for character_id, expected in table.expected_by_character(item_id).items():
+        is_alpha = character_id.startswith("BOSS_")
+        if is_alpha and not include_alpha:
+            continue
+
+        base_id = character_id[len("BOSS_"):] if is_alpha else character_id
+        rate = overrides.get(character_id, kills_per_hour)
+        out.append({
+            "character_id": character_id,
+            "base_id": base_id,
+            "pal_name": get_pal_display_name(en, base_id),
+            "is_alpha": is_alpha,
+            "expected_per_kill": expected,
+            "items_per_hour": expected * rate,
+        })
+
+    out.sort(key=lambda r: (-r["items_per_hour"], r["pal_name"].casefold(), r["is_alpha"]))
+    return out
+
 def build_pal_order(param_rows: dict) -> List[str]:
     pal_order = []
     for key, row in (param_rows or {}).items():
@@ -170,13 +375,11 @@ def build_pal_drops_model_by_id(
     }
 
 def build_all_pal_drops_models() -> List[Tuple[str, PalDropsModel]]:
-    en = EnglishText()
-
-    param_data = load_json(param_input_file)
-    drop_data = load_json(drop_input_file)
+    en = get_english_text()
 
-    param_rows = extract_datatable_rows(param_data, source="DT_PalMonsterParameter")
-    drop_rows = extract_datatable_rows(drop_data, source="DT_PalDropItem")
+    store = get_datastore()
+    param_rows = store.get_rows(param_input_file, source="DT_PalMonsterParameter")
+    drop_rows = store.get_rows(drop_input_file, source="DT_PalDropItem")
 
     drops_by_character_id = index_drop_rows_by_character_id(drop_rows)
     base_ids = build_pal_order(param_rows)
@@ -1,16 +1,20 @@
 import os
 import sys
 import re
-import json
+import math
+import bisect
+import operator
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
+from array import array
 from typing import Dict, List, Optional, Tuple, Any, TypedDict
 from config.name_map import WORK_SUITABILITY_MAP, ELEMENT_NAME_MAP
 from config.partner_skill_icon_map import PARTNER_SKILL_ICON_RULES
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText, clean_english_text
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, clean_english_text, get_english_text
+from utils.json_datatable_utils import DATATABLE_ROW_TYPES, DataTableRecord
 
 #Paths
 param_input_file = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json")
@@ -18,6 +22,9 @@ active_skill_input_file = os.path.join(constants.INPUT_DIRECTORY, "Waza", "DT_Wa
 pal_activate_text_input_file = constants.EN_PAL_ACTIVATE_FILE
 partner_skill_name_text_input_file = constants.EN_SKILL_NAME_FILE
 
+# Columns of DT_WazaMasterLevel read by build_waza_master_index.
+WAZA_MASTER_FIELDS = ("PalId", "WazaID", "Level")
+
 #Mapping
 STATS_MAP = {
     "Hp": "hp",
@@ -97,9 +104,10 @@ def sell_price_from_buy(v: Any) -> str:
         return ""
 
 def load_rows(path: str, *, source: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return extract_datatable_rows(data, source=source)
+    return get_datastore().get_rows(path, source=source)
+
+def load_waza_master_records(path: str = active_skill_input_file) -> Dict[str, DataTableRecord]:
+    return get_datastore().get_records(path, WAZA_MASTER_FIELDS, source="DT_WazaMasterLevel")
 
 def fmt(v: Any) -> str:
     if v is None:
@@ -108,6 +116,11 @@ def fmt(v: Any) -> str:
         return repr(v)
     return str(v)
 
+def _stat_float(v: Any) -> float:
+    if isinstance(v, (int, float)):
+        return float(v)
+    return math.nan
+
 def after_double_colon(v: Any) -> str:
     if v is None:
         return ""
@@ -184,7 +197,7 @@ def build_work_suitability(row: dict) -> str:
 def build_waza_master_index(waza_rows: dict) -> Dict[str, List[Tuple[int, str]]]:
     by_pal_id: Dict[str, List[Tuple[int, str]]] = {}
     for _, row in (waza_rows or {}).items():
-        if not isinstance(row, dict):
+        if not isinstance(row, DATATABLE_ROW_TYPES):
             continue
 
         pal_id = row.get("PalId")
@@ -259,6 +272,153 @@ def build_pal_order(rows: dict) -> List[str]:
     pal_order.sort(key=lambda x: (int(x[0][:3]), x[0][3:]))
     return [base for _, base in pal_order]
 
+class PalStatTable:
+    """
+    Columnar view of the STATS_MAP columns of DT_PalMonsterParameter.
+
+    One row per pal that has both a normal and a BOSS_ entry. Each stat is an array('d') column for
+    the normal and the alpha values (NaN where the cell is missing or not numeric), so comparisons
+    across all pals (alpha deltas, rankings, percentiles, per-element ranges) are single passes over
+    flat arrays. The infobox text is formatted once per cell at build time and read back by index.
+    """
+
+    def __init__(self, rows: dict) -> None:
+        self.rows = rows
+        self.base_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.elements: List[str] = []
+
+        self.normal: Dict[str, array] = {param: array("d") for param in STATS_MAP.values()}
+        self.boss: Dict[str, array] = {param: array("d") for param in STATS_MAP.values()}
+        self._normal_text: Dict[str, List[str]] = {param: [] for param in STATS_MAP.values()}
+        self._boss_text: Dict[str, List[str]] = {param: [] for param in STATS_MAP.values()}
+        # 1 where the alpha value differs from the normal one (alpha-eligible stats only).
+        self._alpha_differs: Dict[str, bytearray] = {
+            param: bytearray() for param in STATS_MAP.values() if param in ALPHA_ELIGIBLE_PARAMS
+        }
+
+        for key, boss in (rows or {}).items():
+            if not isinstance(key, str) or not key.startswith("BOSS_"):
+                continue
+
+            base = key.replace("BOSS_", "")
+            normal = rows.get(base)
+            if not isinstance(normal, dict) or not isinstance(boss, dict):
+                continue
+
+            self.index[base] = len(self.base_ids)
+            self.base_ids.append(base)
+            self.elements.append(normalize_element(after_double_colon(normal.get("ElementType1"))))
+
+            for json_key, param in STATS_MAP.items():
+                normal_val = normal.get(json_key)
+                boss_val = boss.get(json_key)
+
+                self.normal[param].append(_stat_float(normal_val))
+                self.boss[param].append(_stat_float(boss_val))
+                self._normal_text[param].append(fmt(normal_val))
+                self._boss_text[param].append(fmt(boss_val))
+
+                differs = self._alpha_differs.get(param)
+                if differs is not None:
+                    differs.append(1 if normal_val != boss_val else 0)
+
+    def __len__(self) -> int:
+        return len(self.base_ids)
+
+    def stats_for(self, base: str) -> Optional[Tuple[Dict[str, str], Dict[str, str]]]:
+        """
+        Return (stats, alpha_stats) infobox text for base, or None if base is not in the table.
+        """
+        i = self.index.get(base)
+        if i is None:
+            return None
+
+        stats: Dict[str, str] = {}
+        alpha_stats: Dict[str, str] = {}
+        for param in STATS_MAP.values():
+            stats[param] = self._normal_text[param][i]
+
+            differs = self._alpha_differs.get(param)
+            if differs is not None and differs[i]:
+                alpha_stats[param] = self._boss_text[param][i]
+
+        return stats, alpha_stats
+
+    def alpha_delta(self, param: str) -> array:
+        """
+        Alpha minus normal value of param for every pal, in base_ids order.
+        """
+        return array("d", map(operator.sub, self.boss[param], self.normal[param]))
+
+    def ranks(self, param: str, *, alpha: bool = False, descending: bool = True) -> Dict[str, int]:
+        """
+        Competition rank (1 = best, ties share a rank) of every pal with a numeric value for param.
+        """
+        column = (self.boss if alpha else self.normal)[param]
+        order = sorted(
+            (i for i, v in enumerate(column) if not math.isnan(v)),
+            key=column.__getitem__,
+            reverse=descending,
+        )
+
+        out: Dict[str, int] = {}
+        prev: Optional[float] = None
+        rank = 0
+        for pos, i in enumerate(order, start=1):
+            v = column[i]
+            if v != prev:
+                rank = pos
+                prev = v
+            out[self.base_ids[i]] = rank
+        return out
+
+    def percentiles(self, param: str, *, alpha: bool = False) -> Dict[str, float]:
+        """
+        Percentile (0-100, share of pals with a value <= this one) of every pal with a numeric value.
+        """
+        column = (self.boss if alpha else self.normal)[param]
+        values = sorted(v for v in column if not math.isnan(v))
+        n = len(values)
+        if n == 0:
+            return {}
+
+        out: Dict[str, float] = {}
+        for i, v in enumerate(column):
+            if not math.isnan(v):
+                out[self.base_ids[i]] = 100.0 * bisect.bisect_right(values, v) / n
+        return out
+
+    def min_max_by_element(self, param: str, *, alpha: bool = False) -> Dict[str, Tuple[float, float]]:
+        """
+        (min, max) of param per primary element, ignoring non-numeric cells.
+        """
+        column = (self.boss if alpha else self.normal)[param]
+        out: Dict[str, Tuple[float, float]] = {}
+        for element, v in zip(self.elements, column):
+            if math.isnan(v):
+                continue
+            cur = out.get(element)
+            if cur is None:
+                out[element] = (v, v)
+            else:
+                out[element] = (min(cur[0], v), max(cur[1], v))
+        return out
+
+_CACHED_PAL_STAT_TABLE: Optional[PalStatTable] = None
+
+def get_pal_stat_table(rows: dict) -> PalStatTable:
+    """
+    PalStatTable for rows; rebuilt only when a different rows mapping is passed in.
+    """
+    global _CACHED_PAL_STAT_TABLE
+    cached = _CACHED_PAL_STAT_TABLE
+    if cached is not None and cached.rows is rows:
+        return cached
+
+    _CACHED_PAL_STAT_TABLE = PalStatTable(rows)
+    return _CACHED_PAL_STAT_TABLE
+
 def _replace_charactername_tags(text: str, english: EnglishText) -> str:
     s = str(text or "")
 
@@ -379,6 +539,7 @@ def build_pal_infobox_model_by_id(
     en: EnglishText,
     pal_activate_rows: dict,
     partner_skill_name_rows: dict,
+    stat_table: Optional[PalStatTable] = None,
 ) -> PalInfoboxModel:
     normal = rows.get(base)
     boss = rows.get(f"BOSS_{base}")
@@ -419,17 +580,10 @@ def build_pal_infobox_model_by_id(
 
     active_skills = build_active_skills(base, normal, waza_by_pal_id, en)
 
-    stats: Dict[str, str] = {}
-    alpha_stats: Dict[str, str] = {}
-
-    for json_key, param in STATS_MAP.items():
-        normal_val = normal.get(json_key)
-        boss_val = boss.get(json_key)
-
-        stats[param] = fmt(normal_val)
+    if stat_table is None:
+        stat_table = get_pal_stat_table(rows)
 
-        if param in ALPHA_ELIGIBLE_PARAMS and normal_val != boss_val:
-            alpha_stats[param] = fmt(boss_val)
+    stats, alpha_stats = stat_table.stats_for(base) or ({}, {})
 
     model: PalInfoboxModel = {
         "base_id": base,
@@ -457,13 +611,13 @@ def build_pal_infobox_model_by_id(
 
 def build_all_pal_infobox_models() -> List[Tuple[str, PalInfoboxModel]]:
     rows = load_rows(param_input_file, source="DT_PalMonsterParameter")
-    waza_rows = load_rows(active_skill_input_file, source="DT_WazaMasterLevel")
+    waza_rows = load_waza_master_records()
 
     pal_activate_rows = load_rows(pal_activate_text_input_file, source="DT_PalFirstActivatedInfoText")
     partner_skill_name_rows = load_rows(partner_skill_name_text_input_file, source="DT_SkillNameText_Common")
 
     waza_by_pal_id = build_waza_master_index(waza_rows)
-    en = EnglishText()
+    en = get_english_text()
 
     base_names = build_pal_order(rows)
 
@@ -3,12 +3,13 @@ import os
 
 from config import constants
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from utils.english_text_utils import EnglishText, clean_english_text
-from utils.json_datatable_utils import extract_datatable_rows
-from builders.pal_drops import (load_json, index_drop_rows_by_character_id, build_pal_drops_model_by_id)
-from builders.pal_infobox import (load_rows, build_waza_master_index, build_pal_infobox_model_by_id, after_double_colon, normalize_element)
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from utils.english_text_utils import EnglishText, clean_english_text, get_english_text
+from utils.json_datatable_utils import DataTableRecord
+from builders.pal_drops import (index_drop_rows_by_character_id, build_pal_drops_model_by_id)
+from builders.pal_infobox import (load_rows, load_waza_master_records, build_waza_master_index, build_pal_infobox_model_by_id, after_double_colon, normalize_element)
 from builders.pal_breeding import (build_pal_breeding_model_by_id)
+from builders.pal_breeding_path import BreedingStep, find_breeding_path
 from exports.export_pal_infoboxes import render_pal_infobox
 from exports.export_pal_drops import render_pal_drops
 from exports.export_pal_breeding import render_pal_breeding
@@ -21,6 +22,8 @@ _PAL_ACTIVATE_TEXT_INPUT_FILE = constants.EN_PAL_ACTIVATE_FILE
 _PARTNER_SKILL_NAME_TEXT_INPUT_FILE = constants.EN_SKILL_NAME_FILE
 
 
+_CACHED_PAL_PAGE_CONTEXT: Optional["PalPageContext"] = None
+
 _CHARACTER_NAME_TAG_RE = re.compile(r"<characterName\b[^|>]*\|([^|>]+)\|/>", flags=re.IGNORECASE,)
 
 
@@ -52,6 +55,9 @@ class PalPageOptions:
     include_characteristics: bool = True
     include_drops: bool = True
     include_breeding: bool = True
+    # "How to breed" chain from these pal ids (e.g. what the reader is assumed to own).
+    include_breeding_path: bool = False
+    breeding_path_owned: Tuple[str, ...] = ()
 
 AI_BEHAVIOR_TEMPLATES: Dict[str, str] = {
     "Friendly": (
@@ -129,6 +135,18 @@ def _extract_template_block(wikitext: str, template_name: str) -> str:
 
     return "\n".join(lines[start : end + 1]).rstrip()
 
+def _render_breeding_path(steps: List[BreedingStep], en: EnglishText) -> str:
+    def link(pal_id: str) -> str:
+        return f"[[{en.get_pal_name(pal_id) or pal_id}]]"
+
+    lines = ["===How to breed==="]
+    for step in steps:
+        lines.append(
+            f"# Generation {step.get('generation', '')}: "
+            f"{link(step.get('parent_a', ''))} + {link(step.get('parent_b', ''))} = {link(step.get('child', ''))}"
+        )
+    return "\n".join(lines)
+
 def build_pal_page_sections(
     base_id: str,
     *,
@@ -225,6 +243,11 @@ def build_pal_page_sections(
         breeding_full = render_pal_breeding(breeding_model, include_header=False)
         sections["breeding"] = _extract_template_block(breeding_full, "Breeding")
 
+        if options.include_breeding_path and options.breeding_path_owned:
+            steps = find_breeding_path(base_id, options.breeding_path_owned)
+            if steps:
+                sections["breeding_path"] = _render_breeding_path(steps, en)
+
     if options.include_history_section:
         sections["history"] = "\n".join(
             [
@@ -322,6 +345,10 @@ def build_pal_page_wikitext(
         if breeding:
             out.append(breeding)
 
+        breeding_path = sections.get("breeding_path", "").strip()
+        if breeding_path:
+            out.append(breeding_path)
+
         out.append("")
 
     if options.include_placeholders:
@@ -344,32 +371,90 @@ def build_pal_page_wikitext(
 
     return "\n".join(out).rstrip() + "\n"
 
-def build_pal_page_from_files(
-    base_id: str,
-    *,
-    options: Optional[PalPageOptions] = None,
-) -> str:
-    en = EnglishText()
+@dataclass
+class PalPageContext:
+    """
+    Everything build_pal_page_wikitext needs besides the pal id; load once, build many pages.
+    """
+    rows: Dict[str, dict]
+    drop_rows: Dict[str, dict]
+    waza_rows: Dict[str, DataTableRecord]
+    waza_by_pal_id: Dict[str, list]
+    drops_by_character_id: Dict[str, dict]
+    pal_activate_rows: dict
+    partner_skill_name_rows: dict
+    en: EnglishText
+
+def load_pal_page_context() -> PalPageContext:
+    """
+    Load the input tables and build the per-pal indexes used by the page builder.
+    Reuses the previous context while the DataStore keeps serving the same rows.
+    """
+    global _CACHED_PAL_PAGE_CONTEXT
 
     rows = load_rows(PARAM_INPUT_FILE, source="DT_PalMonsterParameter")
-
-    waza_rows = load_rows(ACTIVE_SKILL_INPUT_FILE, source="DT_WazaMasterLevel")
-    waza_by_pal_id = build_waza_master_index(waza_rows)
-
+    drop_rows = load_rows(DROP_INPUT_FILE, source="DT_PalDropItem")
+    waza_rows = load_waza_master_records(ACTIVE_SKILL_INPUT_FILE)
     pal_activate_rows = load_rows(_PAL_ACTIVATE_TEXT_INPUT_FILE, source="DT_PalFirstActivatedInfoText")
     partner_skill_name_rows = load_rows(_PARTNER_SKILL_NAME_TEXT_INPUT_FILE, source="DT_SkillNameText_Common")
 
-    drop_data = load_json(DROP_INPUT_FILE)
-    drop_rows = extract_datatable_rows(drop_data, source="DT_PalDropItem")
-    drops_by_character_id = index_drop_rows_by_character_id(drop_rows)
-
-    return build_pal_page_wikitext(
-        base_id,
+    cached = _CACHED_PAL_PAGE_CONTEXT
+    if (
+        cached is not None
+        and cached.rows is rows
+        and cached.drop_rows is drop_rows
+        and cached.waza_rows is waza_rows
+        and cached.pal_activate_rows is pal_activate_rows
+        and cached.partner_skill_name_rows is partner_skill_name_rows
+    ):
+        return cached
+
+    _CACHED_PAL_PAGE_CONTEXT = PalPageContext(
         rows=rows,
-        waza_by_pal_id=waza_by_pal_id,
-        drops_by_character_id=drops_by_character_id,
+        drop_rows=drop_rows,
+        waza_rows=waza_rows,
+        waza_by_pal_id=build_waza_master_index(waza_rows),
+        drops_by_character_id=index_drop_rows_by_character_id(drop_rows),
         pal_activate_rows=pal_activate_rows,
         partner_skill_name_rows=partner_skill_name_rows,
-        en=en,
+        en=get_english_text(),
+    )
+    return _CACHED_PAL_PAGE_CONTEXT
+
+def build_pal_page_from_context(
+    base_id: str,
+    *,
+    context: PalPageContext,
+    options: Optional[PalPageOptions] = None,
+) -> str:
+    return build_pal_page_wikitext(
+        base_id,
+        rows=context.rows,
+        waza_by_pal_id=context.waza_by_pal_id,
+        drops_by_character_id=context.drops_by_character_id,
+        pal_activate_rows=context.pal_activate_rows,
+        partner_skill_name_rows=context.partner_skill_name_rows,
+        en=context.en,
         options=options,
     )
+
+def build_pal_pages(
+    base_ids: Iterable[str],
+    *,
+    options: Optional[PalPageOptions] = None,
+    context: Optional[PalPageContext] = None,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Batch builder: yields (base_id, wikitext) in input order, loading the shared context once.
+    Pals that cannot be built yield an empty string.
+    """
+    context = context or load_pal_page_context()
+    for base_id in base_ids:
+        yield base_id, build_pal_page_from_context(base_id, context=context, options=options)
+
+def build_pal_page_from_files(
+    base_id: str,
+    *,
+    options: Optional[PalPageOptions] = None,
+) -> str:
+    return build_pal_page_from_context(base_id, context=load_pal_page_context(), options=options)
@@ -1,11 +1,11 @@
 import os
 import re
 import sys
-import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
+from utils.datastore_utils import get_datastore
 from typing import Any, Dict, List, Optional, TypedDict, Tuple
 from functools import lru_cache
 from config.name_map import ELEMENT_NAME_MAP
@@ -37,10 +37,6 @@ def normalize_title(s: str) -> str:
     s = str(s or "").strip()
     return " ".join(s.split())
 
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def _extract_localized_text(entry: Any) -> str:
     if entry is None:
         return ""
@@ -59,31 +55,9 @@ def _extract_localized_text(entry: Any) -> str:
 
     return ""
 
-def _extract_datatable_rows(data: Any, *, source: str = "") -> Dict[str, Any]:
-    if isinstance(data, list):
-        dt_obj = None
-        for entry in data:
-            if isinstance(entry, dict) and isinstance(entry.get("Rows"), dict):
-                dt_obj = entry
-                break
-        if not isinstance(dt_obj, dict):
-            raise ValueError(f"{source} JSON list did not contain a DataTable object with 'Rows'")
-        data = dt_obj
-
-    if not isinstance(data, dict):
-        raise ValueError(f"{source} JSON must be an object or list containing a DataTable object")
-
-    rows = data.get("Rows")
-    if not isinstance(rows, dict):
-        keys = ", ".join(list(data.keys())[:25])
-        raise ValueError(f"{source} JSON missing 'Rows'. Top-level keys: {keys}")
-
-    return rows
-
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=None)
 def _load_text_table(path: str) -> Dict[str, str]:
-    raw = _load_json(path)
-    rows = _extract_datatable_rows(raw, source=os.path.basename(path))
+    rows = get_datastore().get_rows(path)
 
     out: Dict[str, str] = {}
     for k, v in rows.items():
@@ -235,8 +209,7 @@ def _first_text(table: Dict[str, str], keys: List[Any]) -> str:
 
 @lru_cache(maxsize=1)
 def _load_passive_rows() -> Dict[str, dict]:
-    raw_passive_data = _load_json(param_input_file)
-    passive_rows = _extract_datatable_rows(raw_passive_data, source=os.path.basename(param_input_file))
+    passive_rows = get_datastore().get_rows(param_input_file)
     out: Dict[str, dict] = {}
     for passive_id, row in passive_rows.items():
         if isinstance(row, dict):
@@ -0,0 +1,79 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import constants
+from typing import Dict, List
+from utils.console_utils import force_utf8_stdout
+from builders.chest_loot_rates import build_all_chest_loot_rate_export_models, ChestLootRateGroup
+force_utf8_stdout()
+
+#Paths
+output_directory = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted")
+
+
+
+def write_text(path: str, text: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+
+
+def format_number(value: float, *, digits: int = 4) -> str:
+    text = f"{round(value, digits):.{digits}f}".rstrip("0").rstrip(".")
+    return text if text not in {"", "-0"} else "0"
+
+
+def render_chest_loot_rate_block(group: ChestLootRateGroup) -> str:
+    chest_name = str(group.get("chest_name") or "")
+    grade_number = str(group.get("grade_number") or "")
+    location = str(group.get("location") or "")
+
+    lines: List[str] = []
+    lines.append("{{Chest Loot Rates")
+    lines.append(f"|chestName = {chest_name}")
+    lines.append(f"|grade = {grade_number}")
+    lines.append(f"|location = {location}".rstrip())
+
+    # Items are ordered by chance to appear, highest first.
+    for i, r in enumerate(group.get("items") or [], start=1):
+        min_qty = int(r.get("min_quantity") or 0)
+        max_qty = int(r.get("max_quantity") or 0)
+        qty_text = str(min_qty) if min_qty == max_qty else f"{min_qty}-{max_qty}"
+
+        lines.append(f"  |{i}_name = {r.get('item_name', '')}")
+        lines.append(f"   |{i}_chance = {format_number(float(r.get('probability') or 0.0) * 100.0)}")
+        lines.append(f"   |{i}_expected = {format_number(float(r.get('expected_quantity') or 0.0))}")
+        lines.append(f"   |{i}_qty = {qty_text}")
+
+    lines.append("}}")
+    return "\n".join(lines)
+
+
+def build_export_text(groups: List[ChestLootRateGroup]) -> str:
+    if not groups:
+        return ""
+    blocks = [render_chest_loot_rate_block(g) for g in groups]
+    return ("\n\n".join(blocks).rstrip() + "\n")
+
+
+def main() -> None:
+    print("🔄 Building chest loot rate exports...")
+    exports: Dict[str, List[ChestLootRateGroup]] = build_all_chest_loot_rate_export_models()
+
+    wrote = 0
+    for filename, groups in exports.items():
+        output_path = os.path.join(output_directory, filename)
+        print(f"🔄 Writing output file: {output_path}")
+        write_text(output_path, build_export_text(groups))
+        wrote += 1
+
+    print(f"✅ Done. Wrote {wrote} export file(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import constants
+from typing import List
+from utils.console_utils import force_utf8_stdout
+from builders.chest_loot_simulator import DEFAULT_SEED, ChestLootSimulator, build_chest_loot_simulators
+force_utf8_stdout()
+
+#Paths
+output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Validation", "chest_loot_simulation.txt")
+
+#Settings
+SIMULATED_OPENS = 200_000       # chest opens per chest grade for the empirical rates
+CHESTS_TO_OBTAIN_TRIALS = 5_000 # runs per item for the chests-to-obtain quantiles
+SEED = DEFAULT_SEED
+
+
+
+def write_text(path: str, text: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+
+
+def _pct(value: float) -> str:
+    return f"{value * 100.0:.4f}%"
+
+
+def render_simulation_block(chest_name: str, grade_number: str, sim: ChestLootSimulator) -> str:
+    lines: List[str] = [f"== {chest_name} (Grade {grade_number}) =="]
+    lines.append(f"{'Item':<32} {'Chance':>10} {'Simulated':>10} {'Expected':>9} {'Simulated':>9}   Chests to obtain one (p50/p90/p99)")
+
+    for r in sim.simulate_rates(SIMULATED_OPENS):
+        name = r.get("item_name", "")
+        farm = sim.chests_to_obtain(name, 1, trials=CHESTS_TO_OBTAIN_TRIALS)
+        farm_text = ""
+        if farm:
+            q = farm.get("quantiles", {})
+            farm_text = "/".join(str(q.get(k, "")) for k in sorted(q))
+
+        lines.append(
+            f"{name:<32} {_pct(r.get('analytic_probability', 0.0)):>10} {_pct(r.get('empirical_probability', 0.0)):>10}"
+            f" {r.get('analytic_expected_quantity', 0.0):>9.4f} {r.get('empirical_expected_quantity', 0.0):>9.4f}   {farm_text}"
+        )
+
+    return "\n".join(lines)
+
+
+def main() -> None:
+    print(f"🔄 Simulating {SIMULATED_OPENS:,} chest opens per chest grade (seed {SEED})...")
+    simulators = build_chest_loot_simulators(seed=SEED)
+
+    blocks: List[str] = []
+    for (chest_name, grade_number), sim in sorted(simulators.items(), key=lambda kv: (kv[0][0].casefold(), kv[0][1])):
+        blocks.append(render_simulation_block(chest_name, grade_number, sim))
+
+    print(f"🔄 Writing output file: {output_file}")
+    write_text(output_file, ("\n\n".join(blocks).rstrip() + "\n") if blocks else "")
+    print(f"✅ Done. Simulated {len(blocks)} chest grade(s).")
+
+
+if __name__ == "__main__":
+    main()
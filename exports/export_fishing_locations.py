@@ -6,6 +6,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from config import constants
 from builders.fishing_location import build_all_fishing_location_models
 from utils.console_utils import force_utf8_stdout
+from utils.weighted_lottery_utils import normalized_percentages
 from typing import List, Optional
 force_utf8_stdout()
 
@@ -18,6 +19,7 @@ output_file_wikiformat = os.path.join(output_directory, "fishing_wikiformat.txt"
 #Config
 INCLUDE_WEIGHTS = True
 INCLUDE_PERCENT = True
+INCLUDE_WIKIFORMAT_PERCENT = False  # adds |<prefix>percent = chance within its rarity/time group
 
 
 
@@ -59,14 +61,15 @@ def render_pal_fishing_locations_text(
                 time_label = only_time or "Any time"
                 out.append(f"* {group} ({time_label})")
 
-                total_w = sum(e["weight"] for e in entries) or 0.0
+                percents = normalized_percentages([e["weight"] for e in entries])
+                has_weight = any(percents)
 
-                for e in entries:
+                for e, pct in zip(entries, percents):
                     bits: List[str] = []
                     if include_weights:
                         bits.append(f"w={e['weight']:g}")
-                    if include_percent and total_w > 0:
-                        bits.append(f"{(e['weight'] / total_w) * 100:.2f}%")
+                    if include_percent and has_weight:
+                        bits.append(f"{pct:.2f}%")
 
                     lvl_min = e.get("lvl_min")
                     lvl_max = e.get("lvl_max")
@@ -88,9 +91,10 @@ def render_pal_fishing_locations_text(
             for size, entries in sorted(pond_groups.items()):
                 out.append(f"* {size}")
 
-                total_w = sum(e["weight"] for e in entries) or 0.0
+                percents = normalized_percentages([e["weight"] for e in entries])
+                has_weight = any(percents)
 
-                for e in entries:
+                for e, pct in zip(entries, percents):
                     lvl = ""
                     if e["lvl_min"] is not None or e["lvl_max"] is not None:
                         lvl = f" Lv {e['lvl_min']}-{e['lvl_max']}"
@@ -98,8 +102,8 @@ def render_pal_fishing_locations_text(
                     bits: List[str] = []
                     if include_weights:
                         bits.append(f"w={e['weight']:g}")
-                    if include_percent and total_w > 0:
-                        bits.append(f"{(e['weight'] / total_w) * 100:.2f}%")
+                    if include_percent and has_weight:
+                        bits.append(f"{pct:.2f}%")
 
                     suffix = f" [{' | '.join(bits)}]" if bits else ""
                     out.append(f"  - {e['pal_name']} ({e['pal_id']}){lvl}{suffix}")
@@ -148,7 +152,7 @@ def render_pal_fishing_locations_deduped_text(model: dict) -> str:
     return "\n".join(out).rstrip() + "\n"
 
 
-def render_pal_fishing_locations_wikiformat_text(model: dict) -> str:
+def render_pal_fishing_locations_wikiformat_text(model: dict, *, include_percent: bool = False) -> str:
     index = model.get("wikiformat_index") or {}
     diff_map = model.get("wikiformat_difficulty") or {}
 
@@ -190,7 +194,9 @@ def render_pal_fishing_locations_wikiformat_text(model: dict) -> str:
                     ),
                 )
 
-                for idx, e in enumerate(rows_sorted, start=1):
+                percents = normalized_percentages([e.get("weight") or 0.0 for e in rows_sorted])
+
+                for idx, (e, pct) in enumerate(zip(rows_sorted, percents), start=1):
                     pal_name = (e.get("pal_name") or "").strip()
                     weight = float(e.get("weight") or 0.0)
 
@@ -201,6 +207,8 @@ def render_pal_fishing_locations_wikiformat_text(model: dict) -> str:
 
                     blocks.append(f"  |{prefix}name = {pal_name}")
                     blocks.append(f"   |{prefix}weight = {weight:g}")
+                    if include_percent:
+                        blocks.append(f"   |{prefix}percent = {pct:.2f}")
 
                     if lvl_min is not None:
                         blocks.append(f"   |{prefix}min = {lvl_min}")
@@ -228,7 +236,7 @@ def main() -> None:
     write_text(output_file_deduped, deduped)
     print(f"Wrote: {output_file_deduped}")
 
-    wikiformat = render_pal_fishing_locations_wikiformat_text(model)
+    wikiformat = render_pal_fishing_locations_wikiformat_text(model, include_percent=INCLUDE_WIKIFORMAT_PERCENT)
     write_text(output_file_wikiformat, wikiformat)
     print(f"Wrote: {output_file_wikiformat}")
 
@@ -0,0 +1,76 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import constants
+from typing import List, Optional
+from utils.console_utils import force_utf8_stdout
+from utils.english_text_utils import get_english_text
+from builders.item_recipe import format_raw_materials, format_total_workload, get_crafting_graph
+force_utf8_stdout()
+
+#Paths
+output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "item_raw_materials.txt")
+
+
+
+def write_text(path: str, text: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+
+
+def build_all_raw_materials_blocks() -> List[str]:
+    en = get_english_text()
+    graph = get_crafting_graph()
+
+    entries = []
+    for totals in graph.all_totals():
+        product_id = totals.get("product_id", "")
+        display_name = en.get_item_name(product_id) or product_id
+        entries.append((display_name, product_id, totals))
+
+    entries.sort(key=lambda e: (e[0].casefold(), e[1]))
+
+    blocks: List[str] = []
+    for display_name, product_id, totals in entries:
+        blocks.append(
+            "\n".join(
+                [
+                    f"## {display_name} ({product_id})",
+                    f"|raw_materials = {format_raw_materials(en, totals.get('raw_materials') or {})}",
+                    f"|total_workload = {format_total_workload(totals)}",
+                ]
+            )
+        )
+
+    return blocks
+
+
+def build_all_raw_materials_export_text(blocks: Optional[List[str]] = None) -> str:
+    if blocks is None:
+        blocks = build_all_raw_materials_blocks()
+    return ("\n\n".join(blocks).rstrip() + "\n") if blocks else ""
+
+
+def main() -> None:
+    print("🔄 Expanding crafting recipes to raw materials...")
+    graph = get_crafting_graph()
+    blocks = build_all_raw_materials_blocks()
+    text = build_all_raw_materials_export_text(blocks)
+
+    if graph.cyclic_products:
+        print(f"⚠️ Skipped {len(graph.cyclic_products)} recipes on a crafting cycle: {', '.join(graph.cyclic_products)}")
+
+    print(f"🔄 Writing output file: {output_file}")
+    write_text(output_file, text)
+
+    print(f"✅ Done. Wrote {len(blocks)} recipes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,9 @@ force_utf8_stdout()
 #Paths
 output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "item_recipes.txt")
 
+# Adds |raw_materials = (fully expanded through intermediate recipes) to every recipe.
+INCLUDE_RAW_MATERIALS = False
+
 
 
 def write_text(path: str, text: str) -> None:
@@ -33,6 +36,8 @@ def render_crafting_recipe(model: CraftingRecipeModel) -> str:
     lines.append(f"|yield = {model.get('yield_count', '')}")
     lines.append(f"|workbench = {model.get('workbench', '')}")
     lines.append(f"|ingredients = {model.get('ingredients', '')}")
+    if "raw_materials" in model:
+        lines.append(f"|raw_materials = {model.get('raw_materials', '')}")
     lines.append(f"|workload = {model.get('workload', '')}")
 
     variants = model.get("variants") or {}
@@ -52,13 +57,15 @@ def render_crafting_recipe(model: CraftingRecipeModel) -> str:
 
             lines.append(f"|{n}_workload = {v.get('workload', '')}")
             lines.append(f"|{n}_ingredients = {v.get('ingredients', '')}")
+            if "raw_materials" in v:
+                lines.append(f"|{n}_raw_materials = {v.get('raw_materials', '')}")
 
     lines.append("}}")
     return "\n".join(lines).rstrip() + "\n"
 
 
-def build_all_item_recipes_export_text(*, include_headers: bool = True) -> str:
-    entries = build_all_item_recipe_models()
+def build_all_item_recipes_export_text(*, include_headers: bool = True, include_raw_materials: bool = INCLUDE_RAW_MATERIALS) -> str:
+    entries = build_all_item_recipe_models(include_raw_materials=include_raw_materials)
 
     blocks: List[str] = []
     for entry in entries:
@@ -6,6 +6,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from config import constants
 from typing import Dict, List, Optional
 from utils.console_utils import force_utf8_stdout
+from utils.weighted_lottery_utils import normalized_percentages
 from builders.merchant_shop import (build_all_merchant_shop_models, MerchantItemModel, MerchantShopModel)
 force_utf8_stdout()
 
@@ -13,6 +14,10 @@ force_utf8_stdout()
 output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "merchant_shops.txt")
 
 
+#Config
+INCLUDE_GROUP_PERCENT = False  # adds |sg_percent = chance the merchant rolls this shop group
+
+
 # Merchant display name overrides
 MERCHANT_NAME_OVERRIDES: Dict[str, str] = {
     "ArenaShop1": "Arena Merchant",
@@ -52,12 +57,15 @@ def _render_merchant_template(
     shop_group: str,
     group_weight: int,
     items: List[MerchantItemModel],
+    group_percent: Optional[float] = None,
 ) -> str:
     lines: List[str] = []
 
     lines.append("{{Merchant|" + merchant_name)
     lines.append(f"|shop_group = {shop_group}")
     lines.append(f"|sg_weight = {group_weight}")
+    if group_percent is not None:
+        lines.append(f"|sg_percent = {group_percent:.2f}")
 
     for idx, item in enumerate(items, start=1):
         item_name = _trim(item.get("itemName"))
@@ -87,6 +95,7 @@ def build_merchant_shops_wikitext(
     *,
     merchant_name_overrides: Optional[Dict[str, str]] = None,
     include_blank_line: bool = True,
+    include_group_percent: bool = INCLUDE_GROUP_PERCENT,
 ) -> str:
     # If caller doesn't provide overrides, use the shared map at the top of the script.
     if merchant_name_overrides is None:
@@ -105,7 +114,10 @@ def build_merchant_shops_wikitext(
         lines.append(f"== {merchant_name} ==")
         lines.append(f"; Source key: {merchant_key}")
 
-        for group in shop.get("shopGroups") or []:
+        shop_groups = shop.get("shopGroups") or []
+        group_percents = normalized_percentages([_to_int(g.get("groupWeight"), default=0) for g in shop_groups])
+
+        for group, group_percent in zip(shop_groups, group_percents):
             shop_group = _trim(group.get("shopGroup"))
             group_weight = _to_int(group.get("groupWeight"), default=0)
             items = group.get("items") or []
@@ -117,6 +129,7 @@ def build_merchant_shops_wikitext(
                     shop_group=shop_group,
                     group_weight=group_weight,
                     items=items,
+                    group_percent=group_percent if include_group_percent else None,
                 )
             )
 
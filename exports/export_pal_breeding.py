@@ -44,7 +44,7 @@ def render_pal_breeding(model: PalBreedingModel, *, include_header: bool = True)
     out.append(f"|male_probability = {model.get('male_probability', '')}")
     out.append(f"|combi_duplicate_priority = {model.get('combi_duplicate_priority', '')}")
     out.append(f"|egg = {model.get('egg', '')}")
-    out.append("|uniqueCombos = ")
+    out.append(f"|uniqueCombos = {model.get('unique_combos', '')}")
     out.append("}}")
     out.append("")
     out.append("")
@@ -9,16 +9,22 @@ from config import constants  # type: ignore
 from pywikibot import pagegenerators
 from typing import List, Optional, Tuple, Dict
 from utils.console_utils import force_utf8_stdout  # type: ignore
-from utils.english_text_utils import EnglishText  # type: ignore
+from utils.english_text_utils import get_english_text  # type: ignore
+from utils.wiki_dump_utils import iter_dump_pages  # type: ignore
+from utils.parallel_compare_utils import CompareJob, compare_pages_in_pool  # type: ignore
+from utils.pipeline_utils import run_pipeline  # type: ignore
 from builders.item_page import resolve_item_id_and_title  # type: ignore
 
 from builders.item_infobox import (
     build_item_infobox_model_for_page,
+    get_item_variant_index,
 )  # type: ignore
 from exports.export_item_infoboxes import render_item_infobox  # type: ignore
 
 from builders.item_recipe import (
+    RecipeIndex,
     build_item_recipe_model_by_product_id,
+    get_recipe_index,
 )  # type: ignore
 from exports.export_item_recipes import render_crafting_recipe  # type: ignore
 
@@ -26,13 +32,13 @@ from utils.compare_utils import (
     is_blank,
     normalize_title,
     normalize_skip_keys,
-    find_template_blocks,
     extract_first_template_block,
-    replace_span,
     parse_template_params,
-    extract_param_value_single_line,
+    single_line_param_values,
     compare_param_dicts,
     patch_template_params_in_place,
+    TemplateNode,
+    WikiPageEditor,
     template_has_meaningful_data,
 )
 
@@ -42,9 +48,23 @@ compare_output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "Com
 
 DRY_RUN = True
 
+# Offline mode: read pages from a MediaWiki XML dump (Special:Export or a wiki.gg dump; .xml, .bz2, .gz or .7z)
+# instead of fetching them. No API calls are made and nothing is saved, so the run is always a dry run.
+DUMP_FILE = ""
+
 CHECK_INFOBOX = True
 CHECK_RECIPE = True
 
+# Compare pages across this many worker processes (1 = in this process, page by page).
+# Fetching and saving always stay in the main process.
+WORKERS = 1
+WORKER_CHUNK_SIZE = 16
+
+# Pages waiting between fetching and comparing; bounds how many page texts are held at once.
+PIPELINE_QUEUE_DEPTH = 100
+# Extra seconds between saves, on top of pywikibot's own put throttle.
+SAVE_INTERVAL = 0.0
+
 TEST_RUN = False
 TEST_PAGES = [
     "Metal Armor",
@@ -89,18 +109,16 @@ def _extract_recipe_params(template_text: str) -> Dict[str, str]:
         "5_workload",
         "5_ingredients",
     ]
-    out: Dict[str, str] = {}
-    for k in keys:
-        out[k] = extract_param_value_single_line(template_text, k)
-    return out
+    values = single_line_param_values(template_text)
+    return {k: values.get(k, "") for k in keys}
 
 
 def _select_recipe_block(
     *,
-    page_text: str,
+    page: WikiPageEditor,
     canonical_product: str,
-) -> Tuple[Optional[Tuple[str, int, int]], Optional[str]]:
-    blocks = find_template_blocks(page_text, "Crafting Recipe")
+) -> Tuple[Optional[TemplateNode], Optional[str]]:
+    blocks = page.find("Crafting Recipe")
     if not blocks:
         return None, None
 
@@ -109,16 +127,16 @@ def _select_recipe_block(
 
     canonical_product = (canonical_product or "").strip()
     if not canonical_product:
-        products = [extract_param_value_single_line(b, "product") or "(blank)" for (b, _, _) in blocks]
+        products = [b.get("product") or "(blank)" for b in blocks]
         return None, f"Ambiguous: multiple Crafting Recipe templates but canonical product is blank. Found: {', '.join(products)}"
 
-    matches: List[Tuple[str, int, int]] = []
+    matches: List[TemplateNode] = []
     found_products: List[str] = []
-    for b, s, e in blocks:
-        p = extract_param_value_single_line(b, "product")
+    for b in blocks:
+        p = b.get("product")
         found_products.append(p or "(blank)")
         if p.strip() == canonical_product.strip():
-            matches.append((b, s, e))
+            matches.append(b)
 
     if len(matches) == 1:
         return matches[0], None
@@ -134,21 +152,23 @@ def _compare_and_patch_page(
     title: str,
     page_text: str,
     item_id: str,
+    recipe_index: Optional[RecipeIndex] = None,
 ) -> Tuple[str, List[str], List[str]]:
     diffs: List[str] = []
     warnings: List[str] = []
 
-    new_text = page_text
+    page = WikiPageEditor(page_text)
 
     if CHECK_INFOBOX:
-        wiki_block, s, e = extract_first_template_block(new_text, "Item")
+        wiki_node = page.first("Item")
         model = build_item_infobox_model_for_page(item_id)
 
         if not model:
             warnings.append("No canonical infobox could be generated from data.")
-        elif wiki_block is None or s is None or e is None:
+        elif wiki_node is None:
             warnings.append("No {{Item}} template found on page.")
         else:
+            wiki_block = wiki_node.text
             expected_block = render_item_infobox(model, include_heading=False)
             exp_t, _, _ = extract_first_template_block(expected_block, "Item")
             if exp_t is None:
@@ -179,19 +199,19 @@ def _compare_and_patch_page(
                         allow_multiline_keys={"description", "qualities"},
                     )
 
-                    new_text = replace_span(new_text, s, e, patched_block)
+                    page.replace(wiki_node, patched_block)
 
     if CHECK_RECIPE:
-        recipe_model = build_item_recipe_model_by_product_id(item_id)
+        recipe_model = build_item_recipe_model_by_product_id(item_id, index=recipe_index)
 
         if not recipe_model:
-            blocks = find_template_blocks(new_text, "Crafting Recipe")
+            blocks = page.find("Crafting Recipe")
 
             meaningful_blocks = [
                 b
-                for (b, _, _) in blocks
+                for b in blocks
                 if template_has_meaningful_data(
-                    b,
+                    b.text,
                     ignore_keys={"product"},  # product alone doesn't mean "wiki has recipe info"
                 )
             ]
@@ -205,7 +225,7 @@ def _compare_and_patch_page(
             canonical_product = (recipe_model.get("product") or "").strip()
 
             selected, ambiguous_reason = _select_recipe_block(
-                page_text=new_text,
+                page=page,
                 canonical_product=canonical_product,
             )
 
@@ -214,7 +234,7 @@ def _compare_and_patch_page(
             elif selected is None:
                 warnings.append("No {{Crafting Recipe}} template found on page.")
             else:
-                wiki_recipe, rs, re_ = selected
+                wiki_recipe = selected.text
 
                 expected_block = render_crafting_recipe(recipe_model)
                 exp_t, _, _ = extract_first_template_block(expected_block, "Crafting Recipe")
@@ -254,9 +274,9 @@ def _compare_and_patch_page(
                             add_missing_params=True,
                         )
 
-                        new_text = replace_span(new_text, rs, re_, patched_recipe)
+                        page.replace(selected, patched_recipe)
 
-    return new_text, diffs, warnings
+    return page.text, diffs, warnings
 
 
 def _page_generator(site: pywikibot.Site):
@@ -272,43 +292,100 @@ def _page_generator(site: pywikibot.Site):
         yield p
 
 
+def _build_compare_context() -> dict:
+    return {
+        "recipe_index": get_recipe_index(),
+        "variant_index": get_item_variant_index(),
+    }
+
+
+def _compare_job(ctx: dict, job: CompareJob) -> Tuple[str, List[str], List[str]]:
+    title, page_text, item_id = job
+    return _compare_and_patch_page(title=title, page_text=page_text, item_id=item_id, recipe_index=ctx["recipe_index"])
+
+
+def _compare_pages_parallel(pages: list, en) -> Dict[str, Tuple[str, List[str], List[str]]]:
+    jobs: List[CompareJob] = []
+    for page in pages:
+        try:
+            text = page.get()
+        except Exception:
+            continue  # reported by the main loop
+        item_id, _final_title = resolve_item_id_and_title(page.title(), en=en)
+        if item_id:
+            jobs.append((page.title(), text, item_id))
+
+    print(f"🔄 Comparing {len(jobs)} pages on {WORKERS} workers...")
+    return dict(compare_pages_in_pool(
+        jobs,
+        compare=_compare_job,
+        build_context=_build_compare_context,
+        workers=WORKERS,
+        chunk_size=WORKER_CHUNK_SIZE,
+    ))
+
+
+def _progress(idx: int, total: Optional[int]) -> str:
+    return f"{idx}/{total}" if total is not None else str(idx)
+
+
 def main() -> None:
-    site = pywikibot.Site()
-    site.login()
+    dump_mode = bool(DUMP_FILE)
+    dry_run = DRY_RUN or dump_mode
 
-    en = EnglishText()
+    if not dump_mode:
+        site = pywikibot.Site()
+        site.login()
+
+    en = get_english_text()
 
     diffs_out: List[str] = []
     warnings_out: List[str] = []
     changed_pages: List[str] = []
 
-    pages = list(pagegenerators.PreloadingGenerator(_page_generator(site), groupsize=50))
+    if dump_mode:
+        print(f"🔄 Reading pages from dump: {DUMP_FILE}")
+        page_source = iter_dump_pages(DUMP_FILE, template_name="Item")
+    else:
+        page_source = pagegenerators.PreloadingGenerator(_page_generator(site), groupsize=50)
 
     if TEST_RUN and TEST_PAGES:
         wanted = {t.strip() for t in TEST_PAGES if t.strip()}
-        pages = [p for p in pages if normalize_title(p.title()) in wanted]
-
-    total = len(pages)
-    print(f"🔍 Found {total} pages embedding Template:Item")
-
-    for idx, page in enumerate(pages, start=1):
+        page_source = (p for p in page_source if normalize_title(p.title()) in wanted)
+
+    compared: Optional[Dict[str, Tuple[str, List[str], List[str]]]] = None
+    total: Optional[int] = None
+    if WORKERS > 1:
+        pages = sorted(page_source, key=lambda p: (p.title().casefold(), p.title()))
+        total = len(pages)
+        print(f"🔍 Found {total} pages embedding Template:Item")
+        compared = _compare_pages_parallel(pages, en)
+        page_source = pages
+    else:
+        print("🔍 Streaming pages embedding Template:Item")
+
+    def compare_page(numbered_page: Tuple[int, "pywikibot.Page"]) -> Optional[Tuple[int, "pywikibot.Page", str]]:
+        idx, page = numbered_page
         title = page.title()
         try:
             text = page.get()
         except Exception as e:
             warnings_out.append(f"## {title}\nFailed to read page: {e}\n")
-            continue
+            return None
 
         item_id, _final_title = resolve_item_id_and_title(title, en=en)
         if not item_id:
             warnings_out.append(f"## {title}\nCould not resolve item_id from page title. Skipping.\n")
-            continue
+            return None
 
-        new_text, diffs, warns = _compare_and_patch_page(
-            title=title,
-            page_text=text,
-            item_id=item_id,
-        )
+        if compared is not None:
+            new_text, diffs, warns = compared[title]
+        else:
+            new_text, diffs, warns = _compare_and_patch_page(
+                title=title,
+                page_text=text,
+                item_id=item_id,
+            )
 
         if warns:
             warnings_out.append(f"## {title}\n" + "\n".join([f"- {w}" for w in warns]) + "\n")
@@ -320,22 +397,42 @@ def main() -> None:
             diffs_out.append("")
             changed_pages.append(title)
 
-        if not DRY_RUN and diffs:
+        if not dry_run and diffs:
             if new_text.strip() == text.strip():
-                continue
-
-            page.text = new_text
-            page.save(summary="Update item infobox/recipe from data", minor=False)
-            print(f"📝 Updated: {title} ({idx}/{total})")
-        else:
-            if idx % 25 == 0 or idx == total:
-                print(f"🔄 Scanned {idx}/{total}")
-
-    if DRY_RUN:
+                return None
+            return idx, page, new_text
+
+        if idx % 25 == 0 or idx == total:
+            print(f"🔄 Scanned {_progress(idx, total)}")
+        return None
+
+    def save_page(job: Tuple[int, "pywikibot.Page", str]) -> None:
+        idx, page, new_text = job
+        page.text = new_text
+        page.save(summary="Update item infobox/recipe from data", minor=False)
+        print(f"📝 Updated: {page.title()} ({_progress(idx, total)})")
+
+    def report_save_error(job: Tuple[int, "pywikibot.Page", str], e: Exception) -> None:
+        print(f"⚠️ Failed to save {job[1].title()}: {e}")
+
+    stats = run_pipeline(
+        enumerate(page_source, start=1),
+        process=compare_page,
+        save=save_page,
+        queue_depth=PIPELINE_QUEUE_DEPTH,
+        min_save_interval=SAVE_INTERVAL,
+        on_save_error=report_save_error,
+    )
+    if total is None:
+        print(f"🔍 Scanned {stats.get('processed', 0)} pages embedding Template:Item")
+
+    if dry_run:
         parts: List[str] = []
 
         parts.append("# Item Page Compare Output\n")
-        parts.append(f"DRY_RUN: {DRY_RUN}\n")
+        parts.append(f"DRY_RUN: {dry_run}\n")
+        if dump_mode:
+            parts.append(f"DUMP_FILE: {DUMP_FILE}\n")
         parts.append(f"CHECK_INFOBOX: {CHECK_INFOBOX}\n")
         parts.append(f"CHECK_RECIPE: {CHECK_RECIPE}\n")
         parts.append("")
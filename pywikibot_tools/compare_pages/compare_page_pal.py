@@ -1,7 +1,6 @@
 import os
 import sys
 import re
-import json
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -10,10 +9,15 @@ from config import constants  # type: ignore
 from pywikibot import pagegenerators
 from typing import List, Optional, Tuple, Dict
 from utils.console_utils import force_utf8_stdout  # type: ignore
-from utils.english_text_utils import EnglishText  # type: ignore
+from utils.datastore_utils import get_datastore  # type: ignore
+from utils.english_text_utils import EnglishText, get_english_text  # type: ignore
+from utils.wiki_dump_utils import iter_dump_pages  # type: ignore
+from utils.parallel_compare_utils import CompareJob, compare_pages_in_pool  # type: ignore
+from utils.pipeline_utils import run_pipeline  # type: ignore
 
 from builders.pal_infobox import (  # type: ignore
     load_rows as pal_infobox_load_rows,
+    load_waza_master_records,
     build_waza_master_index,
     build_pal_infobox_model_by_id,
     build_pal_order as build_pal_order_infobox,
@@ -21,7 +25,6 @@ from builders.pal_infobox import (  # type: ignore
 from exports.export_pal_infoboxes import render_pal_infobox  # type: ignore
 
 from builders.pal_drops import (  # type: ignore
-    load_json as pal_drops_load_json,
     index_drop_rows_by_character_id,
     build_pal_drops_model_by_id,
     build_pal_order as build_pal_order_drops,
@@ -39,10 +42,10 @@ from utils.compare_utils import (  # type: ignore
     normalize_title,
     normalize_skip_keys,
     extract_first_template_block,
-    replace_span,
     parse_template_params,
     compare_param_dicts,
     patch_template_params_in_place,
+    WikiPageEditor,
 )
 
 force_utf8_stdout()
@@ -51,10 +54,24 @@ compare_output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "Com
 
 DRY_RUN = True
 
+# Offline mode: read pages from a MediaWiki XML dump (Special:Export or a wiki.gg dump; .xml, .bz2, .gz or .7z)
+# instead of fetching them. No API calls are made and nothing is saved, so the run is always a dry run.
+DUMP_FILE = ""
+
 CHECK_INFOBOX = True
 CHECK_DROPS = True
 CHECK_BREEDING = True
 
+# Compare pages across this many worker processes (1 = in this process, page by page).
+# Fetching and saving always stay in the main process.
+WORKERS = 1
+WORKER_CHUNK_SIZE = 16
+
+# Pages waiting between fetching and comparing; bounds how many page texts are held at once.
+PIPELINE_QUEUE_DEPTH = 100
+# Extra seconds between saves, on top of pywikibot's own put throttle.
+SAVE_INTERVAL = 0.0
+
 TEST_RUN = False
 TEST_PAGES = [
     "Blazamut", "Fuddler", "Lifmunk", "Fuack", "Foxcicle", "Frostallion", "Lovander", "Tanzee", "Vaelet",
@@ -181,13 +198,14 @@ def _compare_and_patch_page(
     diffs: List[str] = []
     warnings: List[str] = []
 
-    new_text = page_text
+    page = WikiPageEditor(page_text)
 
     if CHECK_INFOBOX:
-        wiki_block, s, e = extract_first_template_block(new_text, "Pal")
-        if wiki_block is None or s is None or e is None:
+        wiki_node = page.first("Pal")
+        if wiki_node is None:
             warnings.append("No {{Pal}} template found on page.")
         else:
+            wiki_block = wiki_node.text
             expected_model = build_pal_infobox_model_by_id(
                 pal_id,
                 rows=infobox_ctx["param_rows"],
@@ -225,13 +243,14 @@ def _compare_and_patch_page(
                         add_missing_params=False,
                     )
 
-                    new_text = replace_span(new_text, s, e, patched_block)
+                    page.replace(wiki_node, patched_block)
 
     if CHECK_DROPS:
-        wiki_block, s, e = extract_first_template_block(new_text, "Item Drop")
-        if wiki_block is None or s is None or e is None:
+        wiki_node = page.first("Item Drop")
+        if wiki_node is None:
             warnings.append("No {{Item Drop}} template found on page.")
         else:
+            wiki_block = wiki_node.text
             drops_model = build_pal_drops_model_by_id(
                 pal_id,
                 drops_by_character_id=drops_ctx["drops_by_character_id"],
@@ -271,13 +290,14 @@ def _compare_and_patch_page(
                         add_missing_params=False,
                     )
 
-                    new_text = replace_span(new_text, s, e, patched_block)
+                    page.replace(wiki_node, patched_block)
 
     if CHECK_BREEDING:
-        wiki_block, s, e = extract_first_template_block(new_text, "Breeding")
-        if wiki_block is None or s is None or e is None:
+        wiki_node = page.first("Breeding")
+        if wiki_node is None:
             warnings.append("No {{Breeding}} template found on page.")
         else:
+            wiki_block = wiki_node.text
             breeding_model = build_pal_breeding_model_by_id(
                 pal_id,
                 rows=breeding_ctx["param_rows"],
@@ -314,20 +334,15 @@ def _compare_and_patch_page(
                         add_missing_params=False,
                     )
 
-                    new_text = replace_span(new_text, s, e, patched_block)
+                    page.replace(wiki_node, patched_block)
 
-    return new_text, diffs, warnings
+    return page.text, diffs, warnings
 
 
 def _build_infobox_context(en: EnglishText) -> dict:
-    param_rows = pal_infobox_load_rows(
-        os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json"),
-        source="DT_PalMonsterParameter",
-    )
-    waza_rows = pal_infobox_load_rows(
-        os.path.join(constants.INPUT_DIRECTORY, "Waza", "DT_WazaMasterLevel.json"),
-        source="DT_WazaMasterLevel",
-    )
+    store = get_datastore()
+    param_rows = store.pal_parameter_rows()
+    waza_rows = load_waza_master_records()
 
     pal_activate_rows = pal_infobox_load_rows(
         constants.EN_PAL_ACTIVATE_FILE,
@@ -350,17 +365,9 @@ def _build_infobox_context(en: EnglishText) -> dict:
 
 
 def _build_drops_context() -> dict:
-    param_data = pal_drops_load_json(
-        os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json")
-    )
-    drop_data = pal_drops_load_json(
-        os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalDropItem.json")
-    )
-
-    from utils.json_datatable_utils import extract_datatable_rows  # type: ignore
-
-    param_rows = extract_datatable_rows(param_data, source="DT_PalMonsterParameter")
-    drop_rows = extract_datatable_rows(drop_data, source="DT_PalDropItem")
+    store = get_datastore()
+    param_rows = store.pal_parameter_rows()
+    drop_rows = store.pal_drop_rows()
 
     drops_by_character_id = index_drop_rows_by_character_id(drop_rows)
 
@@ -372,11 +379,7 @@ def _build_drops_context() -> dict:
 
 
 def _build_breeding_context(en: EnglishText) -> dict:
-    with open(os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json"), "r", encoding="utf-8") as f:
-        param_data = json.load(f)
-
-    from utils.json_datatable_utils import extract_datatable_rows  # type: ignore
-    param_rows = extract_datatable_rows(param_data, source="DT_PalMonsterParameter")
+    param_rows = get_datastore().pal_parameter_rows()
 
     return {
         "param_rows": param_rows,
@@ -384,11 +387,56 @@ def _build_breeding_context(en: EnglishText) -> dict:
     }
 
 
+def _build_compare_context() -> dict:
+    en = get_english_text()
+    return {
+        "en": en,
+        "infobox_ctx": _build_infobox_context(en),
+        "drops_ctx": _build_drops_context(),
+        "breeding_ctx": _build_breeding_context(en),
+    }
+
+
+def _compare_job(ctx: dict, job: CompareJob) -> Tuple[str, List[str], List[str]]:
+    title, page_text, pal_id = job
+    return _compare_and_patch_page(title=title, page_text=page_text, pal_id=pal_id, **ctx)
+
+
+def _compare_pages_parallel(pages: list, pal_name_to_id: Dict[str, str], compare_ctx: dict) -> Dict[str, Tuple[str, List[str], List[str]]]:
+    jobs: List[CompareJob] = []
+    for page in pages:
+        try:
+            text = page.get()
+        except Exception:
+            continue  # reported by the main loop
+        pal_id = _resolve_pal_id_from_title(page.title(), pal_name_to_id)
+        if pal_id:
+            jobs.append((page.title(), text, pal_id))
+
+    print(f"🔄 Comparing {len(jobs)} pages on {WORKERS} workers...")
+    return dict(compare_pages_in_pool(
+        jobs,
+        compare=_compare_job,
+        build_context=_build_compare_context,
+        context=compare_ctx,
+        workers=WORKERS,
+        chunk_size=WORKER_CHUNK_SIZE,
+    ))
+
+
+def _progress(idx: int, total: Optional[int]) -> str:
+    return f"{idx}/{total}" if total is not None else str(idx)
+
+
 def main() -> None:
-    site = pywikibot.Site()
-    site.login()
+    dump_mode = bool(DUMP_FILE)
+    dry_run = DRY_RUN or dump_mode
 
-    en = EnglishText()
+    if not dump_mode:
+        site = pywikibot.Site()
+        site.login()
+
+    en = get_english_text()
     pal_name_to_id = _build_pal_name_to_id_map(en)
 
     infobox_ctx = _build_infobox_context(en)
@@ -399,37 +447,57 @@ def main() -> None:
     warnings_out: List[str] = []
     changed_pages: List[str] = []
 
-    pages = list(pagegenerators.PreloadingGenerator(_page_generator(site), groupsize=50))
+    if dump_mode:
+        print(f"🔄 Reading pages from dump: {DUMP_FILE}")
+        page_source = iter_dump_pages(DUMP_FILE, template_name="Pal")
+    else:
+        page_source = pagegenerators.PreloadingGenerator(_page_generator(site), groupsize=50)
 
     if TEST_RUN and TEST_PAGES:
         wanted = {normalize_title(t).casefold() for t in TEST_PAGES if t.strip()}
-        pages = [p for p in pages if normalize_title(p.title()).casefold() in wanted]
-
-    total = len(pages)
-    print(f"🔍 Found {total} pages embedding Template:Pal")
+        page_source = (p for p in page_source if normalize_title(p.title()).casefold() in wanted)
+
+    compared: Optional[Dict[str, Tuple[str, List[str], List[str]]]] = None
+    total: Optional[int] = None
+    if WORKERS > 1:
+        pages = sorted(page_source, key=lambda p: (p.title().casefold(), p.title()))
+        total = len(pages)
+        print(f"🔍 Found {total} pages embedding Template:Pal")
+        compared = _compare_pages_parallel(
+            pages,
+            pal_name_to_id,
+            {"en": en, "infobox_ctx": infobox_ctx, "drops_ctx": drops_ctx, "breeding_ctx": breeding_ctx},
+        )
+        page_source = pages
+    else:
+        print("🔍 Streaming pages embedding Template:Pal")
 
-    for idx, page in enumerate(pages, start=1):
+    def compare_page(numbered_page: Tuple[int, "pywikibot.Page"]) -> Optional[Tuple[int, "pywikibot.Page", str]]:
+        idx, page = numbered_page
         title = page.title()
         try:
             text = page.get()
         except Exception as e:
             warnings_out.append(f"## {title}\nFailed to read page: {e}\n")
-            continue
+            return None
 
         pal_id = _resolve_pal_id_from_title(title, pal_name_to_id)
         if not pal_id:
             warnings_out.append(f"## {title}\nCould not resolve pal_id from page title. Skipping.\n")
-            continue
+            return None
 
-        new_text, diffs, warns = _compare_and_patch_page(
-            title=title,
-            page_text=text,
-            pal_id=pal_id,
-            en=en,
-            infobox_ctx=infobox_ctx,
-            drops_ctx=drops_ctx,
-            breeding_ctx=breeding_ctx,
-        )
+        if compared is not None:
+            new_text, diffs, warns = compared[title]
+        else:
+            new_text, diffs, warns = _compare_and_patch_page(
+                title=title,
+                page_text=text,
+                pal_id=pal_id,
+                en=en,
+                infobox_ctx=infobox_ctx,
+                drops_ctx=drops_ctx,
+                breeding_ctx=breeding_ctx,
+            )
 
         if warns:
             warnings_out.append(f"## {title}\n" + "\n".join([f"- {w}" for w in warns]) + "\n")
@@ -441,22 +509,42 @@ def main() -> None:
             diffs_out.append("")
             changed_pages.append(title)
 
-        if not DRY_RUN and diffs:
+        if not dry_run and diffs:
             if new_text.strip() == text.strip():
-                continue
-
-            page.text = new_text
-            page.save(summary="Update pal templates from data", minor=False)
-            print(f"📝 Updated: {title} ({idx}/{total})")
-        else:
-            if idx % 25 == 0 or idx == total:
-                print(f"🔄 Scanned {idx}/{total}")
+                return None
+            return idx, page, new_text
+
+        if idx % 25 == 0 or idx == total:
+            print(f"🔄 Scanned {_progress(idx, total)}")
+        return None
+
+    def save_page(job: Tuple[int, "pywikibot.Page", str]) -> None:
+        idx, page, new_text = job
+        page.text = new_text
+        page.save(summary="Update pal templates from data", minor=False)
+        print(f"📝 Updated: {page.title()} ({_progress(idx, total)})")
+
+    def report_save_error(job: Tuple[int, "pywikibot.Page", str], e: Exception) -> None:
+        print(f"⚠️ Failed to save {job[1].title()}: {e}")
+
+    stats = run_pipeline(
+        enumerate(page_source, start=1),
+        process=compare_page,
+        save=save_page,
+        queue_depth=PIPELINE_QUEUE_DEPTH,
+        min_save_interval=SAVE_INTERVAL,
+        on_save_error=report_save_error,
+    )
+    if total is None:
+        print(f"🔍 Scanned {stats.get('processed', 0)} pages embedding Template:Pal")
 
-    if DRY_RUN:
+    if dry_run:
         parts: List[str] = []
 
         parts.append("# Pal Page Compare Output\n")
-        parts.append(f"DRY_RUN: {DRY_RUN}\n")
+        parts.append(f"DRY_RUN: {dry_run}\n")
+        if dump_mode:
+            parts.append(f"DUMP_FILE: {DUMP_FILE}\n")
         parts.append(f"CHECK_INFOBOX: {CHECK_INFOBOX}\n")
         parts.append(f"CHECK_DROPS: {CHECK_DROPS}\n")
         parts.append(f"CHECK_BREEDING: {CHECK_BREEDING}\n")
@@ -16,6 +16,9 @@ missing_pages_file = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "Miss
 
 DRY_RUN = True
 OVERWRITE_EXISTING = True
+# List merchants, pal drops, chests and "used in" recipes from the item usage index instead of
+# the {{Shops}}/{{Drops}}/{{Used In Crafting}} templates.
+INCLUDE_USAGE_LISTS = False
 
 TEST_PAGES = [
     "Core Eject Shotgun", "Cold Resistant Plasteel Armor", "Dazzi Hat"
@@ -125,7 +128,7 @@ def main() -> None:
     missing_item_ids_or_names: List[str] = []
     missing_page_text: List[str] = []
 
-    options = ItemPageOptions(include_placeholders=True)
+    options = ItemPageOptions(include_placeholders=True, include_usage_lists=INCLUDE_USAGE_LISTS)
 
     for user_title in pages_to_process:
         final_title, page_text = build_item_page_from_name_or_id(user_title, options=options)
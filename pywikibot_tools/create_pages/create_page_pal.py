@@ -11,14 +11,13 @@ from pathlib import Path
 from utils.console_utils import force_utf8_stdout
 from utils.english_text_utils import EnglishText
 
-from builders.pal_infobox import load_rows, build_pal_order
-from builders.pal_page import build_pal_page_from_files, PalPageOptions
+from builders.pal_infobox import build_pal_order
+from builders.pal_page import build_pal_pages, load_pal_page_context, PalPageOptions
 
 force_utf8_stdout()
 
 preview_output_directory = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "Pal Pages")
 missing_pages_file = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "Missing_Pals.txt")
-PARAM_INPUT_FILE = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json",)
 
 DRY_RUN = True
 OVERWRITE_EXISTING = True
@@ -172,9 +171,9 @@ def main() -> None:
             print(f"Or populate this file with one page title per line: {missing_pages_file}")
             return
 
-    rows = load_rows(PARAM_INPUT_FILE, source="DT_PalMonsterParameter")
-    en = EnglishText()
-    title_to_base = build_title_to_base_map(rows, en)
+    context = load_pal_page_context()
+    en = context.en
+    title_to_base = build_title_to_base_map(context.rows, en)
 
     site = pywikibot.Site() if not DRY_RUN else None
 
@@ -183,6 +182,7 @@ def main() -> None:
 
     options = PalPageOptions(include_placeholders=True)
 
+    resolved: List[Tuple[str, str, str]] = []
     for user_title in pages_to_process:
         base, final_title = resolve_base_and_title(
             user_title,
@@ -194,7 +194,12 @@ def main() -> None:
             missing_base.append(user_title)
             continue
 
-        page_text = build_pal_page_from_files(base, options=options).strip()
+        resolved.append((user_title, base, final_title))
+
+    pages = build_pal_pages([base for _, base, _ in resolved], options=options, context=context)
+
+    for (user_title, _, final_title), (_, page_text) in zip(resolved, pages):
+        page_text = page_text.strip()
         if not page_text:
             missing_page_text.append(user_title)
             continue
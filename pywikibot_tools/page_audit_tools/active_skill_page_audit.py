@@ -1,6 +1,5 @@
 import os
 import sys
-import json
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -8,8 +7,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from config import constants
 from pywikibot import pagegenerators
 from utils.console_utils import force_utf8_stdout
-from utils.english_text_utils import EnglishText
-from utils.json_datatable_utils import extract_datatable_rows
+from utils.english_text_utils import get_english_text
+from utils.datastore_utils import get_datastore
 from pathlib import Path
 
 force_utf8_stdout()
@@ -45,10 +44,7 @@ def load_valid_waza_skill_ids() -> set[str]:
     Only include skills that actually exist in the Waza data table and are not disabled.
     This filters out phantom/alias English text entries.
     """
-    with open(WAZA_INPUT_FILE, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    rows = extract_datatable_rows(raw, source=os.path.basename(WAZA_INPUT_FILE)) or {}
+    rows = get_datastore().get_rows(WAZA_INPUT_FILE)
 
     valid_ids: set[str] = set()
 
@@ -73,14 +69,11 @@ def load_active_skill_english_names() -> set[str]:
     We prefer ACTION_SKILL_ when duplicates exist.
     """
     en_name_file = constants.EN_SKILL_NAME_FILE
-    english = EnglishText()
+    english = get_english_text()
     valid_ids = load_valid_waza_skill_ids()
 
 
-    with open(en_name_file, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    rows = extract_datatable_rows(raw, source=os.path.basename(en_name_file)) or {}
+    rows = get_datastore().get_rows(en_name_file)
 
     names: dict[str, str] = {}
 
@@ -1,15 +1,14 @@
 import os
 import re
 import sys
-import json
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
 from utils.console_utils import force_utf8_stdout
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
 from pywikibot.exceptions import InvalidTitleError
 from pathlib import Path
 
@@ -89,9 +88,7 @@ def ensure_directory(path: str) -> None:
 
 
 def load_rows(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    return extract_datatable_rows(raw, source=os.path.basename(path)) or {}
+    return get_datastore().get_rows(path)
 
 def get_redirect_titles_main_namespace(site: pywikibot.Site) -> set[str]:
     """
@@ -110,7 +107,7 @@ def build_item_title_set() -> tuple[set[str], list[str]]:
       - unmapped internal item IDs (when EnglishText has no name mapping)
     """
     rows = load_rows(ITEM_INPUT_FILE)
-    en = EnglishText()
+    en = get_english_text()
 
     titles: list[str] = []
     unmapped: list[str] = []
@@ -1,6 +1,5 @@
 import os
 import sys
-import json
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -8,8 +7,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from config import constants
 from pywikibot import pagegenerators
 from utils.console_utils import force_utf8_stdout
-from utils.json_datatable_utils import extract_datatable_rows
-from utils.english_text_utils import EnglishText
+from utils.datastore_utils import get_datastore
+from utils.english_text_utils import EnglishText, get_english_text
 from pathlib import Path
 
 force_utf8_stdout()
@@ -34,9 +33,7 @@ def ensure_directory(path: str) -> None:
 
 
 def load_rows(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    return extract_datatable_rows(raw, source=os.path.basename(path)) or {}
+    return get_datastore().get_rows(path)
 
 
 def safe_int(v) -> int | None:
@@ -55,7 +52,7 @@ def build_pal_title_set() -> tuple[set[str], list[str]]:
       - unmapped internal IDs (when EnglishText has no name mapping)
     """
     rows = load_rows(PARAM_INPUT_FILE)
-    en = EnglishText()
+    en = get_english_text()
 
     pals: list[str] = []
     unmapped: list[str] = []
@@ -0,0 +1,51 @@
+import os
+import io
+import sys
+import json
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.json_datatable_utils import _iter_datatable_stream, extract_datatable_rows
+
+DOCUMENTS = [
+    '{"Version":1.5,"Scale":-2.25E-3,"Flags":[true,false,null],"Rows":'
+    '{"Row_1":{"Weight":1.5e2,"Count":12,"Name":"A \\"quoted\\" \\u00e9 name","Tags":["x, y}",{}]},'
+    '"Row_2":{"Weight":-0.125,"Count":0,"Nested":{"Rate":3.0E+1}}}}',
+    ' [ {"Type": "Other", "Count": 10.75} ,\n {"Type": "DataTable", "Rows": {"Only": {"Value": 1e5}}} ] ',
+]
+
+
+class _SplitReader(io.StringIO):
+    """
+    Returns the text up to offset on the first read, then as much as each later read asks for.
+    """
+
+    def __init__(self, text: str, offset: int) -> None:
+        super().__init__(text)
+        self._first = offset
+
+    def read(self, size: int = -1) -> str:
+        if self._first is not None:
+            size, self._first = self._first, None
+        return super().read(size)
+
+
+class IterDatatableStreamTests(unittest.TestCase):
+    def test_every_split_offset_parses_the_same(self) -> None:
+        for doc in DOCUMENTS:
+            expected = list(extract_datatable_rows(json.loads(doc)).items())
+            for offset in range(1, len(doc) + 1):
+                with self.subTest(doc=doc[:20], offset=offset):
+                    f = _SplitReader(doc, offset)
+                    rows = list(_iter_datatable_stream(f, source="test", chunk_size=2))
+                    self.assertEqual(rows, expected)
+
+    def test_number_split_after_decimal_point(self) -> None:
+        doc = '{"Version":1.5,"Rows":{"A":{"B":2}}}'
+        f = _SplitReader(doc, doc.index(".") + 1)
+        self.assertEqual(list(_iter_datatable_stream(f, source="test", chunk_size=64)), [("A", {"B": 2})])
+
+
+if __name__ == "__main__":
+    unittest.main()
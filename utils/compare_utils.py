@@ -1,7 +1,8 @@
 # utils/compare_utils.py
 import re
 import difflib
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 _TEMPLATE_NAME_RE_CACHE: Dict[str, re.Pattern] = {}
@@ -9,6 +10,24 @@ _TEMPLATE_NAME_RE_CACHE: Dict[str, re.Pattern] = {}
 _WIKILINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|([^\]]+))?\]\]")
 _NUMERIC_WHOLE_RE = re.compile(r"^-?\d+(?:\.\d+)?$")
 
+# Template braces, scanned left to right without overlap ("{{{" is "{{" + "{").
+_BRACE_TOKEN_RE = re.compile(r"\{\{|\}\}")
+
+# Param line: "| key = value"
+_PARAM_LINE_RE = re.compile(r"^\s*\|\s*(?P<key>[^=\n|]+?)\s*=\s*(?P<val>.*)$")
+# Same, over a whole block at once; the value is the rest of its own line.
+_SINGLE_LINE_PARAM_RE = re.compile(r"^[ \t]*\|[ \t]*(?P<key>[^=\n|]+?)[ \t]*=[ \t]*(?P<val>[^\n]*)$", re.MULTILINE)
+_TEMPLATE_CLOSE_LINE_RE = re.compile(r"^\s*\}\}\s*$")
+_TRAILING_CLOSE_RE = re.compile(r"\s*\}\}\s*$")
+_TRAILING_COMMENT_RE = re.compile(r"\s*<!--.*?-->\s*$", re.DOTALL)
+_DIGIT_GROUP_COMMA_RE = re.compile(r"(?<=\d),(?=\d)")
+# Whole param block for patching: "| key = value", the value running until the next "|other =" line or "}}" line.
+_PARAM_BLOCK_RE = re.compile(
+    r"(?ims)^(?P<indent>[ \t]*)\|\s*(?P<key>[^=\n|]+?)\s*=\s*(?P<val>.*?)(?=^\s*\|\s*[^=\n|]+?\s*=|^\s*\}\}\s*$)"
+)
+_INLINE_TRAILING_COMMENT_RE = re.compile(r"(<!--.*?-->\s*)$", re.DOTALL)
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
 def is_blank(v: Optional[str]) -> bool:
     return v is None or str(v).strip() == ""
 
@@ -70,34 +89,145 @@ def get_template_name_re(template_name: str) -> re.Pattern:
     _TEMPLATE_NAME_RE_CACHE[key] = pat
     return pat
 
-def find_template_blocks(text: str, template_name: str) -> List[Tuple[str, int, int]]:
-    out: List[Tuple[str, int, int]] = []
-    if is_blank(text):
-        return out
+def _scan_template_end(text: str, start: int) -> Optional[int]:
+    """
+    End offset of the template opening at start, counting {{ / }} from there; None if it never closes.
+    """
+    depth = 0
+    for m in _BRACE_TOKEN_RE.finditer(text, start):
+        if m.group() == "{{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return None
+
+
+class TemplateNode:
+    """
+    One {{...}} template in a parsed page: its span in the page text plus nested templates.
+    Param lookups are computed on first use and cached on the node.
+    """
+
+    __slots__ = ("source", "start", "end", "children", "_single_line")
+
+    def __init__(self, source: str, start: int, end: int) -> None:
+        self.source = source
+        self.start = start
+        self.end = end
+        self.children: List["TemplateNode"] = []
+        self._single_line: Optional[Dict[str, str]] = None
+
+    @property
+    def text(self) -> str:
+        return self.source[self.start : self.end]
+
+    @property
+    def name(self) -> str:
+        body = self.source[self.start + 2 : self.end - 2]
+        cut = len(body)
+        for sep in ("|", "{{"):
+            i = body.find(sep)
+            if i != -1 and i < cut:
+                cut = i
+        return body[:cut].strip()
+
+    def single_line_params(self) -> Dict[str, str]:
+        """
+        casefolded key -> first-line value, first occurrence wins (see extract_param_value_single_line).
+        """
+        if self._single_line is None:
+            self._single_line = _single_line_param_values(self.text)
+        return self._single_line
+
+    def get(self, param_name: str) -> str:
+        return self.single_line_params().get(str(param_name).strip().casefold(), "")
+
+    def params(self, *, allow_multiline_keys: Optional[set[str]] = None) -> Dict[str, str]:
+        return parse_template_params(self.text, allow_multiline_keys=allow_multiline_keys)
 
-    name_re = get_template_name_re(template_name)
-    for m in name_re.finditer(text):
-        start = m.start()
-        i = start
-        depth = 0
-
-        while i < len(text) - 1:
-            two = text[i : i + 2]
-            if two == "{{":
-                depth += 1
-                i += 2
+    def __repr__(self) -> str:
+        return f"TemplateNode({self.name!r}, {self.start}, {self.end})"
+
+
+class WikiPage:
+    """
+    A page tokenized once into a tree of template nodes.
+
+    One left-to-right pass over every "{{" / "}}" builds the tree; each closed template is also indexed
+    by its start offset, so looking up all templates of a name is one regex search plus dict hits.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text or ""
+        self.roots: List[TemplateNode] = []
+        self.by_start: Dict[int, TemplateNode] = {}
+
+        # Stack frames: (start offset, children collected so far)
+        stack: List[Tuple[int, List[TemplateNode]]] = []
+        for m in _BRACE_TOKEN_RE.finditer(self.text):
+            if m.group() == "{{":
+                stack.append((m.start(), []))
                 continue
-            if two == "}}":
-                depth -= 1
-                i += 2
-                if depth == 0:
-                    end = i
-                    out.append((text[start:end], start, end))
-                    break
+            if not stack:
                 continue
-            i += 1
 
-    return out
+            start, children = stack.pop()
+            node = TemplateNode(self.text, start, m.end())
+            node.children = children
+            self.by_start[start] = node
+            (stack[-1][1] if stack else self.roots).append(node)
+
+        # Unclosed templates: keep their closed children reachable from the level above.
+        while stack:
+            _, children = stack.pop()
+            (stack[-1][1] if stack else self.roots).extend(children)
+
+    def iter_templates(self) -> Iterator[TemplateNode]:
+        todo = list(reversed(self.roots))
+        while todo:
+            node = todo.pop()
+            yield node
+            todo.extend(reversed(node.children))
+
+    def find(self, template_name: str) -> List[TemplateNode]:
+        """
+        Every template named template_name (exact name, case-insensitive), in page order.
+        """
+        out: List[TemplateNode] = []
+        if is_blank(self.text):
+            return out
+
+        for m in get_template_name_re(template_name).finditer(self.text):
+            node = self.by_start.get(m.start())
+            if node is None:
+                # The name match starts inside a brace run the page scan split differently
+                # (e.g. "{{{Pal|..."); scan this one on its own.
+                end = _scan_template_end(self.text, m.start())
+                if end is None:
+                    continue
+                node = TemplateNode(self.text, m.start(), end)
+            out.append(node)
+        return out
+
+    def first(self, template_name: str) -> Optional[TemplateNode]:
+        nodes = self.find(template_name)
+        return nodes[0] if nodes else None
+
+
+@lru_cache(maxsize=16)
+def parse_wikitext(text: str) -> WikiPage:
+    """
+    Parsed WikiPage for text. Repeated helper calls on the same page text share one parse.
+    """
+    return WikiPage(text)
+
+
+def find_template_blocks(text: str, template_name: str) -> List[Tuple[str, int, int]]:
+    if is_blank(text):
+        return []
+    return [(node.text, node.start, node.end) for node in parse_wikitext(text).find(template_name)]
 
 
 def extract_first_template_block(text: str, template_name: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
@@ -112,6 +242,99 @@ def replace_span(text: str, start: int, end: int, replacement: str) -> str:
     return text[:start] + replacement + text[end:]
 
 
+def apply_span_edits(text: str, edits: List[Tuple[int, int, str]]) -> str:
+    """
+    Apply (start, end, replacement) edits, all given as offsets into text, with a single join.
+    Edits must not overlap.
+    """
+    if not edits:
+        return text
+
+    pieces: List[str] = []
+    pos = 0
+    for start, end, replacement in sorted(edits, key=lambda t: (t[0], t[1])):
+        if start < pos:
+            raise ValueError(f"Overlapping edits at offset {start}")
+        pieces.append(text[pos:start])
+        pieces.append(replacement)
+        pos = end
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def _is_flat_template(text: str) -> bool:
+    # One closed template with no nested templates: swapping it in cannot move any other template.
+    return (
+        text.startswith("{{")
+        and text.count("{{") == 1
+        and text.count("}}") == 1
+        and _scan_template_end(text, 0) == len(text)
+    )
+
+
+class WikiPageEditor:
+    """
+    Template edits against one page, written out once.
+
+    Lookups (first / find) answer as if every earlier replace() had already been applied, but
+    replacements are only recorded, as spans of the parsed page, and text joins them into the final
+    page in a single pass. Edits that could move other templates (nested or unbalanced replacement
+    text, or a lookup touching an edited span) are applied right away and the page re-parsed, so
+    results always match patching the text template by template. With no edits text is the input
+    string itself.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.original = text or ""
+        self._page = parse_wikitext(self.original)
+        self._edits: List[Tuple[int, int, str]] = []
+
+    @property
+    def _base(self) -> str:
+        return self._page.text
+
+    def _flush(self) -> None:
+        if not self._edits:
+            return
+        self._page = parse_wikitext(apply_span_edits(self._base, self._edits))
+        self._edits = []
+
+    def _is_stale(self, node: TemplateNode) -> bool:
+        if self._page.by_start.get(node.start) is not node:
+            return True
+        return any(node.start < end and start < node.end for start, end, _ in self._edits)
+
+    def find(self, template_name: str) -> List[TemplateNode]:
+        nodes = self._page.find(template_name)
+        if self._edits and any(self._is_stale(n) for n in nodes):
+            self._flush()
+            nodes = self._page.find(template_name)
+        return nodes
+
+    def first(self, template_name: str) -> Optional[TemplateNode]:
+        nodes = self.find(template_name)
+        return nodes[0] if nodes else None
+
+    def replace(self, node: TemplateNode, replacement: str) -> None:
+        if node.source is not self._base:
+            raise ValueError("Template node does not belong to the current page text")
+        if replacement == node.text:
+            return
+
+        self._edits.append((node.start, node.end, replacement))
+        if self._page.by_start.get(node.start) is not node or not _is_flat_template(replacement):
+            self._flush()
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._edits) or self._base != self.original
+
+    @property
+    def text(self) -> str:
+        self._flush()
+        return self.original if self._base == self.original else self._base
+
+
 def normalize_for_diff(s: str) -> str:
     s = (s or "").replace("\r\n", "\n").replace("\r", "\n")
     s = s.strip() + "\n"
@@ -141,7 +364,7 @@ def strip_wikilinks(s: str) -> str:
 
 
 def strip_trailing_wiki_comment(s: str) -> str:
-    return re.sub(r"\s*<!--.*?-->\s*$", "", s or "", flags=re.DOTALL).strip()
+    return _TRAILING_COMMENT_RE.sub("", s or "").strip()
 
 def template_has_meaningful_data(
     template_text: str,
@@ -174,8 +397,8 @@ def template_has_meaningful_data(
 def normalize_param_value_for_compare(v: str) -> str:
     v = (v or "").replace("\r\n", "\n").replace("\r", "\n")
     v = strip_wikilinks(v)
-    v = re.sub(r"(?<=\d),(?=\d)", "", v)
-    v = re.sub(r"\s+", " ", v).strip()
+    v = _DIGIT_GROUP_COMMA_RE.sub("", v)
+    v = _WHITESPACE_RUN_RE.sub(" ", v).strip()
 
     v = _normalize_numeric_string(v)
     return v
@@ -216,9 +439,6 @@ def parse_template_params(
     current_key_norm: str = ""
     current_val_lines: List[str] = []
 
-    # Param line: "| key = value"
-    param_re = re.compile(r"^\s*\|\s*(?P<key>[^=\n|]+?)\s*=\s*(?P<val>.*)$")
-
     def flush() -> None:
         nonlocal current_key, current_key_norm, current_val_lines
         if not current_key:
@@ -227,7 +447,7 @@ def parse_template_params(
         raw_val = "\n".join(current_val_lines).strip()
 
         # If the template closes on the same line as the last param, strip it.
-        raw_val = re.sub(r"\s*\}\}\s*$", "", raw_val).rstrip()
+        raw_val = _TRAILING_CLOSE_RE.sub("", raw_val).rstrip()
 
         if current_key_norm not in allow_multiline_norm:
             first_line = raw_val.split("\n", 1)[0].strip()
@@ -241,11 +461,11 @@ def parse_template_params(
 
     for line in lines:
         # End of template
-        if re.match(r"^\s*\}\}\s*$", line):
+        if _TEMPLATE_CLOSE_LINE_RE.match(line):
             flush()
             break
 
-        m = param_re.match(line)
+        m = _PARAM_LINE_RE.match(line)
         if m:
             # New param starts — flush previous param first
             flush()
@@ -269,24 +489,35 @@ def parse_template_params(
     flush()
     return params
 
-def extract_param_value_single_line(template_text: str, param_name: str) -> str:
+@lru_cache(maxsize=256)
+def _single_line_param_values(template_text: str) -> Dict[str, str]:
+    values: Dict[str, str] = {}
     if is_blank(template_text):
-        return ""
+        return values
 
     text = template_text.replace("\r\n", "\n").replace("\r", "\n")
+    for m in _SINGLE_LINE_PARAM_RE.finditer(text):
+        key = m.group("key").strip().casefold()
+        if key in values:
+            continue
+        val = m.group("val").strip()
+        val = _TRAILING_CLOSE_RE.sub("", val).strip()
+        values[key] = _TRAILING_COMMENT_RE.sub("", val).strip()
+    return values
 
-    pat = re.compile(
-        r"^[ \t]*\|\s*" + re.escape(param_name) + r"\s*=\s*([^\n]*)$",
-        re.IGNORECASE | re.MULTILINE,
-    )
-    m = pat.search(text)
-    if not m:
-        return ""
 
-    val = (m.group(1) or "").strip()
-    val = re.sub(r"\s*\}\}\s*$", "", val).strip()
-    val = re.sub(r"\s*<!--.*?-->\s*$", "", val).strip()
-    return val
+def single_line_param_values(template_text: str) -> Dict[str, str]:
+    """
+    Every "|key = value" line of a template in one pass: casefolded key -> value of its first
+    occurrence, with a trailing "}}" and trailing <!-- comment --> removed.
+    """
+    return dict(_single_line_param_values(template_text or ""))
+
+
+def extract_param_value_single_line(template_text: str, param_name: str) -> str:
+    if is_blank(template_text):
+        return ""
+    return _single_line_param_values(template_text).get(str(param_name).strip().casefold(), "")
 
 
 def compare_param_dicts(
@@ -361,14 +592,7 @@ def patch_template_params_in_place(
     allow_multiline = {str(k).strip().casefold() for k in (allow_multiline_keys or set()) if str(k).strip()}
     text = template_text.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Match a whole param block:
-    #   | key = value
-    #   (value may span multiple lines until next |other= or }} )
-    pattern = re.compile(
-        r"(?ims)^(?P<indent>[ \t]*)\|\s*(?P<key>[^=\n|]+?)\s*=\s*(?P<val>.*?)(?=^\s*\|\s*[^=\n|]+?\s*=|^\s*\}\}\s*$)"
-    )
-
-    matches = list(pattern.finditer(text))
+    matches = list(_PARAM_BLOCK_RE.finditer(text))
 
     by_key: Dict[str, re.Match] = {}
     indent_guess = ""
@@ -433,7 +657,7 @@ def patch_template_params_in_place(
             wiki_first_line = wiki_val_block.split("\n", 1)[0]
 
             trailing_comment = ""
-            cm = re.search(r"(<!--.*?-->\s*)$", wiki_first_line, flags=re.DOTALL)
+            cm = _INLINE_TRAILING_COMMENT_RE.search(wiki_first_line)
             if cm:
                 trailing_comment = cm.group(1) or ""
 
@@ -462,11 +686,15 @@ def patch_template_params_in_place(
         suffix = "\n" if original_block.endswith("\n") else ""
         replacements.append((m.start(), m.end(), new_block + suffix))
 
-    # Apply replacements (reverse order so indices stay valid)
+    # Apply replacements in one pass. Two expected keys differing only in case can target the
+    # same param; keep the old one-at-a-time rewrite for that.
     if replacements:
-        replacements.sort(key=lambda t: t[0], reverse=True)
-        for s, e, rep in replacements:
-            text = text[:s] + rep + text[e:]
+        if len({s for s, _, _ in replacements}) == len(replacements):
+            text = apply_span_edits(text, replacements)
+        else:
+            replacements.sort(key=lambda t: t[0], reverse=True)
+            for s, e, rep in replacements:
+                text = text[:s] + rep + text[e:]
 
     # Insert missing params just before the final "}}"
     if add_missing_params and insert_lines:
@@ -0,0 +1,242 @@
+import os
+import json
+import hashlib
+
+from config import constants
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+from utils.json_datatable_utils import (
+    DataTableRecord,
+    extract_datatable_rows,
+    iter_datatable_rows,
+    project_datatable_rows,
+)
+from utils.datatable_cache_utils import cache_name_for_path, cached_build, load_cached, save_cached
+
+#Paths
+PAL_PARAMETER_FILE = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalMonsterParameter.json")
+PAL_DROP_FILE = os.path.join(constants.INPUT_DIRECTORY, "Character", "DT_PalDropItem.json")
+WAZA_MASTER_LEVEL_FILE = os.path.join(constants.INPUT_DIRECTORY, "Waza", "DT_WazaMasterLevel.json")
+WAZA_FILE = os.path.join(constants.INPUT_DIRECTORY, "Waza", "DT_WazaDataTable.json")
+PASSIVE_SKILL_FILE = os.path.join(constants.INPUT_DIRECTORY, "PassiveSkill", "DT_PassiveSkill_Main.json")
+ITEM_FILE = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemDataTable.json")
+ITEM_RECIPE_FILE = os.path.join(constants.INPUT_DIRECTORY, "Item", "DT_ItemRecipeDataTable.json")
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class DataStore:
+    """
+    Process-wide cache of parsed Unreal DataTable exports.
+
+    Every builder and tool should read input JSON through here instead of calling json.load directly.
+    Each file is parsed at most once per (path, mtime); if a file changes on disk during a long session
+    it is transparently reloaded on the next request.
+
+    Extracted Rows are also persisted to the on-disk DataTable cache (see datatable_cache_utils), so a
+    warm start with unchanged inputs unpickles rows instead of parsing JSON.
+
+    Callers must treat returned rows as read-only, since the same dict is shared by every caller.
+    """
+
+    def __init__(self, *, use_disk_cache: bool = True) -> None:
+        self.use_disk_cache = use_disk_cache
+        # normalized path -> (mtime_ns, raw json)
+        self._json: Dict[str, Tuple[int, Any]] = {}
+        # normalized path -> (mtime_ns, rows)
+        self._rows: Dict[str, Tuple[int, Dict[str, dict]]] = {}
+        # (normalized path, fields) -> (mtime_ns, projected records)
+        self._records: Dict[Tuple[str, Tuple[str, ...]], Tuple[int, Dict[str, DataTableRecord]]] = {}
+        # normalized path -> number of times the file was actually parsed
+        self.load_counts: Dict[str, int] = {}
+
+    def _mtime(self, path: str) -> int:
+        return os.stat(path).st_mtime_ns
+
+    def get_json(self, path: str) -> Any:
+        """
+        Return the parsed JSON document at path, parsing it only if it is not cached or changed on disk.
+        """
+        key = _normalize_path(path)
+        mtime = self._mtime(key)
+
+        cached = self._json.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(key, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+
+        self.load_counts[key] = self.load_counts.get(key, 0) + 1
+        self._json[key] = (mtime, raw)
+        return raw
+
+    def get_rows(self, path: str, *, source: str = "") -> Dict[str, dict]:
+        """
+        Return the DataTable Rows mapping for path.
+
+        Raises:
+            ValueError: if the file is not a DataTable export (see extract_datatable_rows)
+        """
+        key = _normalize_path(path)
+        mtime = self._mtime(key)
+
+        cached = self._rows.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        rows = None
+        cache_name = cache_name_for_path(key)
+        if self.use_disk_cache:
+            rows = load_cached(cache_name, [key])
+
+        if rows is None:
+            raw = self.get_json(key)
+            rows = extract_datatable_rows(raw, source=source or os.path.basename(path)) or {}
+            if self.use_disk_cache:
+                save_cached(cache_name, [key], rows)
+
+        self._rows[key] = (mtime, rows)
+        return rows
+
+    def iter_rows(self, path: str, *, source: str = "") -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (row_key, row) pairs for path without parsing the whole document up front.
+
+        Rows already held in memory, or valid in the on-disk DataTable cache, are iterated directly.
+        Otherwise the file is streamed one row at a time (see iter_datatable_rows); once the stream has
+        been read to the end the rows are kept like get_rows would, so the next reader of the same file
+        (in this process or on a warm start) does not parse it again. Use this for large tables such as
+        spawner and lottery data.
+
+        Raises:
+            ValueError: if the file is not a DataTable export
+        """
+        key = _normalize_path(path)
+        mtime = self._mtime(key)
+
+        cached = self._rows.get(key)
+        if cached is not None and cached[0] == mtime:
+            return iter(cached[1].items())
+
+        source = source or os.path.basename(path)
+        if not self.use_disk_cache:
+            return iter_datatable_rows(key, source=source)
+
+        rows = load_cached(cache_name_for_path(key), [key])
+        if rows is not None:
+            self._rows[key] = (mtime, rows)
+            return iter(rows.items())
+
+        return self._stream_rows(key, mtime, source)
+
+    def _stream_rows(self, key: str, mtime: int, source: str) -> Iterator[Tuple[str, Any]]:
+        rows: Dict[str, Any] = {}
+        for row_key, row in iter_datatable_rows(key, source=source):
+            rows[row_key] = row
+            yield row_key, row
+
+        # Only a fully read table is kept; a caller that stops early leaves nothing behind.
+        self.load_counts[key] = self.load_counts.get(key, 0) + 1
+        self._rows[key] = (mtime, rows)
+        save_cached(cache_name_for_path(key), [key], rows)
+
+    def get_records(self, path: str, fields: Sequence[str], *, source: str = "") -> Dict[str, DataTableRecord]:
+        """
+        Return the Rows of path projected to fields, as compact __slots__ records.
+
+        Records keep row.get("Field") working, so builders that only read a few columns can switch over
+        without other changes. Each (path, fields) projection is built once per mtime, from the first of:
+
+        - full rows already in memory
+        - full rows in the on-disk DataTable cache
+        - the on-disk cache of this projection (plain dicts, rebuilt into records on load)
+        - streaming the file, so the full per-row dicts are never retained
+
+        Raises:
+            ValueError: if the file is not a DataTable export, or a field is not a valid column name
+        """
+        key = _normalize_path(path)
+        mtime = self._mtime(key)
+        cache_key = (key, tuple(fields))
+
+        cached = self._records.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        source = source or os.path.basename(path)
+        rows_cached = self._rows.get(key)
+        if rows_cached is not None and rows_cached[0] == mtime:
+            rows = rows_cached[1]
+        elif self.use_disk_cache:
+            rows = load_cached(cache_name_for_path(key), [key])
+        else:
+            rows = None
+
+        if rows is not None:
+            records = project_datatable_rows(iter(rows.items()), cache_key[1])
+        elif self.use_disk_cache:
+            # Record classes are built per projection at runtime and cannot be pickled; cache plain dicts.
+            fields_digest = hashlib.sha1(",".join(cache_key[1]).encode("utf-8")).hexdigest()[:8]
+            projected = cached_build(
+                cache_name_for_path(key, prefix=f"records_{fields_digest}"),
+                [key],
+                lambda: {
+                    row_key: rec.as_dict()
+                    for row_key, rec in project_datatable_rows(iter_datatable_rows(key, source=source), cache_key[1]).items()
+                },
+            )
+            records = project_datatable_rows(iter(projected.items()), cache_key[1])
+        else:
+            records = project_datatable_rows(iter_datatable_rows(key, source=source), cache_key[1])
+
+        self._records[cache_key] = (mtime, records)
+        return records
+
+    def clear(self) -> None:
+        self._json.clear()
+        self._rows.clear()
+        self._records.clear()
+
+    # Typed accessors for tables shared across builders.
+    def pal_parameter_rows(self) -> Dict[str, dict]:
+        return self.get_rows(PAL_PARAMETER_FILE, source="DT_PalMonsterParameter")
+
+    def pal_drop_rows(self) -> Dict[str, dict]:
+        return self.get_rows(PAL_DROP_FILE, source="DT_PalDropItem")
+
+    def waza_master_level_rows(self) -> Dict[str, dict]:
+        return self.get_rows(WAZA_MASTER_LEVEL_FILE, source="DT_WazaMasterLevel")
+
+    def waza_rows(self) -> Dict[str, dict]:
+        return self.get_rows(WAZA_FILE)
+
+    def passive_skill_rows(self) -> Dict[str, dict]:
+        return self.get_rows(PASSIVE_SKILL_FILE)
+
+    def item_rows(self) -> Dict[str, dict]:
+        return self.get_rows(ITEM_FILE)
+
+    def item_recipe_rows(self) -> Dict[str, dict]:
+        return self.get_rows(ITEM_RECIPE_FILE)
+
+    def text_rows(self, path: str) -> Dict[str, dict]:
+        return self.get_rows(path)
+
+
+_DATASTORE: Optional[DataStore] = None
+
+
+def get_datastore() -> DataStore:
+    global _DATASTORE
+    if _DATASTORE is None:
+        _DATASTORE = DataStore()
+    return _DATASTORE
+
+
+def load_rows(path: str, *, source: str = "") -> Dict[str, dict]:
+    """
+    Shorthand for get_datastore().get_rows(path, source=source).
+    """
+    return get_datastore().get_rows(path, source=source)
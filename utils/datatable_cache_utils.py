@@ -0,0 +1,222 @@
+import os
+import json
+import pickle
+import hashlib
+
+from config import constants
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Bump whenever the layout of cached values changes so stale caches are ignored.
+CACHE_FORMAT_VERSION = 1
+
+#Paths
+CACHE_DIRECTORY = getattr(
+    constants,
+    "DATATABLE_CACHE_DIRECTORY",
+    os.path.join(constants.DEBUG_DIRECTORY, "datatable_cache"),
+)
+
+
+def cache_enabled() -> bool:
+    return bool(CACHE_DIRECTORY)
+
+
+def _cache_paths(name: str, suffix: str = ".pickle") -> Tuple[str, str]:
+    base = os.path.join(CACHE_DIRECTORY, str(constants.PATCH_VERSION), name)
+    return base + ".meta.json", base + suffix
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_signature(path: str, *, with_digest: bool) -> Dict[str, Any]:
+    st = os.stat(path)
+    sig: Dict[str, Any] = {
+        "path": os.path.normcase(os.path.abspath(path)),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+    if with_digest:
+        sig["sha1"] = file_digest(path)
+    return sig
+
+
+def _read_meta(meta_path: str) -> Optional[dict]:
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temp file behind in the cache directory.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _sources_still_valid(meta: dict, source_paths: Sequence[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Compare stored source signatures against the files on disk.
+
+    Returns the (possibly refreshed) signature list when every source is unchanged, else None.
+    Size + mtime is the fast path; if only the mtime moved (touch, re-extract of identical files)
+    the content hash decides.
+    """
+    stored = meta.get("sources")
+    if not isinstance(stored, list) or len(stored) != len(source_paths):
+        return None
+
+    refreshed: List[Dict[str, Any]] = []
+    for old, path in zip(stored, source_paths):
+        if not isinstance(old, dict):
+            return None
+
+        try:
+            cur = _source_signature(path, with_digest=False)
+        except OSError:
+            return None
+
+        if old.get("path") != cur["path"] or old.get("size") != cur["size"]:
+            return None
+
+        if old.get("mtime_ns") != cur["mtime_ns"]:
+            if file_digest(path) != old.get("sha1"):
+                return None
+
+        cur["sha1"] = old.get("sha1")
+        refreshed.append(cur)
+
+    return refreshed
+
+
+def _valid_cache_file(name: str, source_paths: Sequence[str], suffix: str) -> Optional[str]:
+    """
+    Return the data file path for name if its meta matches the current source files, else None.
+    """
+    if not cache_enabled():
+        return None
+
+    meta_path, data_path = _cache_paths(name, suffix)
+    meta = _read_meta(meta_path)
+    if meta is None:
+        return None
+
+    if meta.get("format") != CACHE_FORMAT_VERSION or meta.get("patch_version") != str(constants.PATCH_VERSION):
+        return None
+
+    refreshed = _sources_still_valid(meta, source_paths)
+    if refreshed is None or not os.path.exists(data_path):
+        return None
+
+    if refreshed != meta.get("sources"):
+        meta["sources"] = refreshed
+        try:
+            _write_atomic(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+        except OSError:
+            pass
+
+    return data_path
+
+
+def _write_cache_file(name: str, source_paths: Sequence[str], data: bytes, suffix: str) -> None:
+    meta_path, data_path = _cache_paths(name, suffix)
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    meta = {
+        "format": CACHE_FORMAT_VERSION,
+        "patch_version": str(constants.PATCH_VERSION),
+        "sources": [_source_signature(p, with_digest=True) for p in source_paths],
+    }
+    _write_atomic(data_path, data)
+    _write_atomic(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+
+
+def load_cached(name: str, source_paths: Sequence[str]) -> Optional[Any]:
+    """
+    Return the cached value for name if it was built from exactly these source files, else None.
+    """
+    data_path = _valid_cache_file(name, source_paths, ".pickle")
+    if data_path is None:
+        return None
+
+    try:
+        with open(data_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def save_cached(name: str, source_paths: Sequence[str], value: Any) -> None:
+    """
+    Persist value for name, recording the signature of each source file it was built from.
+    Failures are swallowed; the cache is an optimization, never a requirement.
+    """
+    if not cache_enabled():
+        return
+
+    try:
+        _write_cache_file(name, source_paths, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ".pickle")
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def cached_file_path(name: str, source_paths: Sequence[str], *, suffix: str = ".bin") -> Optional[str]:
+    """
+    Path of a raw binary cache file for name (e.g. to mmap it) if it is still valid for the
+    source files, else None.
+    """
+    return _valid_cache_file(name, source_paths, suffix)
+
+
+def save_cached_file(name: str, source_paths: Sequence[str], data: bytes, *, suffix: str = ".bin") -> Optional[str]:
+    """
+    Write data as a raw binary cache file for name. Returns its path, or None if it could not be written.
+    """
+    if not cache_enabled():
+        return None
+
+    try:
+        _write_cache_file(name, source_paths, data, suffix)
+    except OSError:
+        return None
+    return _cache_paths(name, suffix)[1]
+
+
+def cached_build(name: str, source_paths: Sequence[str], build_fn: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for name, or call build_fn() and cache its result.
+
+    Use for any derived structure that depends only on input files (parsed rows, indexes).
+    """
+    value = load_cached(name, source_paths)
+    if value is not None:
+        return value
+
+    value = build_fn()
+    save_cached(name, source_paths, value)
+    return value
+
+
+def cache_name_for_path(path: str, *, prefix: str = "rows") -> str:
+    """
+    Stable cache name for a single input file (basename plus a short hash of the full path).
+    """
+    norm = os.path.normcase(os.path.abspath(path))
+    digest = hashlib.sha1(norm.encode("utf-8")).hexdigest()[:10]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{prefix}_{stem}_{digest}"
@@ -1,11 +1,13 @@
 import os
 import re
-import json
+import sys
 
 from config import constants
 from config.name_map import ELEMENT_NAME_MAP
-from typing import Any, Dict, Iterable, List, Optional, Dict
-from utils.json_datatable_utils import extract_datatable_rows
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from utils.datastore_utils import get_datastore
 
 _NUM_TAG_RE = re.compile(r"<Num(?:Blue|Red)_\d+>")
 _SELF_CLOSING_TAG_RE = re.compile(r"<[^>]+/>")
@@ -15,11 +17,14 @@ _UICOMMON_TAG_RE = re.compile(
     r"<\s*uiCommon\s+id=\|\s*(?P<key>[^|]+)\s*\|/\s*>",
     re.IGNORECASE,
 )
-
-def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
+# Single-pass form of the strip_palworld_markup chain: uiCommon tokens, or any other <...> tag
+# (NumBlue/NumRed openers, "</>" closers and self-closing tags are all special cases of the latter).
+_MARKUP_TOKEN_RE = re.compile(
+    r"(?i:<\s*uiCommon\s+id=\|\s*(?P<key>[^|]+)\s*\|/\s*>)|<[^<>]+>",
+)
+_CLEAN_CACHE_SIZE = 65536
+# Cleaned strings kept per localization file by EnglishText.get (least recently used are dropped).
+_TABLE_CLEAN_CACHE_SIZE = 16384
 
 def _extract_text(entry: Any) -> str:
     if entry is None:
@@ -41,20 +46,54 @@ def _extract_text(entry: Any) -> str:
 
 
 class EnglishText:
+    """
+    Lookup service over the English localization DataTables.
+
+    Prefer get_english_text() over constructing this directly, so every builder shares one set of
+    loaded tables and casefold indexes for the whole process. Tables follow the DataStore, so a file
+    that changes on disk is picked up on the next lookup, together with its indexes.
+    """
+
     def __init__(self) -> None:
         # file_path -> { key -> row_dict }
         self._cache = {}
+        # file_path -> mtime_ns the cached table was loaded at
+        self._mtimes: Dict[str, int] = {}
+        # file_path -> { casefolded key -> (table position, original key) }
+        self._folded_cache: Dict[str, Dict[str, Tuple[int, str]]] = {}
+        # file_path -> { key -> cleaned text }, LRU bounded by _TABLE_CLEAN_CACHE_SIZE
+        self._clean_cache: Dict[str, "OrderedDict[str, str]"] = {}
 
     def _get_table(self, file_path: str):
-        if file_path in self._cache:
+        mtime = os.stat(file_path).st_mtime_ns
+        if self._mtimes.get(file_path) == mtime:
             return self._cache[file_path]
 
-        raw = _load_json(file_path)
-        rows = extract_datatable_rows(raw, source=os.path.basename(file_path)) or {}
+        rows = get_datastore().get_rows(file_path)
+        self._mtimes[file_path] = mtime
+        if self._cache.get(file_path) is rows:
+            return rows
 
+        # First load, or the DataStore reloaded the file: drop everything derived from the old rows.
         self._cache[file_path] = rows
+        self._folded_cache.pop(file_path, None)
+        self._clean_cache.pop(file_path, None)
         return rows
 
+    def _get_folded_index(self, file_path: str) -> Dict[str, Tuple[int, str]]:
+        rows = self._get_table(file_path)
+        index = self._folded_cache.get(file_path)
+        if index is not None:
+            return index
+
+        index = {}
+        for pos, key in enumerate(rows.keys()):
+            if isinstance(key, str):
+                index.setdefault(key.casefold(), (pos, key))
+
+        self._folded_cache[file_path] = index
+        return index
+
     def get_raw(self, file_path: str, key: str) -> str:
         rows = self._get_table(file_path)
         row = rows.get(key)
@@ -64,10 +103,25 @@ class EnglishText:
 
     def get(self, file_path: str, key: str) -> str:
         rows = self._get_table(file_path)
+
+        cleaned = self._clean_cache.get(file_path)
+        if cleaned is None:
+            cleaned = self._clean_cache[file_path] = OrderedDict()
+
+        v = cleaned.get(key)
+        if v is not None:
+            cleaned.move_to_end(key)
+            return v
+
         row = rows.get(key)
         if row is None:
             return ""
-        return clean_english_text(_extract_text(row), row)
+
+        v = clean_english_text(_extract_text(row), row)
+        cleaned[key] = v
+        if len(cleaned) > _TABLE_CLEAN_CACHE_SIZE:
+            cleaned.popitem(last=False)
+        return v
 
     def get_first(self, file_path: str, keys: list) -> str:
         for k in keys:
@@ -82,42 +136,27 @@ class EnglishText:
         if v:
             return v
 
-        table = self._get_table(file_path)
-        want_folded = {str(k).casefold() for k in keys if k}
+        index = self._get_folded_index(file_path)
 
-        for key, row in table.items():
-            if isinstance(key, str) and key.casefold() in want_folded:
-                return clean_english_text(_extract_text(row), row)
+        # First match in table order, same as scanning the table.
+        hits = [index[f] for f in {str(k).casefold() for k in keys if k} if f in index]
+        if not hits:
+            return ""
 
-        return ""
+        row = self._get_table(file_path)[min(hits)[1]]
+        return clean_english_text(_extract_text(row), row)
 
     def get_pal_name(self, pal_id: str) -> str:
         pal_id = str(pal_id).strip()
         if not pal_id:
             return ""
 
-        # First try the normal exact keys
-        v = self.get_first(constants.EN_PAL_NAME_FILE, [
+        # Exact keys first, then a case-insensitive fallback for known casing mismatches
+        # (e.g., WindChimes vs Windchimes)
+        return self.get_first_casefold(constants.EN_PAL_NAME_FILE, [
             f"PAL_NAME_{pal_id}",
             f"PAL_{pal_id}",
         ])
-        if v:
-            return v
-
-        # Case-insensitive fallback for known casing mismatches (e.g., WindChimes vs Windchimes)
-        table = self._get_table(constants.EN_PAL_NAME_FILE)
-
-        want_keys = [
-            f"PAL_NAME_{pal_id}",
-            f"PAL_{pal_id}",
-        ]
-        want_folded = {k.casefold() for k in want_keys}
-
-        for key, row in table.items():
-            if isinstance(key, str) and key.casefold() in want_folded:
-                return clean_english_text(_extract_text(row), row)
-
-        return ""
 
     def get_item_name(self, item_id: str) -> str:
         item_id = str(item_id).strip()
@@ -197,6 +236,19 @@ class EnglishText:
 
         return missing
 
+
+_ENGLISH_TEXT: Optional[EnglishText] = None
+
+
+def get_english_text() -> EnglishText:
+    """
+    Process-wide shared EnglishText instance.
+    """
+    global _ENGLISH_TEXT
+    if _ENGLISH_TEXT is None:
+        _ENGLISH_TEXT = EnglishText()
+    return _ENGLISH_TEXT
+
 def _format_effect_value_token(v: Any) -> str:
     """
     For inserting into {EffectValue#} placeholders (WITHOUT adding %).
@@ -265,6 +317,33 @@ def strip_palworld_markup(text: str) -> str:
 
     return s.strip()
 
+def _markup_token_repl(m: re.Match) -> str:
+    key = m.group("key")
+    if key is None:
+        return ""
+
+    key = key.strip()
+    if key.startswith("COMMON_ELEMENT_NAME_"):
+        raw = key[len("COMMON_ELEMENT_NAME_"):].strip()
+        return ELEMENT_NAME_MAP.get(raw, raw)
+
+    return ""
+
+@lru_cache(maxsize=_CLEAN_CACHE_SIZE)
+def _strip_markup_cached(text: str) -> str:
+    """
+    Memoized strip_palworld_markup using one tokenizer pass.
+
+    A "<" left behind means the text had a stray/nested bracket, where the sequential regex chain
+    can behave differently; those (rare) strings go through strip_palworld_markup itself.
+    """
+    s = text.replace("\r", "")
+    if "<" in s:
+        s = _MARKUP_TOKEN_RE.sub(_markup_token_repl, s)
+        if "<" in s:
+            return sys.intern(strip_palworld_markup(text))
+    return sys.intern(s.strip())
+
 def clean_english_text(text: str, row: Optional[Dict[str, Any]] = None) -> str:
     """
     One-stop cleaner for localized strings:
@@ -272,7 +351,9 @@ def clean_english_text(text: str, row: Optional[Dict[str, Any]] = None) -> str:
     2) strips Palworld markup tags like <NumBlue_13> and </>
 
     Use this on any text pulled from the English DT tables.
+    Results are memoized on the post-substitution text, so the cache key covers the effect values.
     """
-    s = substitute_effectvalue_placeholders(text, row)
-    s = strip_palworld_markup(s)
-    return s
+    s = str(text or "")
+    if row and "{EffectValue" in s:
+        s = substitute_effectvalue_placeholders(s, row)
+    return _strip_markup_cached(s)
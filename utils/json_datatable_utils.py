@@ -1,4 +1,9 @@
-from typing import Dict, Any
+import sys
+import json
+import keyword
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 
 def extract_datatable_rows(data: Any, *, source: str = "") -> Dict[str, dict]:
@@ -41,3 +46,273 @@ def extract_datatable_rows(data: Any, *, source: str = "") -> Dict[str, dict]:
         )
 
     return rows
+
+
+class DataTableRecord:
+    """
+    Base class for projected DataTable rows (see datatable_record_type).
+
+    Only the requested columns are stored, in __slots__, and the read-only part of the dict API that
+    builders use is kept: row.get("Field"), row["Field"] and "Field" in row. Columns that were absent
+    from the source row stay unset, so get() falls back to its default exactly like dict.get().
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name not in self._field_set:
+            return default
+        return getattr(self, name, default)
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._field_set:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                pass
+        raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._field_set and hasattr(self, name)  # type: ignore[arg-type]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._fields if hasattr(self, name)}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+
+# Use for isinstance checks in code that accepts either full rows or projected records.
+DATATABLE_ROW_TYPES = (dict, DataTableRecord)
+
+
+@lru_cache(maxsize=None)
+def datatable_record_type(fields: Tuple[str, ...]) -> type:
+    """
+    Return the DataTableRecord subclass with one slot per field (one class per distinct projection).
+
+    Raises:
+        ValueError: if a field name cannot be used as a slot
+    """
+    for name in fields:
+        if (
+            not isinstance(name, str)
+            or not name.isidentifier()
+            or keyword.iskeyword(name)
+            or name.startswith("_")
+            or hasattr(DataTableRecord, name)
+        ):
+            raise ValueError(f"Cannot project DataTable column {name!r}")
+
+    return type(
+        "DataTableRecord",
+        (DataTableRecord,),
+        {"__slots__": fields, "_fields": fields, "_field_set": frozenset(fields)},
+    )
+
+
+def project_datatable_rows(rows: Iterable[Tuple[str, Any]], fields: Tuple[str, ...]) -> Dict[str, DataTableRecord]:
+    """
+    Keep only the given columns of each (row_key, row) pair. Non-dict rows are dropped and string
+    values are interned, since enum-like columns repeat the same few values across thousands of rows.
+    """
+    record_cls = datatable_record_type(tuple(fields))
+    intern = sys.intern
+
+    out: Dict[str, DataTableRecord] = {}
+    for row_key, row in rows:
+        if not isinstance(row, dict):
+            continue
+
+        rec = record_cls()
+        for name in record_cls._fields:
+            if name in row:
+                v = row[name]
+                setattr(rec, name, intern(v) if type(v) is str else v)
+        out[intern(str(row_key))] = rec
+
+    return out
+
+
+_STREAM_CHUNK_SIZE = 1 << 20
+_JSON_WS = " \t\r\n"
+# Characters that may follow a complete JSON value.
+_JSON_VALUE_END = _JSON_WS + ",}]"
+
+
+class _JsonStreamScanner:
+    """
+    Minimal pull scanner over a text file: just enough structure to walk down to a DataTable's
+    "Rows" object and raw_decode one row at a time, refilling the buffer as needed.
+    """
+
+    def __init__(self, f: Any, *, source: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> None:
+        self._f = f
+        self._source = source
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        # Drop consumed text so the buffer stays around one row + one chunk.
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """
+        Next non-whitespace character ("" at end of input), without consuming it.
+        """
+        while True:
+            buf = self._buf
+            pos = self._pos
+            n = len(buf)
+            while pos < n and buf[pos] in _JSON_WS:
+                pos += 1
+            self._pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"{self._source} JSON: expected '{ch}' but found '{got or 'EOF'}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decode the next complete JSON value.
+
+        A decode that fails is retried with more input, and so is a number that ends at the buffer
+        end or is not followed by a value terminator: raw_decode reads "1." or "1e" at a chunk
+        boundary as 1, and the rest of the number is in the next chunk.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"{self._source} JSON: {e}") from e
+
+            buf = self._buf
+            if end >= len(buf) or (
+                isinstance(obj, (int, float)) and not isinstance(obj, bool) and buf[end] not in _JSON_VALUE_END
+            ):
+                if self._fill():
+                    continue
+
+            self._pos = end
+            return obj
+
+
+def _iter_object_rows(scanner: _JsonStreamScanner) -> Iterator[Tuple[str, Any]]:
+    """
+    Caller has consumed the opening '{' of the Rows object; yield its members.
+    """
+    if scanner.peek() == "}":
+        scanner.expect("}")
+        return
+
+    while True:
+        key = scanner.value()
+        scanner.expect(":")
+        yield str(key), scanner.value()
+
+        if scanner.peek() == ",":
+            scanner.expect(",")
+            continue
+        scanner.expect("}")
+        return
+
+
+def _iter_datatable_object(scanner: _JsonStreamScanner) -> Iterator[Tuple[str, Any]]:
+    """
+    Caller has consumed the opening '{' of a candidate DataTable object.
+    Streams Rows if this object has a dict "Rows"; any other member is decoded and dropped.
+    Returns (via StopIteration.value) whether Rows was found.
+    """
+    if scanner.peek() == "}":
+        scanner.expect("}")
+        return False
+
+    while True:
+        key = scanner.value()
+        scanner.expect(":")
+
+        if key == "Rows" and scanner.peek() == "{":
+            scanner.expect("{")
+            yield from _iter_object_rows(scanner)
+            return True
+
+        scanner.value()
+
+        if scanner.peek() == ",":
+            scanner.expect(",")
+            continue
+        scanner.expect("}")
+        return False
+
+
+def iter_datatable_rows(path: str, *, source: str = "") -> Iterator[Tuple[str, Any]]:
+    """
+    Stream (row_key, row) pairs from a DataTable export without loading the whole document.
+
+    Accepts the same shapes as extract_datatable_rows; only one row (plus a read chunk) is held
+    in memory at a time. Reading stops as soon as the Rows object has been consumed.
+
+    Raises:
+        ValueError: if Rows cannot be found
+    """
+    source = source or path
+
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _iter_datatable_stream(f, source=source)
+
+
+def _iter_datatable_stream(f: Any, *, source: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    scanner = _JsonStreamScanner(f, source=source, chunk_size=chunk_size)
+    first = scanner.peek()
+
+    if first == "{":
+        scanner.expect("{")
+        found = yield from _iter_datatable_object(scanner)
+        if not found:
+            raise ValueError(f"{source} JSON missing 'Rows'")
+        return
+
+    if first != "[":
+        raise ValueError(f"{source} JSON must be an object or list containing a DataTable object")
+
+    scanner.expect("[")
+    while scanner.peek() not in ("]", ""):
+        if scanner.peek() == "{":
+            scanner.expect("{")
+            found = yield from _iter_datatable_object(scanner)
+            if found:
+                return
+        else:
+            scanner.value()
+
+        if scanner.peek() == ",":
+            scanner.expect(",")
+
+    raise ValueError(f"{source} JSON list did not contain a DataTable object with 'Rows'")
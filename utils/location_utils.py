@@ -1,4 +1,5 @@
 from typing import Any, Dict, List, Optional
+from utils.spatial_index_utils import dedupe_points_within
 
 
 _CONVERT_X_OFFSET = 158000.0
@@ -39,7 +40,19 @@ def convert_location_to_wiki_coords(loc: Dict[str, Any]) -> Optional[str]:
     return f"({x}, {y})"
 
 
-def dedupe_xy_points(points: List[Dict[str, float]]) -> List[Dict[str, float]]:
+def dedupe_xy_points(points: List[Dict[str, float]], *, tolerance: float = 0.0) -> List[Dict[str, float]]:
+    """
+    Drop repeated points. With tolerance > 0, a point within that distance of an already kept point
+    also counts as a repeat (first one wins); the check uses a spatial grid, not a pairwise scan.
+    """
+    if tolerance > 0:
+        valid = [
+            (float(p["x"]), float(p["y"]), None)
+            for p in points
+            if isinstance(p.get("x"), (int, float)) and isinstance(p.get("y"), (int, float))
+        ]
+        return [{"x": x, "y": y} for x, y, _ in dedupe_points_within(valid, tolerance)]
+
     seen = set()
     out: List[Dict[str, float]] = []
 
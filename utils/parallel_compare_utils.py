@@ -0,0 +1,105 @@
+import os
+import runpy
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+# One compare job: (title, page text, id the page resolved to)
+CompareJob = Tuple[str, str, str]
+# compare(context, job) -> whatever the tool's _compare_and_patch_page returns
+CompareFn = Callable[[Any, CompareJob], Any]
+
+DEFAULT_CHUNK_SIZE = 16
+
+# Worker state. Under fork these are set in the parent right before the pool starts, so every worker
+# inherits the already built context; otherwise _init_worker fills them in each worker.
+_WORKER_COMPARE: Optional[CompareFn] = None
+_WORKER_CONTEXT: Any = None
+
+
+def _function_ref(fn: Callable) -> Tuple[str, str]:
+    # Tool scripts run as __main__ (often through pwb.py), so workers load them again by file path.
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        raise TypeError(f"{fn!r} is not a plain function")
+    return os.path.abspath(code.co_filename), fn.__name__
+
+
+def _init_worker(script_path: str, compare_name: str, context_name: Optional[str]) -> None:
+    # Run the script once and take both functions from that namespace.
+    global _WORKER_COMPARE, _WORKER_CONTEXT
+    namespace = runpy.run_path(script_path, run_name="__compare_worker__")
+    _WORKER_COMPARE = namespace[compare_name]
+    _WORKER_CONTEXT = namespace[context_name]() if context_name else None
+
+
+def _compare_chunk(chunk: List[CompareJob]) -> List[Tuple[str, Any]]:
+    compare = _WORKER_COMPARE
+    if compare is None:
+        raise RuntimeError("Compare worker was not initialized")
+    return [(job[0], compare(_WORKER_CONTEXT, job)) for job in chunk]
+
+
+def compare_pages_in_pool(
+    jobs: Sequence[CompareJob],
+    *,
+    compare: CompareFn,
+    build_context: Optional[Callable[[], Any]] = None,
+    context: Any = None,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Tuple[str, Any]]:
+    """
+    Run compare(context, job) for every job across a process pool and return (title, result) pairs
+    sorted by title, so the merged output does not depend on which worker finished first.
+
+    compare and build_context must be module-level functions of the calling script.
+
+    - Where fork is available the pool forks after the context is ready (context, or build_context()
+      run once here), and every worker shares it copy-on-write.
+    - Otherwise (Windows) each worker imports the script by path and runs build_context() once
+      itself; the DataTable pickle cache keeps that cheap.
+
+    Jobs go to workers in chunks of chunk_size pages to keep the per-task overhead small.
+    Fetching pages and saving results stay with the caller.
+    """
+    global _WORKER_COMPARE, _WORKER_CONTEXT
+
+    if not jobs:
+        return []
+
+    chunk_size = max(1, int(chunk_size))
+    chunks = [list(jobs[i : i + chunk_size]) for i in range(0, len(jobs), chunk_size)]
+    workers = max(1, min(int(workers), len(chunks)))
+
+    results: List[Tuple[str, Any]] = []
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        _WORKER_COMPARE = compare
+        _WORKER_CONTEXT = context if context is not None or build_context is None else build_context()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                for chunk_results in pool.map(_compare_chunk, chunks):
+                    results.extend(chunk_results)
+        finally:
+            _WORKER_COMPARE = None
+            _WORKER_CONTEXT = None
+    else:
+        script_path, compare_name = _function_ref(compare)
+        context_name = None
+        if build_context is not None:
+            context_path, context_name = _function_ref(build_context)
+            if context_path != script_path:
+                raise ValueError("compare and build_context must be defined in the same script")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(script_path, compare_name, context_name),
+        ) as pool:
+            for chunk_results in pool.map(_compare_chunk, chunks):
+                results.extend(chunk_results)
+
+    results.sort(key=lambda r: (r[0].casefold(), r[0]))
+    return results
@@ -0,0 +1,179 @@
+import time
+import queue
+import threading
+
+from typing import Callable, Iterable, List, Optional, Tuple, TypedDict, TypeVar
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+DEFAULT_QUEUE_DEPTH = 50
+DEFAULT_SAVE_QUEUE_DEPTH = 10
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class PipelineStats(TypedDict, total=False):
+    fetched: int
+    processed: int
+    saved: int
+    save_failures: int
+    fetch_seconds: float    # time spent pulling items from the source
+    process_seconds: float  # time spent in process()
+    save_seconds: float     # time spent in save(), without the throttle waits
+    wall_seconds: float
+
+
+class _StageError:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _put(q: "queue.Queue", item, stop: threading.Event) -> bool:
+    # Blocks while the queue is full, but gives up once the pipeline is stopping.
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _put_while_alive(q: "queue.Queue", item, consumer: threading.Thread) -> bool:
+    # Blocks while the queue is full, but gives up if the thread draining it has died.
+    while consumer.is_alive():
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def run_pipeline(
+    source: Iterable[T],
+    *,
+    process: Callable[[T], Optional[S]],
+    save: Callable[[S], None],
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    save_queue_depth: int = DEFAULT_SAVE_QUEUE_DEPTH,
+    min_save_interval: float = 0.0,
+    on_save_error: Optional[Callable[[S, Exception], None]] = None,
+) -> PipelineStats:
+    """
+    Fetch -> process -> save with the three stages overlapped.
+
+    - A fetch thread iterates source (e.g. a PreloadingGenerator) into a queue of at most queue_depth
+      items, so it pauses when processing falls behind and only a bounded number of pages is in
+      memory at once.
+    - process() runs in the calling thread, in source order. It returns something to save, or None.
+    - A writer thread drains those into save(), at most one per min_save_interval seconds, through a
+      queue of save_queue_depth. A save that raises goes to on_save_error, or is re-raised at the end
+      without one. An error raised by on_save_error is also re-raised at the end; the writer keeps
+      draining either way.
+
+    Wall time approaches the slowest stage instead of the sum of all three. An error in the source or
+    in process() stops the other stages and is re-raised here.
+    """
+    stats: PipelineStats = {
+        "fetched": 0,
+        "processed": 0,
+        "saved": 0,
+        "save_failures": 0,
+        "fetch_seconds": 0.0,
+        "process_seconds": 0.0,
+        "save_seconds": 0.0,
+        "wall_seconds": 0.0,
+    }
+
+    started = time.perf_counter()
+    stop = threading.Event()
+    fetch_q: "queue.Queue" = queue.Queue(maxsize=max(1, int(queue_depth)))
+    save_q: "queue.Queue" = queue.Queue(maxsize=max(1, int(save_queue_depth)))
+    save_errors: List[Tuple[S, Exception]] = []
+
+    def fetch_stage() -> None:
+        it = iter(source)
+        try:
+            while not stop.is_set():
+                t0 = time.perf_counter()
+                try:
+                    item = next(it)
+                except StopIteration:
+                    break
+                finally:
+                    stats["fetch_seconds"] += time.perf_counter() - t0
+
+                stats["fetched"] += 1
+                if not _put(fetch_q, item, stop):
+                    return
+        except BaseException as e:
+            _put(fetch_q, _StageError(e), stop)
+            return
+        _put(fetch_q, _DONE, stop)
+
+    def save_stage() -> None:
+        last_save = None
+        while True:
+            job = save_q.get()
+            if job is _DONE:
+                return
+
+            if min_save_interval > 0 and last_save is not None:
+                wait = min_save_interval - (time.monotonic() - last_save)
+                if wait > 0:
+                    time.sleep(wait)
+
+            t0 = time.perf_counter()
+            try:
+                save(job)
+                stats["saved"] += 1
+            except Exception as e:
+                stats["save_failures"] += 1
+                if on_save_error is None:
+                    save_errors.append((job, e))
+                else:
+                    try:
+                        on_save_error(job, e)
+                    except Exception as handler_error:
+                        save_errors.append((job, handler_error))
+            finally:
+                stats["save_seconds"] += time.perf_counter() - t0
+                last_save = time.monotonic()
+
+    fetcher = threading.Thread(target=fetch_stage, name="pipeline-fetch", daemon=True)
+    writer = threading.Thread(target=save_stage, name="pipeline-save", daemon=True)
+    fetcher.start()
+    writer.start()
+
+    try:
+        while True:
+            item = fetch_q.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _StageError):
+                raise item.error
+
+            t0 = time.perf_counter()
+            job = process(item)
+            stats["process_seconds"] += time.perf_counter() - t0
+            stats["processed"] += 1
+
+            if job is not None and not _put_while_alive(save_q, job, writer):
+                raise RuntimeError("Pipeline save thread stopped unexpectedly")
+    finally:
+        stop.set()
+        # Let queued saves finish; the writer exits at _DONE.
+        _put_while_alive(save_q, _DONE, writer)
+        writer.join()
+        fetcher.join()
+        stats["wall_seconds"] = time.perf_counter() - started
+
+    if save_errors:
+        raise save_errors[0][1]
+
+    return stats
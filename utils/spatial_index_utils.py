@@ -0,0 +1,186 @@
+import math
+
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Default cell edge, in datamap units; roughly one map grid square.
+DEFAULT_CELL_SIZE = 8.0
+
+
+class SpatialGrid(Generic[T]):
+    """
+    Uniform-grid spatial index over (x, y) points with an attached item.
+
+    Points are bucketed by (floor(x / cell), floor(y / cell)). A radius query only visits the cells
+    overlapping the query circle, and nearest() searches outward ring by ring, so both stay close to
+    the number of points actually nearby instead of scanning everything.
+    """
+
+    __slots__ = ("cell_size", "_cells", "_count", "_bounds")
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        if not cell_size > 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, T]]] = {}
+        self._count = 0
+        self._bounds: Optional[Tuple[int, int, int, int]] = None  # min cx, min cy, max cx, max cy
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, x: float, y: float, item: T) -> None:
+        key = self._cell(x, y)
+        self._cells.setdefault(key, []).append((float(x), float(y), item))
+        self._count += 1
+
+        b = self._bounds
+        if b is None:
+            self._bounds = (key[0], key[1], key[0], key[1])
+        elif not (b[0] <= key[0] <= b[2] and b[1] <= key[1] <= b[3]):
+            self._bounds = (min(b[0], key[0]), min(b[1], key[1]), max(b[2], key[0]), max(b[3], key[1]))
+
+    def extend(self, points: Iterable[Tuple[float, float, T]]) -> None:
+        for x, y, item in points:
+            self.insert(x, y, item)
+
+    def __iter__(self) -> Iterator[Tuple[float, float, T]]:
+        for bucket in self._cells.values():
+            yield from bucket
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Tuple[float, float, T]]:
+        """
+        Every point within radius of (x, y) (inclusive), in no particular order.
+        """
+        if radius < 0:
+            return []
+
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        r2 = radius * radius
+
+        out: List[Tuple[float, float, T]] = []
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for px, py, item in bucket:
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy <= r2:
+                        out.append((px, py, item))
+        return out
+
+    def any_within(self, x: float, y: float, radius: float) -> bool:
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        r2 = radius * radius
+
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for px, py, _ in cells.get((cx, cy), ()):
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy <= r2:
+                        return True
+        return False
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        *,
+        where: Optional[Callable[[T], bool]] = None,
+        max_distance: Optional[float] = None,
+    ) -> Optional[Tuple[float, float, float, T]]:
+        """
+        Closest point to (x, y) as (distance, px, py, item), optionally only among items where(item)
+        is true and within max_distance. None if nothing qualifies.
+        """
+        b = self._bounds
+        if b is None:
+            return None
+
+        cell = self.cell_size
+        ccx, ccy = self._cell(x, y)
+
+        # Rings beyond the occupied extent cannot contain anything.
+        max_ring = max(abs(ccx - b[0]), abs(ccx - b[2]), abs(ccy - b[1]), abs(ccy - b[3]))
+        if max_distance is not None:
+            max_ring = min(max_ring, int(math.ceil(max_distance / cell)) + 1)
+
+        best: Optional[Tuple[float, float, float, T]] = None
+        best_d2 = math.inf if max_distance is None else max_distance * max_distance
+
+        for ring in range(max_ring + 1):
+            # Every point in ring r is at least (r - 1) * cell away; stop once that beats the best.
+            if ring > 0 and ((ring - 1) * cell) ** 2 > best_d2:
+                break
+
+            for cx, cy in _ring_cells(ccx, ccy, ring):
+                for px, py, item in self._cells.get((cx, cy), ()):
+                    dx = px - x
+                    dy = py - y
+                    d2 = dx * dx + dy * dy
+                    if d2 <= best_d2 and (where is None or where(item)):
+                        if best is None or d2 < best_d2:
+                            best_d2 = d2
+                            best = (math.sqrt(d2), px, py, item)
+
+        return best
+
+
+def _ring_cells(cx: int, cy: int, ring: int) -> Iterator[Tuple[int, int]]:
+    if ring == 0:
+        yield (cx, cy)
+        return
+    for dx in range(-ring, ring + 1):
+        yield (cx + dx, cy - ring)
+        yield (cx + dx, cy + ring)
+    for dy in range(-ring + 1, ring):
+        yield (cx - ring, cy + dy)
+        yield (cx + ring, cy + dy)
+
+
+def build_point_index(
+    points: Iterable[Dict[str, Any]],
+    *,
+    x_key: str = "x",
+    y_key: str = "y",
+    cell_size: float = DEFAULT_CELL_SIZE,
+) -> "SpatialGrid[Dict[str, Any]]":
+    """
+    SpatialGrid over dict points (datamap markers, spawn point models); points without numeric
+    coordinates are skipped.
+    """
+    grid: SpatialGrid[Dict[str, Any]] = SpatialGrid(cell_size)
+    for p in points:
+        x = p.get(x_key)
+        y = p.get(y_key)
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            grid.insert(x, y, p)
+    return grid
+
+
+def dedupe_points_within(points: Iterable[Tuple[float, float, T]], tolerance: float) -> List[Tuple[float, float, T]]:
+    """
+    Keep the first point of every cluster closer than or equal to tolerance to an already kept point.
+    Input order decides which point survives.
+    """
+    kept: List[Tuple[float, float, T]] = []
+    grid: SpatialGrid[None] = SpatialGrid(tolerance if tolerance > 0 else DEFAULT_CELL_SIZE)
+
+    for x, y, item in points:
+        if grid.any_within(x, y, tolerance):
+            continue
+        grid.insert(x, y, None)
+        kept.append((x, y, item))
+
+    return kept
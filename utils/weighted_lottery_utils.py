@@ -0,0 +1,103 @@
+import random
+
+from typing import List, Sequence
+
+
+def _clean_weights(weights: Sequence[float]) -> List[float]:
+    out: List[float] = []
+    for w in weights:
+        try:
+            f = float(w)
+        except (TypeError, ValueError):
+            f = 0.0
+        # NaN, negative and missing weights never win a roll.
+        out.append(f if f > 0.0 else 0.0)
+    return out
+
+
+def normalized_percentages(weights: Sequence[float]) -> List[float]:
+    """
+    Each weight as a percentage of the total (0..100). All zeros if nothing has weight.
+    """
+    clean = _clean_weights(weights)
+    total = sum(clean)
+    if total <= 0.0:
+        return [0.0] * len(clean)
+    return [w / total * 100.0 for w in clean]
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table over a list of lottery weights.
+
+    Built once in O(n); every draw is then O(1): pick a column uniformly, keep it with probability
+    prob[i], otherwise take alias[i]. probabilities holds the exact normalized chance of each entry
+    (w / total), independent of the sampling tables.
+    """
+
+    __slots__ = ("weights", "total", "probabilities", "prob", "alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        clean = _clean_weights(weights)
+        total = sum(clean)
+        if not clean or total <= 0.0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        n = len(clean)
+        self.weights = clean
+        self.total = total
+        self.probabilities = [w / total for w in clean]
+
+        scaled = [p * n for p in self.probabilities]
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # Whatever is left is 1.0 up to rounding error.
+        for i in small + large:
+            prob[i] = 1.0
+            alias[i] = i
+
+        self.prob = prob
+        self.alias = alias
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def percentages(self) -> List[float]:
+        return [p * 100.0 for p in self.probabilities]
+
+    def sample(self, rng: random.Random) -> int:
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+    def sample_many(self, rng: random.Random, k: int) -> List[int]:
+        """
+        k independent draws, using one uniform per draw.
+        """
+        n = len(self.prob)
+        prob = self.prob
+        alias = self.alias
+        rand = rng.random
+
+        out: List[int] = []
+        append = out.append
+        for _ in range(k):
+            u = rand() * n
+            i = int(u)
+            append(i if (u - i) < prob[i] else alias[i])
+        return out
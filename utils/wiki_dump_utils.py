@@ -0,0 +1,70 @@
+from typing import Iterable, Iterator, Optional
+
+from utils.compare_utils import get_template_name_re
+
+
+class DumpPage:
+    """
+    Read-only stand-in for pywikibot.Page, backed by one page of an XML dump.
+
+    Has the bits the compare tools read (title(), get(), text), so the same page loop runs on dump
+    pages without a site. There is no save().
+    """
+
+    __slots__ = ("_title", "text", "ns", "revision_id", "timestamp")
+
+    def __init__(self, title: str, text: str, *, ns: str = "0", revision_id: str = "", timestamp: str = "") -> None:
+        self._title = title
+        self.text = text
+        self.ns = ns
+        self.revision_id = revision_id
+        self.timestamp = timestamp
+
+    def title(self) -> str:
+        return self._title
+
+    def get(self) -> str:
+        return self.text
+
+    def isRedirectPage(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"DumpPage({self._title!r})"
+
+
+def iter_dump_pages(
+    dump_file: str,
+    *,
+    template_name: Optional[str] = None,
+    namespaces: Iterable[str] = ("0",),
+) -> Iterator[DumpPage]:
+    """
+    Stream the latest revision of every page in a MediaWiki XML dump (Special:Export, wiki.gg dumps;
+    .xml or a .bz2/.gz/.7z archive of one). Uses pywikibot's xmlreader, which reads the file with
+    iterparse, so only the current page is held in memory.
+
+    - Redirects and pages outside namespaces are skipped.
+    - With template_name, only pages whose text uses {{template_name}} directly are yielded.
+      Unlike embeddedin(), templates transcluded through another template are not seen.
+    """
+    from pywikibot import xmlreader
+
+    wanted_ns = {str(ns) for ns in namespaces}
+    name_re = get_template_name_re(template_name) if template_name else None
+
+    for entry in xmlreader.XmlDump(dump_file, revisions="latest").parse():
+        if entry.isredirect or str(entry.ns) not in wanted_ns:
+            continue
+
+        text = entry.text or ""
+        if name_re is not None and not name_re.search(text):
+            continue
+
+        yield DumpPage(
+            entry.title,
+            text,
+            ns=str(entry.ns),
+            revision_id=entry.revisionid or "",
+            timestamp=entry.timestamp or "",
+        )